@@ -0,0 +1,1241 @@
+"""
+@brief 机械臂算法接口
+
+@details
+提供Algo类，包含正逆解、位姿转换、坐标系计算等不依赖机械臂连接的算法接口。
+此模块只依赖rm_ctypes_wrap，不导入RoboticArm及事件、通信相关模块，适合只做离线规划、按任务启动的工作进程：
+
+    from Robotic_Arm.algo import Algo, rm_robot_arm_model_e, rm_force_type_e
+
+    algo = Algo(rm_robot_arm_model_e.RM_MODEL_RM_65_E, rm_force_type_e.RM_MODEL_RM_B_E)
+
+**注意**
+- rm_robot_interface中的Algo即为本模块的Algo，RoboticArm继承该类，两种导入方式可混用。
+- 算法库数据为进程级全局数据，连接机械臂时会被控制器的DH参数覆盖。
+"""
+
+from .rm_ctypes_wrap import *
+import ctypes
+
+# from Robotic_Arm.algo import *时导出的名称：Algo、所需的枚举与结构体及rm_algo_*系列C接口
+__all__ = ['Algo', 'rm_robot_arm_model_e', 'rm_force_type_e', 'rm_dofType_e', 'rm_jointType_e', 'rm_limitType_e',
+           'rm_pose_t', 'rm_position_t', 'rm_quat_t', 'rm_euler_t', 'rm_frame_t', 'rm_matrix_t', 'rm_Mat_t', 'rm_dh_t',
+           'rm_inverse_kinematics_params_t', 'rm_inverse_kinematics_all_solve_t', 'rm_tool_sphere_t']
+__all__ += sorted(name for name in dir() if name.startswith('rm_algo_'))
+
+
+class Algo:
+    """
+    算法接口
+    @details 针对睿尔曼机械臂，提供正逆解、各种位姿参数转换等工具接口。既可通过RoboticArm类连接机械臂使用该类中的成员函数，也可单独使用该类
+    """
+
+    def __init__(self, arm_model: rm_robot_arm_model_e, force_type: rm_force_type_e, arm_dof: int = -1, dh: rm_dh_t = None):
+        """初始化算法依赖
+
+        Args:
+            arm_model (rm_robot_arm_model_e): 机械臂型号
+            force_type (rm_force_type_e): 传感器类型
+            arm_dof (int, optional): 机械臂自由度，设置机械臂型号为通用型（RM_MODEL_UNIVERSAL_E）时需设置机械臂自由度. Defaults to -1.
+            dh (rm_dh_t, optional): 根据给定的DH参数判断机械臂类型，设置为None时根据arm_model判断机械臂类型. Defaults to None.
+        """
+        self.handle = rm_robot_handle()
+        if(dh is not None):
+            arm_model = rm_robot_arm_model_e.RM_MODEL_UNIVERSAL_E
+            rm_algo_init_sys_data_by_dh(force_type, dh, arm_dof)
+        else:
+            rm_algo_init_sys_data(arm_model, force_type)
+
+        ARM_7DOF_MODELS = {
+            rm_robot_arm_model_e.RM_MODEL_RM_75_E,
+            rm_robot_arm_model_e.RM_MODEL_GEN_72_E,
+            rm_robot_arm_model_e.RM_MODEL_ZM7L_E,
+            rm_robot_arm_model_e.RM_MODEL_ZM7R_E,
+            rm_robot_arm_model_e.RM_MODEL_RXL75_E,
+            rm_robot_arm_model_e.RM_MODEL_RXR75_E,
+            rm_robot_arm_model_e.RM_MODEL_ZPFL74_E,
+            rm_robot_arm_model_e.RM_MODEL_ZPFR74_E, 
+            rm_robot_arm_model_e.RM_MODEL_RXL75II_E,   
+            rm_robot_arm_model_e.RM_MODEL_RXR75II_E,    
+
+        }
+        if arm_model == rm_robot_arm_model_e.RM_MODEL_UNIVERSAL_E:
+            if arm_dof == -1:
+                raise Exception("arm_dof is not set")
+            else:
+                rm_algo_set_robot_dof(arm_dof)
+                self.arm_dof = arm_dof
+        elif arm_model in ARM_7DOF_MODELS:
+            self.arm_dof = 7
+        else:
+            self.arm_dof = 6
+
+        if(arm_model == rm_robot_arm_model_e.RM_MODEL_ZM7L_E or arm_model == rm_robot_arm_model_e.RM_MODEL_ZM7R_E or 
+           arm_model == rm_robot_arm_model_e.RM_MODEL_RXL75_E or arm_model == rm_robot_arm_model_e.RM_MODEL_RXR75_E or
+           arm_model == rm_robot_arm_model_e.RM_MODEL_ZPFL74_E or arm_model == rm_robot_arm_model_e.RM_MODEL_ZPFR74_E or
+           arm_model == rm_robot_arm_model_e.RM_MODEL_RXL75II_E or arm_model == rm_robot_arm_model_e.RM_MODEL_RXR75II_E):
+            self.dh_dof = 8
+        else:
+            self.dh_dof = self.arm_dof
+
+    # 逆解结果缓存，由rm_algo_enable_ik_cache启用
+    _ik_cache = None
+
+    def _algo_handle_address(self) -> int:
+        # 独立使用Algo时句柄为rm_robot_handle结构体，通过RoboticArm使用时为rm_create_robot_arm返回的指针
+        if isinstance(self.handle, rm_robot_handle):
+            return ctypes.addressof(self.handle)
+        return ctypes.cast(self.handle, c_void_p).value
+
+    def _ik_cache_context(self) -> bytes:
+        # 算法库中的坐标系、DH参数及安装角度为进程级全局数据，可能被其他Algo对象修改，每次查询时读取
+        toolframe = rm_frame_t()
+        workframe = rm_frame_t()
+        rm_algo_get_curr_toolframe(byref(toolframe))
+        rm_algo_get_curr_workframe(byref(workframe))
+        x = c_float()
+        y = c_float()
+        z = c_float()
+        rm_algo_get_angle(x, y, z)
+        return bytes(toolframe) + bytes(workframe) + bytes(rm_algo_get_dh()) + bytes(x) + bytes(y) + bytes(z)
+
+    def rm_algo_enable_ik_cache(self, maxsize: int = 1024, position_resolution: float = 1e-4,
+                                orientation_resolution: float = 1e-3, joint_resolution: float = 1.0) -> None:
+        """
+        启用逆解结果缓存
+
+        Args:
+            maxsize (int, optional): 最多保存的结果数，超出后淘汰最久未使用的结果. Defaults to 1024.
+            position_resolution (float, optional): 目标位置量化分辨率，单位：m. Defaults to 1e-4.
+            orientation_resolution (float, optional): 目标姿态量化分辨率，欧拉角单位：rad. Defaults to 1e-3.
+            joint_resolution (float, optional): 上一时刻关节角度的区间宽度，单位：°. Defaults to 1.0.
+
+        Notes:
+            - 缓存作用于rm_algo_inverse_kinematics、rm_algo_inverse_kinematics_all及rm_algo_ik_remote，仅缓存求解成功的结果
+            - 缓存键包含当前工具坐标系、工作坐标系、DH参数及安装角度，其变化后不会命中旧结果
+            - 修改关节限位、逆解求解模式或遥操作参数后，请调用rm_algo_ik_cache_clear清空缓存
+            - 每次查询约需十余微秒，适用于七自由度等数值迭代求解的机械臂，六自由度解析逆解本身耗时与之相当
+        """
+        from .rm_algo_cache import IKSolutionCache
+
+        self._ik_cache = IKSolutionCache(maxsize, position_resolution, orientation_resolution, joint_resolution)
+
+    def rm_algo_disable_ik_cache(self) -> None:
+        """关闭逆解结果缓存并释放已缓存的结果"""
+        self._ik_cache = None
+
+    def rm_algo_ik_cache_clear(self) -> None:
+        """清空逆解结果缓存及命中统计"""
+        if self._ik_cache is not None:
+            self._ik_cache.clear()
+
+    def rm_algo_ik_cache_info(self) -> dict[str, int]:
+        """
+        获取逆解结果缓存统计
+
+        Returns:
+            dict[str, int]: 包含以下键的字典，未启用缓存时各项均为0
+                - 'hits' (int): 命中次数
+                - 'misses' (int): 未命中次数
+                - 'size' (int): 当前保存的结果数
+                - 'maxsize' (int): 最多保存的结果数
+        """
+        if self._ik_cache is None:
+            return {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 0}
+        return self._ik_cache.info()
+
+    def rm_algo_version(self) -> str:
+        """获取算法库版本
+
+        Returns:
+            str: 算法库版本号
+        """
+        return rm_algo_version()
+
+    def rm_algo_set_angle(self, x: float, y: float, z: float) -> None:
+        """设置安装角度
+
+        Args:
+            x (float): X轴安装角度 单位°
+            y (float): Y轴安装角度 单位°
+            z (float): z轴安装角度 单位°
+        """
+        rm_algo_set_angle(x, y, z)
+
+    def rm_algo_get_angle(self) -> tuple[float, float, float]:
+        """获取安装角度
+
+        Returns:
+            tuple[float,float,float]: 包含三个浮点数的元组，分别代表x、y和z轴的安装角度，单位：°
+        """
+        x = c_float()
+        y = c_float()
+        z = c_float()
+        rm_algo_get_angle(x, y, z)
+
+        return x.value, y.value, z.value
+
+    def rm_algo_set_redundant_parameter_traversal_mode(self, mode: bool) -> None:
+        """
+        设置逆解求解模式
+
+        Args:
+            mode (bool): 
+                - true：遍历模式，冗余参数遍历的求解策略。适于当前位姿跟要求解的位姿差别特别大的应用场景，如MOVJ_P、位姿编辑等，耗时较长
+                - false：单步模式，自动调整冗余参数的求解策略。适于当前位姿跟要求解的位姿差别特别小、连续周期控制的场景，如笛卡尔空间规划的位姿求解等，耗时短
+
+        """
+        rm_algo_set_redundant_parameter_traversal_mode(mode)
+
+    def rm_algo_set_workframe(self, frame: rm_frame_t) -> None:
+        """
+        设置工作坐标系
+
+        Args:
+            frame (rm_frame_t): 坐标系数据
+        """
+        rm_algo_set_workframe(frame)
+
+    def rm_algo_get_curr_workframe(self) -> dict[str, any]:
+        """
+        获取当前工作坐标系
+
+        Returns:
+            dict[str, any]: 返回当前工作坐标系字典，键为rm_frame_t结构体的字段名称
+        """
+        frame = rm_frame_t()
+        rm_algo_get_curr_workframe(byref(frame))
+        return frame.to_dictionary()
+
+    def rm_algo_set_toolframe(self, frame: rm_frame_t) -> None:
+        """
+        设置工具坐标系
+
+        Args:
+            frame (rm_frame_t): 坐标系数据
+        """
+
+        rm_algo_set_toolframe(frame)
+
+    def rm_algo_get_curr_toolframe(self) -> dict[str, any]:
+        """
+        获取算法当前工具坐标系
+
+        Returns:
+            dict[str, any]: 返回当前工具坐标系字典，键为rm_frame_t结构体的字段名称
+        """
+        frame = rm_frame_t()
+        rm_algo_get_curr_toolframe(byref(frame))
+        return frame.to_dictionary()
+
+    def rm_algo_set_joint_max_limit(self, joint_limit: list[float]) -> None:
+        """
+        设置算法关节最大限位
+
+        Args:
+            joint_limit (list[float]): 关节最大限位数组，单位：°
+        """
+        if self.arm_dof != 0:
+            joint_positions = (c_float * self.arm_dof)(*joint_limit)
+        else:
+            joint_positions = (c_float * ARM_DOF)(*joint_limit)
+        rm_algo_set_joint_max_limit(joint_positions)
+
+    def rm_algo_get_joint_max_limit(self) -> list[float]:
+        """
+        获取算法关节最大限位
+
+        Returns:
+            list[float]: 关节最大限位数组，单位：°
+        """
+        if self.arm_dof != 0:
+            joint_positions = (c_float * self.arm_dof)()
+        else:
+            joint_positions = (c_float * ARM_DOF)()
+        rm_algo_get_joint_max_limit(joint_positions)
+        return list(joint_positions)
+
+    def rm_algo_set_joint_min_limit(self, joint_limit: list[float]) -> None:
+        """
+        设置算法关节最小限位
+
+        Args:
+            joint_limit (list[float]): 关节最小限位数组，单位：°
+        """
+        if self.arm_dof != 0:
+            joint_positions = (c_float * self.arm_dof)(*joint_limit)
+        else:
+            joint_positions = (c_float * ARM_DOF)(*joint_limit)
+        rm_algo_set_joint_min_limit(joint_positions)
+
+    def rm_algo_get_joint_min_limit(self) -> list[float]:
+        """
+        获取算法关节最小限位
+
+        Returns:
+            list[float]: 关节最小限位数组，单位：°
+        """
+        if self.arm_dof != 0:
+            joint_positions = (c_float * self.arm_dof)()
+        else:
+            joint_positions = (c_float * ARM_DOF)()
+        rm_algo_get_joint_min_limit(joint_positions)
+        return list(joint_positions)
+
+    def rm_algo_set_joint_max_speed(self, joint_limit: list[float]) -> None:
+        """
+        设置算法关节最大速度
+
+        Args:
+            joint_limit (list[float]): 关节最大速度，单位：RPM
+        """
+        if self.arm_dof != 0:
+            speed = (c_float * self.arm_dof)(*joint_limit)
+        else:
+            speed = (c_float * ARM_DOF)(*joint_limit)
+        rm_algo_set_joint_max_speed(speed)
+
+    def rm_algo_get_joint_max_speed(self) -> list[float]:
+        """
+        获取算法关节最大速度
+
+        Returns:
+            list[float]: 关节最大速度，单位：RPM
+        """
+        if self.arm_dof != 0:
+            speed = (c_float * self.arm_dof)()
+        else:
+            speed = (c_float * ARM_DOF)()
+        rm_algo_get_joint_max_speed(speed)
+        return list(speed)
+
+    def rm_algo_set_joint_max_acc(self, joint_limit: list[float]) -> None:
+        """
+        设置算法关节最大加速度
+
+        Args:
+            joint_limit (list[float]): 关节最大加速度，单位：RPM/s
+        """
+        if self.arm_dof != 0:
+            acc = (c_float * self.arm_dof)(*joint_limit)
+        else:
+            acc = (c_float * ARM_DOF)(*joint_limit)
+        rm_algo_set_joint_max_acc(acc)
+
+    def rm_algo_get_joint_max_acc(self) -> list[float]:
+        """
+        获取算法关节最大加速度
+
+        Returns:
+            list[float]: 关节最大加速度，单位：RPM/s
+        """
+        if self.arm_dof != 0:
+            acc = (c_float * self.arm_dof)()
+        else:
+            acc = (c_float * ARM_DOF)()
+        rm_algo_get_joint_max_acc(acc)
+        return list(acc)
+
+    def rm_algo_inverse_kinematics(self, params: rm_inverse_kinematics_params_t) -> tuple[int, list[float]]:
+        """
+        逆解函数
+
+        Args:
+            params (rm_inverse_kinematics_params_t): 逆解输入参数结构体
+
+        Returns:
+            tuple[int,list[float]]: 包含两个元素的元组。
+                -int 逆解结果
+                    - 0: 逆解成功
+                    - 1: 逆解失败
+                    - -1: 上一时刻关节角度输入为空
+                    - -2: 目标位姿四元数不合法
+                -list[float] 输出的关节角度 单位°，长度为机械臂自由度
+        """
+        cache = self._ik_cache
+        if cache is not None:
+            key = ('ik', self._ik_cache_context(), cache.pose_key(params.q_pose, params.flag),
+                   cache.joint_key(params.q_in[:self.arm_dof]))
+            cached = cache.get(key)
+            if cached is not None:
+                return 0, list(cached)
+
+        q_out = (c_float * ARM_DOF)()
+
+        ret = rm_algo_inverse_kinematics(self.handle, params, q_out)
+        out = list(q_out)
+        if cache is not None and ret == 0:
+            cache.put(key, tuple(out[:self.arm_dof]))
+        return ret, out[:self.arm_dof]
+
+    def rm_algo_inverse_kinematics_batch(self, poses, q_seed):
+        """
+        批量逆解函数
+
+        依次求解一条笛卡尔路径上的全部位姿，每个点以上一个成功点的解作为上一时刻关节角度（q_in），
+        循环中复用同一个参数结构体，不为每个点创建rm_inverse_kinematics_params_t、rm_pose_t等对象
+
+        Args:
+            poses (np.ndarray): 目标位姿数组，形状为(N, 6)时每行为[x,y,z,rx,ry,rz]，形状为(N, 7)时每行为[x,y,z,w,x,y,z]
+            q_seed (list[float] | np.ndarray): 上一时刻关节角度，单位°
+                - 长度为自由度的一维数组：作为第一个点的q_in，后续点依次以上一个成功点的解作为q_in
+                - 形状为(N, 自由度)的二维数组：每个点使用对应行作为q_in，各点独立求解，适用于互不相关的候选位姿
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: 包含两个元素的元组。
+                - np.ndarray: 形状为(N, 自由度)的float64关节角度数组，单位°，求解失败的行为NaN
+                - np.ndarray: 形状为(N,)的逆解结果数组，取值同rm_algo_inverse_kinematics
+                    - 0: 逆解成功
+                    - 1: 逆解失败
+                    - -1: 上一时刻关节角度输入为空
+                    - -2: 目标位姿四元数不合法
+        """
+        import numpy as np
+
+        poses = np.asarray(poses, dtype=np.float32)
+        if poses.ndim != 2 or poses.shape[1] not in (6, 7):
+            raise ValueError("poses must have shape (N, 6) or (N, 7)")
+        count = poses.shape[0]
+        dof = self.arm_dof if self.arm_dof != 0 else ARM_DOF
+
+        # 预先按rm_pose_t内存布局（position、quaternion、euler）排列全部目标位姿
+        pose_rows = np.zeros((count, sizeof(rm_pose_t) // sizeof(c_float)), dtype=np.float32)
+        pose_rows[:, :3] = poses[:, :3]
+        if poses.shape[1] == 7:
+            pose_rows[:, 3:7] = poses[:, 3:]
+        else:
+            pose_rows[:, 7:10] = poses[:, 3:]
+
+        seeds = np.zeros((count, ARM_DOF) if np.ndim(q_seed) == 2 else (1, ARM_DOF), dtype=np.float32)
+        seeds[:, :np.shape(q_seed)[-1]] = q_seed
+        chain = np.ndim(q_seed) != 2
+        params = rm_inverse_kinematics_params_t(list(seeds[0]), [0.0] * poses.shape[1], 0 if poses.shape[1] == 7 else 1)
+        q_out = np.zeros((count, ARM_DOF), dtype=np.float32)
+        status = np.empty(count, dtype=np.int32)
+
+        handle = self._algo_handle_address()
+        params_addr = ctypes.addressof(params)
+        pose_offset, pose_size = rm_inverse_kinematics_params_t.q_pose.offset, sizeof(rm_pose_t)
+        pose_addr, out_addr = pose_rows.ctypes.data, q_out.ctypes.data
+        out_stride, seed_size = q_out.strides[0], dof * sizeof(c_float)
+        seed_addr, seed_stride = seeds.ctypes.data, seeds.strides[0]
+        inverse_kinematics = rm_algo_inverse_kinematics_addr
+        memmove = ctypes.memmove
+        for i in range(count):
+            memmove(params_addr + pose_offset, pose_addr + i * pose_size, pose_size)
+            if not chain:
+                memmove(params_addr, seed_addr + i * seed_stride, seed_size)
+            ret = inverse_kinematics(handle, params, out_addr + i * out_stride)
+            status[i] = ret
+            if chain and ret == 0:
+                # 以本点的解作为下一点的上一时刻关节角度
+                memmove(params_addr, out_addr + i * out_stride, seed_size)
+
+        q_solve = q_out[:, :dof].astype(np.float64)
+        q_solve[status != 0] = np.nan
+        return q_solve, status
+
+    def rm_algo_inverse_kinematics_all(self, params:rm_inverse_kinematics_params_t) -> rm_inverse_kinematics_all_solve_t:
+        """
+        计算逆运动学全解(当前仅支持六自由度机器人)
+        Args:
+            params(rm_inverse_kinematics_params_t) 逆解输入参数结构体
+        Returns:
+            rm_inverse_kinematics_all_solve_t 逆解的全解结构体
+        """
+        cache = self._ik_cache
+        if cache is not None:
+            key = ('ik_all', self._ik_cache_context(), cache.pose_key(params.q_pose, params.flag),
+                   cache.joint_key(params.q_in[:self.arm_dof]))
+            cached = cache.get(key)
+            if cached is not None:
+                return rm_inverse_kinematics_all_solve_t.from_buffer_copy(cached)
+
+        ret = rm_inverse_kinematics_all_solve_t()
+        ret = rm_algo_inverse_kinematics_all(self.handle, params)
+        if cache is not None and ret.result == 0:
+            cache.put(key, bytes(ret))
+        return ret
+
+
+    def rm_algo_ikine_select_ik_solve(self, weight:list[float], params:rm_inverse_kinematics_all_solve_t) -> int:
+        """
+        从多解中选取最优解(当前仅支持六自由度机器人)
+        Args:
+            weight(list[float]) 权重,建议默认值为{1,1,1,1,1,1}
+            params(rm_inverse_kinematics_all_solve_t) 待选解的全解结构体
+        Returns:
+            int 最优解索引，选解结果为ik_solve.q_solve[i] -1：当前机器人非六自由度，当前仅支持六自由度机器人
+        """
+        weight_c = (c_float * 6)(*weight)
+        ret = rm_algo_ikine_select_ik_solve(weight_c, params)
+        return ret
+
+
+    def rm_algo_ikine_check_joint_position_limit(self, q_solve_i:list[float]) -> int:
+        """
+        检查逆解结果是否超出关节限位(当前仅支持六自由度机器人)
+        Args:
+            q_solve_i (list[float]) 一组解，即一组关节角度，单位:°
+        Returns:
+            0:表示未超限 i:表示关节i超限，优先报序号小的关节 -1：当前机器人非六自由度，当前仅支持六自由度机器人
+        """
+        ret = rm_algo_ikine_check_joint_position_limit(q_solve_i)
+        return ret
+
+
+    def rm_algo_ikine_check_joint_velocity_limit(self, dt:float, q_ref:list[float], q_solve_i:list[float]) -> int:
+        """
+        检查逆解结果是否超出速度限位(当前仅支持六自由度机器人)
+        Args:
+            dt 两帧数据之间的时间间隔，即控制周期，单位sec
+            q_ref(list[float]) 参考关节角度或者第一帧数据角度，单位：°
+            q_solve_i (list[float]) 一组解，即一组关节角度，单位:°
+        Returns:
+            int 0:表示未超限 i:表示关节i超限，优先报序号小的关节 -1：当前机器人非六自由度，当前仅支持六自由度机器人
+        """
+        q_ref_c = (c_float * 8)(*q_ref)
+        q_solve_c = (c_float * 8)(*q_solve_i)
+        
+        ret = rm_algo_ikine_check_joint_velocity_limit(dt, q_ref_c, q_solve_c)
+        return ret
+    
+    def rm_algo_calculate_arm_angle_from_config_rm75(self,q_ref:list[float]) -> tuple[int, float]:
+        """
+        根据参考位形计算臂角大小（仅支持RM75）
+        Args:
+            q_ref(list[float]),当前参考位形的关节角度，单位°
+        Returns:
+            int: - 0: 求解成功 - -1: 求解失败，或机型非RM75  - -2: q_ref 输入参数非法
+            float: 计算结果，当前参考位形对应的臂角大小，单位°
+        """
+        q_ref_c = (c_float * ARM_DOF)(*q_ref)
+        arm_angle = c_float()
+        ret = rm_algo_calculate_arm_angle_from_config_rm75(q_ref_c, byref(arm_angle))
+        return ret,arm_angle.value
+
+    def rm_algo_inverse_kinematics_rm75_for_arm_angle(self,params:rm_inverse_kinematics_params_t,arm_angle:float) -> tuple[int,list[float]]:
+        """
+        臂角法求解RM75逆运动学
+        Args:
+            params:rm_inverse_kinematics_params_t,逆解参数结构体
+            arm_angle:float,指定轴角大小,单位:°
+        Returns:
+            int 0: 求解成功
+               -1: 求解失败
+               -2: 求解结果超出限位
+               -3: 机型非RM75
+            list[float]: q_solve，求解结果,单位:°
+        """
+        q_solve = (c_float * ARM_DOF)()
+        ret = rm_algo_inverse_kinematics_rm75_for_arm_angle(params,arm_angle,q_solve)
+        out = list(q_solve)
+        return ret, out[:self.arm_dof]
+
+
+    def rm_algo_forward_kinematics(self, joint: list[float], flag: int = 1) -> list[float]:
+        """
+        正解算法接口
+
+        Args:
+            joint (list[float]): 关节角度，单位：°
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
+
+        Returns:
+            list[float]: 解得目标位姿列表
+        """
+        if self.arm_dof != 0:
+            joint = (c_float * self.arm_dof)(*joint)
+        else:
+            joint = (c_float * ARM_DOF)(*joint)
+        pose = rm_algo_forward_kinematics(self.handle, joint)
+        position = pose.position
+        euler = pose.euler
+        qua = pose.quaternion
+        pose_eul = [position.x, position.y,
+                    position.z, euler.rx, euler.ry, euler.rz]
+        pose_qua = [position.x, position.y,
+                    position.z, qua.w, qua.x, qua.y, qua.z]
+        return pose_eul if flag else pose_qua
+        # 保留三位小数
+        # return [round(value, 3) for value in pose_eul] if flag else [round(value, 3) for value in pose_qua]
+
+    def rm_algo_forward_kinematics_batch(self, joints, flag: int = 1):
+        """
+        批量正解算法接口
+
+        对N组关节角度逐一调用正解，输入输出均为连续NumPy数组，循环中不创建Python列表及ctypes参数对象
+
+        Args:
+            joints (np.ndarray): 关节角度数组，形状为(N, 自由度)，单位：°
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿数组，每行为[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿数组，每行为[x,y,z,rx,ry,rz]
+
+        Returns:
+            np.ndarray: 形状为(N, 6)或(N, 7)的float64位姿数组
+        """
+        import numpy as np
+
+        dof = self.arm_dof if self.arm_dof != 0 else ARM_DOF
+        joints = np.ascontiguousarray(joints, dtype=np.float32)
+        if joints.ndim != 2 or joints.shape[1] != dof:
+            raise ValueError(f"joints must have shape (N, {dof})")
+
+        # 每行依次存放rm_pose_t的position、quaternion、euler共10个float
+        pose_size = sizeof(rm_pose_t)
+        poses = np.empty((joints.shape[0], pose_size // sizeof(c_float)), dtype=np.float32)
+        handle = self._algo_handle_address()
+        joint_addr, joint_stride = joints.ctypes.data, joints.strides[0]
+        pose_addr = poses.ctypes.data
+        forward_kinematics = rm_algo_forward_kinematics_addr
+        memmove, addressof = ctypes.memmove, ctypes.addressof
+        for i in range(joints.shape[0]):
+            pose = forward_kinematics(handle, joint_addr + i * joint_stride)
+            memmove(pose_addr + i * pose_size, addressof(pose), pose_size)
+
+        columns = [0, 1, 2, 7, 8, 9] if flag else [0, 1, 2, 3, 4, 5, 6]
+        return poses[:, columns].astype(np.float64)
+
+    def rm_algo_euler2quaternion(self, eul: list[float]) -> list[float]:
+        """
+        欧拉角转四元数
+
+        Args:
+            eul (list[float]): 欧拉角列表[rx.ry,rz]，单位：rad
+
+        Returns:
+            list[float]: 四元数列表[w,x,y,z]
+        """
+        eul = rm_euler_t(*eul)
+        quat = rm_algo_euler2quaternion(eul)
+        return [quat.w, quat.x, quat.y, quat.z]
+
+    def rm_algo_quaternion2euler(self, quat: list[float]) -> list[float]:
+        """
+        四元数转欧拉角
+
+        Args:
+            quat (list[float]): 四元数列表[w,x,y,z]
+
+        Returns:
+            list[float]: 欧拉角列表[rx.ry,rz]，单位：rad
+        """
+        quat = rm_quat_t(*quat)
+        eul = rm_algo_quaternion2euler(quat)
+        return [eul.rx, eul.ry, eul.rz]
+
+    def rm_algo_euler2matrix(self, eu: list[float]) -> rm_matrix_t:
+        """
+        欧拉角转旋转矩阵
+
+        Args:
+            eu (list[float]): 欧拉角列表[rx.ry,rz]，单位：rad
+
+        Returns:
+            rm_matrix_t: 旋转矩阵
+        """
+        eu = rm_euler_t(*eu)
+        matrix = rm_algo_euler2matrix(eu)
+        return matrix
+
+    def rm_algo_pos2matrix(self, pose: list[float]) -> rm_matrix_t:
+        """
+        位姿转旋转矩阵
+
+        Args:
+            pose (list[float]): 位置姿态列表[x,y,z,rx,ry,rz]
+
+        Returns:
+            rm_matrix_t: 旋转矩阵
+        """
+        po1 = rm_pose_t()
+        po1.position = rm_position_t(*pose[:3])
+        po1.euler = rm_euler_t(*pose[3:])
+        matrix = rm_algo_pos2matrix(po1)
+        return matrix
+
+    def rm_algo_matrix2pos(self, matrix: rm_matrix_t, flag: int = 1) -> list[float]:
+        """
+        旋转矩阵转位姿
+
+        Args:
+            matrix (rm_matrix_t): 旋转矩阵
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
+
+        Returns:
+            list[float]: 解得目标位姿
+        """
+        pose = rm_algo_matrix2pos(matrix)
+        position = pose.position
+        euler = pose.euler
+        qua = pose.quaternion
+        pose_eul = [position.x, position.y,
+                    position.z, euler.rx, euler.ry, euler.rz]
+        pose_qua = [position.x, position.y,
+                    position.z, qua.w, qua.x, qua.y, qua.z]
+        return pose_eul if flag else pose_qua
+        # return pose.to_dict()
+
+    def rm_algo_euler2quaternion_batch(self, euler):
+        """
+        批量欧拉角转四元数，NumPy向量化实现，不调用C库，结果与rm_algo_euler2quaternion一致
+
+        Args:
+            euler (np.ndarray): 形状为(N, 3)的欧拉角数组[rx,ry,rz]，单位：rad
+
+        Returns:
+            np.ndarray: 形状为(N, 4)的四元数数组[w,x,y,z]
+        """
+        from .rm_algo_numpy import euler2quaternion
+
+        return euler2quaternion(euler)
+
+    def rm_algo_quaternion2euler_batch(self, quat):
+        """
+        批量四元数转欧拉角，NumPy向量化实现，不调用C库，结果与rm_algo_quaternion2euler一致
+
+        Args:
+            quat (np.ndarray): 形状为(N, 4)的四元数数组[w,x,y,z]
+
+        Returns:
+            np.ndarray: 形状为(N, 3)的欧拉角数组[rx,ry,rz]，单位：rad
+        """
+        from .rm_algo_numpy import quaternion2euler
+
+        return quaternion2euler(quat)
+
+    def rm_algo_euler2matrix_batch(self, euler):
+        """
+        批量欧拉角转旋转矩阵，NumPy向量化实现，不调用C库，结果与rm_algo_euler2matrix一致
+
+        Args:
+            euler (np.ndarray): 形状为(N, 3)的欧拉角数组[rx,ry,rz]，单位：rad
+
+        Returns:
+            np.ndarray: 形状为(N, 4, 4)的矩阵数组，左上3x3为旋转矩阵，其余元素为0
+        """
+        from .rm_algo_numpy import euler2matrix
+
+        return euler2matrix(euler)
+
+    def rm_algo_pos2matrix_batch(self, pose):
+        """
+        批量位姿转齐次变换矩阵，NumPy向量化实现，不调用C库，结果与rm_algo_pos2matrix一致
+
+        Args:
+            pose (np.ndarray): 形状为(N, 6)的位姿数组[x,y,z,rx,ry,rz]
+
+        Returns:
+            np.ndarray: 形状为(N, 4, 4)的齐次变换矩阵数组
+        """
+        from .rm_algo_numpy import pos2matrix
+
+        return pos2matrix(pose)
+
+    def rm_algo_matrix2pos_batch(self, matrix, flag: int = 1):
+        """
+        批量齐次变换矩阵转位姿，NumPy向量化实现，不调用C库，结果与rm_algo_matrix2pos一致
+
+        Args:
+            matrix (np.ndarray): 形状为(N, 4, 4)的齐次变换矩阵数组
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿数组，每行为[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿数组，每行为[x,y,z,rx,ry,rz]
+
+        Returns:
+            np.ndarray: 形状为(N, 6)或(N, 7)的位姿数组
+        """
+        from .rm_algo_numpy import matrix2pos
+
+        return matrix2pos(matrix, flag)
+
+    def rm_algo_base2workframe(self, matrix: rm_matrix_t, pose_in_base: rm_pose_t, flag: int = 1) -> list[float]:
+        """
+        基坐标系转工作坐标系
+
+        Args:
+            matrix (rm_matrix_t): 工作坐标系在基坐标系下的矩阵
+            pose_in_base (rm_pose_t): 工具端坐标在基坐标系下位姿
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
+
+        Returns:
+            list[float]: 基坐标系在工作坐标系下的位姿
+        """
+        pose_in_work = rm_algo_matrix2pos(matrix, pose_in_base)
+        position = pose_in_work.position
+        euler = pose_in_work.euler
+        qua = pose_in_work.quaternion
+        pose_eul = [position.x, position.y,
+                    position.z, euler.rx, euler.ry, euler.rz]
+        pose_qua = [position.x, position.y,
+                    position.z, qua.w, qua.x, qua.y, qua.z]
+        return pose_eul if flag else pose_qua
+        # return pose_in_work.to_dict()
+
+    def rm_algo_workframe2base(self, matrix: rm_matrix_t, pose_in_work: rm_pose_t, flag: int = 1) -> list[float]:
+        """
+        工作坐标系转基坐标系
+
+        Args:
+            matrix (rm_matrix_t): 工具端坐标在工作坐标系下矩阵
+            pose_in_work (rm_pose_t): 工具端坐标在工作坐标系下位姿
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
+
+        Returns:
+            list[float]: 工作坐标系在基坐标系下的位姿
+        """
+        pose_in_base = rm_algo_workframe2base(matrix, pose_in_work)
+        position = pose_in_base.position
+        euler = pose_in_base.euler
+        qua = pose_in_base.quaternion
+        pose_eul = [position.x, position.y,
+                    position.z, euler.rx, euler.ry, euler.rz]
+        pose_qua = [position.x, position.y,
+                    position.z, qua.w, qua.x, qua.y, qua.z]
+        return pose_eul if flag else pose_qua
+        # return pose_in_base.to_dict()
+
+    def rm_algo_end2tool(self, eu_end: rm_pose_t, flag: int = 1) -> list[float]:
+        """
+        末端位姿转成工具位姿
+
+        Args:
+            eu_end (rm_pose_t): 基于世界坐标系和默认工具坐标系的末端位姿
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
+
+        Returns:
+            list[float]: 基于工作坐标系和工具坐标系的末端位姿
+        """
+        end_pose = rm_algo_end2tool(self.handle, eu_end)
+        position = end_pose.position
+        euler = end_pose.euler
+        qua = end_pose.quaternion
+        pose_eul = [position.x, position.y,
+                    position.z, euler.rx, euler.ry, euler.rz]
+        pose_qua = [position.x, position.y,
+                    position.z, qua.w, qua.x, qua.y, qua.z]
+        return pose_eul if flag else pose_qua
+        # return end_pose.to_dict()
+
+    def rm_algo_tool2end(self, eu_tool: rm_pose_t, flag: int = 1) -> list[float]:
+        """
+        工具位姿转末端位姿
+
+        Args:
+            eu_tool (rm_pose_t): 基于工作坐标系和工具坐标系的末端位姿
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
+
+        Returns:
+            list[float]: 基于世界坐标系和默认工具坐标系的末端位姿
+        """
+        end_pose = rm_algo_tool2end(self.handle, eu_tool)
+        position = end_pose.position
+        euler = end_pose.euler
+        qua = end_pose.quaternion
+        pose_eul = [position.x, position.y,
+                    position.z, euler.rx, euler.ry, euler.rz]
+        pose_qua = [position.x, position.y,
+                    position.z, qua.w, qua.x, qua.y, qua.z]
+        return pose_eul if flag else pose_qua
+        # return end_pose.to_dict()
+
+    def rm_algo_rotate_move(self, curr_joint: list[float], rotate_axis: int, rotate_angle: float, choose_axis: rm_pose_t, flag: int = 1) -> list[float]:
+        """
+        计算环绕运动位姿
+
+        Args:
+            curr_joint (list[float]): 当前关节角度 单位°
+            rotate_axis (int): 旋转轴: 1:x轴, 2:y轴, 3:z轴
+            rotate_angle (float): 旋转角度: 旋转角度, 单位(度)
+            choose_axis (rm_pose_t): 指定计算时使用的坐标系
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
+
+        Returns:
+            list[float]: 目标位姿
+        """
+        if self.arm_dof != 0:
+            curr_joint = (c_float * self.arm_dof)(*curr_joint)
+        else:
+            curr_joint = (c_float * ARM_DOF)(*curr_joint)
+        pose = rm_algo_rotate_move(
+            self.handle, curr_joint, rotate_axis, rotate_angle, choose_axis)
+        position = pose.position
+        euler = pose.euler
+        qua = pose.quaternion
+        pose_eul = [position.x, position.y,
+                    position.z, euler.rx, euler.ry, euler.rz]
+        pose_qua = [position.x, position.y,
+                    position.z, qua.w, qua.x, qua.y, qua.z]
+        return pose_eul if flag else pose_qua
+        # return pose.to_dict()
+
+    def rm_algo_cartesian_tool(self, curr_joint: list[float], move_lengthx: float, move_lengthy: float, move_lengthz: float, flag: int = 1) -> list[float]:
+        """
+        计算沿工具坐标系运动位姿
+
+        Args:
+            curr_joint (list[float]): 当前关节角度，单位：度
+            move_lengthx (float): 沿X轴移动长度，单位：米
+            move_lengthy (float): 沿Y轴移动长度，单位：米
+            move_lengthz (float): 沿Z轴移动长度，单位：米
+            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
+                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
+
+        Returns:
+            list[float]: 目标位姿
+        """
+        if self.arm_dof != 0:
+            curr_joint = (c_float * self.arm_dof)(*curr_joint)
+        else:
+            curr_joint = (c_float * ARM_DOF)(*curr_joint)
+        pose = rm_algo_cartesian_tool(
+            self.handle, curr_joint, move_lengthx, move_lengthy, move_lengthz)
+        position = pose.position
+        euler = pose.euler
+        qua = pose.quaternion
+        pose_eul = [position.x, position.y,
+                    position.z, euler.rx, euler.ry, euler.rz]
+        pose_qua = [position.x, position.y,
+                    position.z, qua.w, qua.x, qua.y, qua.z]
+        return pose_eul if flag else pose_qua
+        # return pose.to_dict()
+
+    def rm_algo_pose_move(self, poseCurrent: list[float], deltaPosAndRot: list[float], frameMode: int) -> list[float]:
+        """
+        计算Pos和Rot沿某坐标系有一定的位移和旋转角度后，所得到的位姿数据
+
+        Args:
+            poseCurrent (list[float]): 当前时刻位姿（欧拉角形式）
+            deltaPosAndRot (list[float]): 移动及旋转数组，位置移动（单位：m），旋转（单位：度）
+            frameMode (int): 坐标系模式选择 0:Work（work即可任意设置坐标系），1:Tool
+
+        Returns:
+            list[float]: 平移旋转后的位姿
+        """
+        po1 = rm_pose_t()
+        po1.position = rm_position_t(*poseCurrent[:3])
+        po1.euler = rm_euler_t(*poseCurrent[3:])
+
+        deltaPosAndRot = (c_float * 6)(*deltaPosAndRot)
+
+        pose = rm_algo_pose_move(
+            self.handle, po1, deltaPosAndRot, frameMode)
+        
+        position = pose.position
+        euler = pose.euler
+        pose_eul = [position.x, position.y,
+                    position.z, euler.rx, euler.ry, euler.rz]
+        return pose_eul
+
+    def rm_algo_set_dh(self, dh: rm_dh_t) -> None:
+        """
+        设置DH参数
+        Args:
+            dh (rm_dh_t): DH参数列表
+        """
+        rm_algo_set_dh(dh)
+
+    def rm_algo_get_dh(self) -> rm_dh_t:
+        """
+        获取DH参数
+        Returns:
+            list[float]: DH参数列表
+        """
+        dh = rm_algo_get_dh()
+        return dh.to_dict(self.dh_dof)
+
+    def rm_algo_universal_singularity_analyse(self, q:list[float], singluar_value_limit:float) -> int:
+        """
+        通过分析雅可比矩阵最小奇异值, 判断机器人是否处于奇异状态
+        Args:
+            -q 要判断的关节角度（机械零位描述），单位：°
+            -singluar_value_limit 最小奇异值阈值，若传NULL，则使用内部默认值，默认值为0.01（该值在0-1之间）
+        Returns:
+            int 
+             0:在当前阈值条件下正常
+             -1:表示在当前阈值条件下判断为奇异区
+             -2:表示计算失败
+        """
+        q_c = (c_float * 7)(*q)
+        # singluar_value_limit_c = (c_float * 6)(*singluar_value_limit)
+        ret = rm_algo_universal_singularity_analyse(q_c, singluar_value_limit)
+        return ret
+
+    def rm_algo_kin_singularity_thresholds_init(self)-> None:
+        """
+        恢复初始阈值(仅适用于解析法分析机器人奇异状态),阈值初始化为：limit_qe=10deg,limit_qw=10deg,limit_d = 0.05m 
+        """
+        rm_algo_kin_singularity_thresholds_init()        
+
+    def rm_algo_kin_set_singularity_thresholds(self,limit_qe:float,limit_qw:float, limit_d:float)-> None:
+        """
+        设置自定义阈值(仅适用于解析法分析机器人奇异状态)
+        Args:
+            limit_qe  肘部奇异区域范围设置(即J3接近0的范围,若为RML63，则是J3接近-9.68的范围),单位: °,default: 10°
+            limit_qw  腕部奇异区域范围设置(即J5接近0的范围),单位: °,default: 10°
+            limit_d 肩部奇异区域范围设置(即腕部中心点距离奇异平面的距离), 单位: m, default: 0.05
+        Returns:
+            None
+        """
+        rm_algo_kin_set_singularity_thresholds(limit_qe,limit_qw,limit_d)
+
+
+
+    def rm_algo_kin_get_singularity_thresholds(self)-> tuple[float,float,float]:
+        """
+        获取自定义阈值(仅适用于解析法分析机器人奇异状态)
+        Args:
+            None
+        Returns:
+            limit_qe  肘部奇异区域范围设置(即J3接近0的范围,若为RML63，则是J3接近-9.68的范围),单位: °,default: 10°
+            limit_qw  腕部奇异区域范围设置(即J5接近0的范围),单位: °,default: 10°
+            limit_d 肩部奇异区域范围设置(即腕部中心点距离奇异平面的距离), 单位: m, default: 0.05
+        """
+        limit_qe = c_float()
+        limit_qw = c_float()
+        limit_d = c_float()
+        rm_algo_kin_get_singularity_thresholds(byref(limit_qe),byref(limit_qw),byref(limit_d))
+        return limit_qe.value,limit_qw.value,limit_d.value
+
+
+
+    def rm_algo_kin_robot_singularity_analyse(self,q:list[float]) -> tuple[int,float]:
+        """
+        解析法判断机器人是否处于奇异位形（仅支持六自由度）
+        Args:
+            q:list[float] 要判断的关节角度,单位°
+        Returns:
+            tuple[int,float]: 包含两个元素的元组。
+            - int: 0:正常 -1:肩部奇异 -2:肘部奇异 -3:腕部奇异
+            - float: 返回腕部中心点到肩部奇异平面的距离，该值越接近0说明越接近肩部奇异,单位m
+        """      
+        q_c = (c_float * 6)(*q)
+        distance_c = c_float()
+        ret = rm_algo_kin_robot_singularity_analyse(q_c, byref(distance_c))
+        return ret, distance_c.value
+
+  
+    def rm_algo_set_tool_envelope(self, toolSphere_i:int, data:rm_tool_sphere_t) -> None:
+        """
+        设置工具包络球参数
+        Args:
+            toolSphere_i 工具包络球编号 (0~4)
+            data 工具包络球参数,注意其参数在末端法兰坐标系下描述
+        """
+        rm_algo_set_tool_envelope(toolSphere_i, data)
+
+
+    def rm_algo_get_tool_envelope(self, toolSphere_i:int) -> rm_tool_sphere_t:
+        """
+        获取工具包络球参数
+        Args:
+            toolSphere_i 工具rm_get_tool_voltage包络球编号 (0~4)
+        Returns:
+            (rm_tool_sphere_t) 工具包络球参数,注意其参数在末端法兰坐标系下描述
+        """
+        tool_sphere_type = rm_tool_sphere_t()
+        rm_algo_get_tool_envelope(toolSphere_i, byref(tool_sphere_type))
+        return tool_sphere_type
+        
+
+    def rm_algo_safety_robot_self_collision_detection(self,joint_deg:list[float]) -> int:
+        """
+        自碰撞检测
+        Args:
+            joint_deg(list[float]) 要判断的关节角度，单位°
+        Returns:
+            int 
+             -0: 无碰撞
+             1: 发生碰撞,超出关节限位将被认为发生碰撞
+        """
+        joint_deg_c = (c_float * 7)(*joint_deg)
+        ret = rm_algo_safety_robot_self_collision_detection(joint_deg_c)
+        return ret
+    
+
+    def rm_algo_ik_remote_init(self, dT: float, tool_or_work: int) -> None:
+        """
+        初始化遥操作运动学结构体
+
+        Args:
+            dT (float): 用户下发周期设置
+            tool_or_work (int): 0: 相对工具坐标系 1: 相对工作坐标系
+
+        Returns:
+            None
+        """
+        # 类型转换确保参数符合C接口要求
+        dT_c = c_float(dT)
+        tool_or_work_c = c_int(tool_or_work)
+        rm_algo_ik_remote_init(dT_c, tool_or_work_c)
+
+    def rm_algo_set_error_weight(self, weight: list[float]) -> None:
+        """
+        设置位姿误差权重
+
+        Args:
+            weight (list[float]): 长度为6的数组，对应末端位姿x,y,z,rx,ry,rz的权重，取值0~1
+                                  权重越大对应的位姿到达精确度越高
+
+        Returns:
+            None
+        """
+        # 校验数组长度，不足补0，超出截断
+        if len(weight) != 6:
+            weight = weight[:6] + [0.0] * (6 - len(weight))
+        weight_c = (c_float * 6)(*weight)
+        rm_algo_set_error_weight(weight_c)
+
+    def rm_algo_set_dq_weight(self, dq_weight: list[float]) -> None:
+        """
+        设置关节速度权重
+
+        Args:
+            dq_weight (list[float]): 长度为自由度个数的数组，为关节最大限速乘以权重，取值0~1
+                                     权重越大则跟踪效果越好
+
+        Returns:
+            None
+        """
+        # 转换为ctypes浮点数组（兼容6/7自由度）
+        dq_weight_c = (c_float * len(dq_weight))(*dq_weight)
+        rm_algo_set_dq_weight(dq_weight_c)
+
+    def rm_algo_enable_q3_tracker(self, is_open: int) -> None:
+        """
+        使能七轴机械臂肘部追踪功能
+
+        Args:
+            is_open (int): 1: OPEN TARCKER 0: CLOSE TRACKER
+
+        Returns:
+            None
+        """
+        is_open_c = c_int(is_open)
+        rm_algo_enable_q3_tracker(is_open_c)
+
+    def rm_algo_set_q3_tracker_velocity_level(self, level: float) -> None:
+        """
+        设置七轴机械臂肘部追踪等级
+
+        Args:
+            level (float): 追踪等级，取值0~1，等级越高，追踪速度越快
+
+        Returns:
+            None
+        """
+        # 限制取值范围在0~1之间
+        level_clamped = max(0.0, min(1.0, level))
+        level_c = c_float(level_clamped)
+        rm_algo_set_q3_tracker_velocity_level(level_c)
+
+    def rm_algo_set_enable_limit_holdon(self, enable: int) -> None:
+        """
+        设置限位保持功能接口
+
+        Args:
+            enable (int): 0: 关闭限位保持  1: 开启限位保持 若客户不调用此接口则默认为0即关闭限位保持功能, 当调用ik_remote_init时自动初始化为0
+
+        Returns:
+            None
+        """
+        enable_c = c_int(enable)
+        rm_algo_set_enable_limit_holdon(enable_c)
+
+    def rm_algo_set_7dof_q3_track_angle(self, obj_angle: float) -> int:
+        """
+        设置七轴机械臂肘部追踪下的关节3的追踪角度
+
+        Args:
+            obj_angle (float): 关节3的目标追踪角度
+
+        Returns:
+            int:
+                -2: angle is over joint_limit（角度超出关节限位）
+                 0: success（成功）
+        """
+        obj_angle_c = c_float(obj_angle)
+        ret = rm_algo_set_7dof_q3_track_angle(obj_angle_c)
+        return ret
+
+    def rm_algo_set_joint_limit_angle(self, dof_type: rm_dofType_e, joint: rm_jointType_e, 
+                                      limit: rm_limitType_e, angle: float) -> int:
+        """
+        统一的关节角度限位设置接口（新增算法限位判断）
+
+        Args:
+            dof_type (rm_dofType_e): 机械臂自由度类型 (DOF_TYPE_6 或 DOF_TYPE_7)
+            joint (rm_jointType_e): 要设置的关节 (JOINT_Q3 或 JOINT_Q4；七轴支持设置关节3和关节4，六轴仅支持关节3)
+            limit (rm_limitType_e): 限位类型 (LIMIT_MAX 或 LIMIT_MIN)
+            angle (float): 要设置的角度值
+
+        Returns:
+            int: 错误码
+                -1: 无效的参数 (自由度、关节、限位类型错误或指针为空)
+                -2: 设置的角度值超出硬件/系统限制
+                -3: 输入角度超出算法固有关节限位
+                 0: 成功
+        """
+        # 转换枚举值为整型，兼容C接口
+        dof_type_c = c_int(dof_type.value)
+        joint_c = c_int(joint.value)
+        limit_c = c_int(limit.value)
+        angle_c = c_float(angle)
+        
+        ret = rm_algo_set_joint_limit_angle(dof_type_c, joint_c, limit_c, angle_c)
+        return ret
+
+    def rm_algo_ik_remote(self, T06d: rm_Mat_t, q_in: list[float], q_out: POINTER(c_float)) -> int:
+        """
+        ik remote 正式的逆解函数（强制传4个参数版本）
+        
+        @attention 1.建议客户在仿真模式下先验证自己下发的数据是否有异常后再开启真机使用
+                   2.机械臂肘关节限位防护：禁止关节4（7轴）/关节3（6轴）完全打直为0，否则边界奇异易引发机械臂震荡、回移困难等异常；需通过限位设置接口或示教器安全配置设置非0软限位（限位值可在仿真模式下调试确定）
+                   3.机械臂关节软限位防护：功能自带关节软限位效果，但应避免运动至软限位；若到位姿下发后关节仍需向限位外转动以满足位姿要求，易引发机械臂震荡等异常
+        Args:
+            T06d (rm_Mat_t): 目标末端位姿矩阵
+            q_in (list[float]): 当前关节角度列表（长度匹配自由度）
+            q_out (POINTER(c_float)): 提前初始化的ctypes浮点数组（输出参数，接收求解结果）
+
+        Returns:
+            int: 状态码
+                -4: UNKNOW ROBOT TYPE（未知机器人类型）
+                -1: IK FAILED（逆解失败）
+                -2: IK LIMITED（逆解超出限位）
+                0: IK SUCCESSFUL（逆解成功）
+        """
+            # 1. 转换q_in为ctypes数组（匹配C的float*）
+        q_in_len = len(q_in)
+        cache = self._ik_cache
+        if cache is not None:
+            key = ('ik_remote', self._ik_cache_context(), cache.matrix_key(T06d.data, T06d.row, T06d.col),
+                   cache.joint_key(q_in))
+            cached = cache.get(key)
+            if cached is not None:
+                for i, value in enumerate(cached):
+                    q_out[i] = value
+                return 0
+
+        q_in_c = (c_float * q_in_len)(*q_in)
+        
+        # 2. 调用底层C接口（严格匹配C的3个参数：T06d + q_in_c + q_out）
+        ret = rm_algo_ik_remote(T06d, q_in_c, q_out)  # q_out是外部传入的ctypes数组指针
+        if cache is not None and ret == 0:
+            cache.put(key, tuple(q_out[i] for i in range(q_in_len)))
+        return ret
@@ -0,0 +1,156 @@
+"""
+@brief 逆解结果缓存
+
+@details
+抓取、放置等场景会反复求解相同的接近、撤离位姿。此模块提供有界LRU缓存IKSolutionCache，
+以量化后的目标位姿、上一时刻关节角度所在区间及当前算法坐标系、DH参数作为键保存逆解结果，
+由Algo.rm_algo_enable_ik_cache启用后作用于rm_algo_inverse_kinematics、rm_algo_inverse_kinematics_all及rm_algo_ik_remote。
+
+**注意**
+- 量化意味着落在同一区间内的不同输入会得到同一个解，分辨率应小于应用可接受的位姿及关节误差。
+- 仅缓存求解成功的结果。
+"""
+
+import threading
+from collections import OrderedDict
+
+from .rm_ctypes_wrap import rm_pose_t
+
+
+class IKSolutionCache:
+    """
+    逆解结果LRU缓存
+
+    **Attributes**:
+        - maxsize (int): 最多保存的结果数，超出后淘汰最久未使用的结果
+        - position_resolution (float): 位置量化分辨率，单位：m
+        - orientation_resolution (float): 姿态量化分辨率，欧拉角单位：rad，四元数及旋转矩阵元素无单位
+        - joint_resolution (float): 上一时刻关节角度的区间宽度，单位：°
+        - hits (int): 命中次数
+        - misses (int): 未命中次数
+    """
+
+    def __init__(self, maxsize: int = 1024, position_resolution: float = 1e-4, orientation_resolution: float = 1e-3,
+                 joint_resolution: float = 1.0):
+        """
+        Args:
+            maxsize (int, optional): 最多保存的结果数. Defaults to 1024.
+            position_resolution (float, optional): 位置量化分辨率，单位：m. Defaults to 1e-4.
+            orientation_resolution (float, optional): 姿态量化分辨率. Defaults to 1e-3.
+            joint_resolution (float, optional): 上一时刻关节角度的区间宽度，单位：°. Defaults to 1.0.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.position_resolution = position_resolution
+        self.orientation_resolution = orientation_resolution
+        self.joint_resolution = joint_resolution
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+
+    def pose_key(self, pose: rm_pose_t, flag: int) -> tuple:
+        """
+        量化目标位姿
+
+        Args:
+            pose (rm_pose_t): 目标位姿
+            flag (int): 姿态参数类别：0-四元数；1-欧拉角
+
+        Returns:
+            tuple: 量化后的位姿
+        """
+        position = pose.position
+        if flag == 0:
+            quaternion = pose.quaternion
+            orientation = (quaternion.w, quaternion.x, quaternion.y, quaternion.z)
+        else:
+            euler = pose.euler
+            orientation = (euler.rx, euler.ry, euler.rz)
+        return (flag,
+                round(position.x / self.position_resolution),
+                round(position.y / self.position_resolution),
+                round(position.z / self.position_resolution)) + \
+            tuple(round(value / self.orientation_resolution) for value in orientation)
+
+    def matrix_key(self, matrix, rows: int, cols: int) -> tuple:
+        """
+        量化齐次变换矩阵，平移列按位置分辨率、旋转部分按姿态分辨率量化
+
+        Args:
+            matrix: 可按matrix[i][j]访问的矩阵
+            rows (int): 有效行数
+            cols (int): 有效列数
+
+        Returns:
+            tuple: 量化后的矩阵
+        """
+        return tuple(round(matrix[i][j] / (self.position_resolution if j == 3 else self.orientation_resolution))
+                     for i in range(rows) for j in range(cols))
+
+    def joint_key(self, joints) -> tuple:
+        """
+        计算关节角度所在区间
+
+        Args:
+            joints: 关节角度序列，单位：°
+
+        Returns:
+            tuple: 各关节所在区间的序号
+        """
+        return tuple(round(value / self.joint_resolution) for value in joints)
+
+    def get(self, key):
+        """
+        查找缓存结果，命中时将其标记为最近使用
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存的结果，未命中时为None
+        """
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        """
+        保存结果，超出容量时淘汰最久未使用的结果
+
+        Args:
+            key: 缓存键
+            value: 逆解结果
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """清空缓存结果及命中统计"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """
+        获取缓存统计
+
+        Returns:
+            dict[str, int]: 包含以下键的字典
+                - 'hits' (int): 命中次数
+                - 'misses' (int): 未命中次数
+                - 'size' (int): 当前保存的结果数
+                - 'maxsize' (int): 最多保存的结果数
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data), 'maxsize': self.maxsize}
@@ -0,0 +1,261 @@
+"""
+@brief 批量位姿转换
+
+@details
+Algo.rm_algo_euler2quaternion等位姿转换接口每个位姿调用一次C库，逐个转换数万个位姿时耗时主要花在Python与ctypes的调用开销上。
+此模块以NumPy向量化实现同样的转换，输入为任意前导维度的数组（如(N, 3)、(N, 4)、(N, 4, 4)），
+欧拉角约定、万向节锁处理、四元数符号及矩阵布局均与C库一致：
+    - 欧拉角[rx,ry,rz]为绕固定轴X、Y、Z依次旋转，R = Rz(rz)·Ry(ry)·Rx(rx)，单位：rad
+    - 四元数为[w,x,y,z]
+    - |sin(ry)| >= RM_EULER_GIMBAL_THRESHOLD时视为万向节锁，rz取0，全部绕Z轴的转角归入rx
+    - 旋转矩阵转四元数按迹及对角元素选择分支，与C库得到的四元数符号相同
+    - euler2matrix返回的矩阵同C库，平移部分及右下角元素均为0
+
+check_conformance将多组随机位姿分别交给本模块与C库转换并比较结果，误差超过允许值时抛出RuntimeError，可在更新C库后确认两者仍一致。
+
+**注意**
+- 本模块依赖NumPy。
+- 计算使用float64，C库使用float32，两者结果存在约1e-6量级的差异；ry接近±90°时rx、rz本身病态，差异可达1e-4量级。
+"""
+
+import numpy as np
+
+# 万向节锁判定阈值，|sin(ry)|不小于该值时按万向节锁处理，同C库
+RM_EULER_GIMBAL_THRESHOLD = 0.999999
+
+
+def euler2quaternion(euler) -> np.ndarray:
+    """
+    欧拉角转四元数，同Algo.rm_algo_euler2quaternion
+
+    Args:
+        euler (np.ndarray): 形状为(..., 3)的欧拉角数组[rx,ry,rz]，单位：rad
+
+    Returns:
+        np.ndarray: 形状为(..., 4)的四元数数组[w,x,y,z]
+    """
+    half = np.asarray(euler, dtype=np.float64) * 0.5
+    cos, sin = np.cos(half), np.sin(half)
+    cx, cy, cz = cos[..., 0], cos[..., 1], cos[..., 2]
+    sx, sy, sz = sin[..., 0], sin[..., 1], sin[..., 2]
+    return np.stack([cx * cy * cz + sx * sy * sz,
+                     sx * cy * cz - cx * sy * sz,
+                     cx * sy * cz + sx * cy * sz,
+                     cx * cy * sz - sx * sy * cz], axis=-1)
+
+
+def quaternion2euler(quat) -> np.ndarray:
+    """
+    四元数转欧拉角，同Algo.rm_algo_quaternion2euler
+
+    Args:
+        quat (np.ndarray): 形状为(..., 4)的四元数数组[w,x,y,z]，无需归一化，全0时返回0
+
+    Returns:
+        np.ndarray: 形状为(..., 3)的欧拉角数组[rx,ry,rz]，单位：rad
+    """
+    quat = np.asarray(quat, dtype=np.float64)
+    norm = np.linalg.norm(quat, axis=-1, keepdims=True)
+    quat = quat / np.where(norm == 0.0, 1.0, norm)
+    w, x, y, z = quat[..., 0], quat[..., 1], quat[..., 2], quat[..., 3]
+
+    sin_ry = np.clip(2.0 * (w * y - z * x), -1.0, 1.0)
+    gimbal = np.abs(sin_ry) >= RM_EULER_GIMBAL_THRESHOLD
+    rx = np.where(gimbal,
+                  np.arctan2(2.0 * (w * x - y * z), 1.0 - 2.0 * (x * x + z * z)),
+                  np.arctan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y)))
+    rz = np.where(gimbal, 0.0, np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z)))
+    return np.stack([rx, np.arcsin(sin_ry), rz], axis=-1)
+
+
+def _rotation(euler: np.ndarray) -> np.ndarray:
+    cos, sin = np.cos(euler), np.sin(euler)
+    cx, cy, cz = cos[..., 0], cos[..., 1], cos[..., 2]
+    sx, sy, sz = sin[..., 0], sin[..., 1], sin[..., 2]
+    rotation = np.empty(euler.shape[:-1] + (3, 3))
+    rotation[..., 0, 0] = cz * cy
+    rotation[..., 0, 1] = cz * sy * sx - sz * cx
+    rotation[..., 0, 2] = cz * sy * cx + sz * sx
+    rotation[..., 1, 0] = sz * cy
+    rotation[..., 1, 1] = sz * sy * sx + cz * cx
+    rotation[..., 1, 2] = sz * sy * cx - cz * sx
+    rotation[..., 2, 0] = -sy
+    rotation[..., 2, 1] = cy * sx
+    rotation[..., 2, 2] = cy * cx
+    return rotation
+
+
+def euler2matrix(euler) -> np.ndarray:
+    """
+    欧拉角转旋转矩阵，同Algo.rm_algo_euler2matrix
+
+    Args:
+        euler (np.ndarray): 形状为(..., 3)的欧拉角数组[rx,ry,rz]，单位：rad
+
+    Returns:
+        np.ndarray: 形状为(..., 4, 4)的矩阵数组，左上3x3为旋转矩阵，其余元素为0（同C库）
+    """
+    euler = np.asarray(euler, dtype=np.float64)
+    matrix = np.zeros(euler.shape[:-1] + (4, 4))
+    matrix[..., :3, :3] = _rotation(euler)
+    return matrix
+
+
+def pos2matrix(pose) -> np.ndarray:
+    """
+    位姿转齐次变换矩阵，同Algo.rm_algo_pos2matrix
+
+    Args:
+        pose (np.ndarray): 形状为(..., 6)的位姿数组[x,y,z,rx,ry,rz]，位置单位：m，姿态单位：rad
+
+    Returns:
+        np.ndarray: 形状为(..., 4, 4)的齐次变换矩阵数组
+    """
+    pose = np.asarray(pose, dtype=np.float64)
+    matrix = np.zeros(pose.shape[:-1] + (4, 4))
+    matrix[..., :3, :3] = _rotation(pose[..., 3:6])
+    matrix[..., :3, 3] = pose[..., :3]
+    matrix[..., 3, 3] = 1.0
+    return matrix
+
+
+def _matrix2quaternion(rotation: np.ndarray) -> np.ndarray:
+    r00, r01, r02 = rotation[..., 0, 0], rotation[..., 0, 1], rotation[..., 0, 2]
+    r10, r11, r12 = rotation[..., 1, 0], rotation[..., 1, 1], rotation[..., 1, 2]
+    r20, r21, r22 = rotation[..., 2, 0], rotation[..., 2, 1], rotation[..., 2, 2]
+    trace = r00 + r11 + r22
+
+    # 依次判断迹、r00、r11是否最大，选择数值最稳定的分支，分支内最大的分量取正
+    use_w = trace > 0.0
+    use_x = ~use_w & (r00 > r11) & (r00 > r22)
+    use_y = ~use_w & ~use_x & (r11 > r22)
+    use_z = ~use_w & ~use_x & ~use_y
+
+    quat = np.empty(rotation.shape[:-2] + (4,))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        s = np.sqrt(np.maximum(trace + 1.0, 0.0)) * 2.0
+        branch = np.stack([0.25 * s, (r21 - r12) / s, (r02 - r20) / s, (r10 - r01) / s], axis=-1)
+        quat[use_w] = branch[use_w]
+        s = np.sqrt(np.maximum(1.0 + r00 - r11 - r22, 0.0)) * 2.0
+        branch = np.stack([(r21 - r12) / s, 0.25 * s, (r01 + r10) / s, (r02 + r20) / s], axis=-1)
+        quat[use_x] = branch[use_x]
+        s = np.sqrt(np.maximum(1.0 + r11 - r00 - r22, 0.0)) * 2.0
+        branch = np.stack([(r02 - r20) / s, (r01 + r10) / s, 0.25 * s, (r12 + r21) / s], axis=-1)
+        quat[use_y] = branch[use_y]
+        s = np.sqrt(np.maximum(1.0 + r22 - r00 - r11, 0.0)) * 2.0
+        branch = np.stack([(r10 - r01) / s, (r02 + r20) / s, (r12 + r21) / s, 0.25 * s], axis=-1)
+        quat[use_z] = branch[use_z]
+    return quat
+
+
+def matrix2pos(matrix, flag: int = 1) -> np.ndarray:
+    """
+    齐次变换矩阵转位姿，同Algo.rm_algo_matrix2pos
+
+    Args:
+        matrix (np.ndarray): 形状为(..., 4, 4)的齐次变换矩阵数组
+        flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
+            - 0: 返回使用四元数表示姿态的位姿数组，每行为[x,y,z,w,x,y,z]
+            - 1: 返回使用欧拉角表示姿态的位姿数组，每行为[x,y,z,rx,ry,rz]
+
+    Returns:
+        np.ndarray: 形状为(..., 6)或(..., 7)的位姿数组
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if matrix.shape[-2:] != (4, 4):
+        raise ValueError("matrix must have shape (..., 4, 4)")
+    position = matrix[..., :3, 3]
+    rotation = matrix[..., :3, :3]
+    if not flag:
+        return np.concatenate([position, _matrix2quaternion(rotation)], axis=-1)
+
+    sin_ry = -rotation[..., 2, 0]
+    gimbal = np.abs(sin_ry) >= RM_EULER_GIMBAL_THRESHOLD
+    ry = np.arctan2(sin_ry, np.hypot(rotation[..., 0, 0], rotation[..., 1, 0]))
+    rx = np.where(gimbal,
+                  np.arctan2(-rotation[..., 1, 2], rotation[..., 1, 1]),
+                  np.arctan2(rotation[..., 2, 1], rotation[..., 2, 2]))
+    rz = np.where(gimbal, 0.0, np.arctan2(rotation[..., 1, 0], rotation[..., 0, 0]))
+    return np.concatenate([position, np.stack([rx, ry, rz], axis=-1)], axis=-1)
+
+
+def _angle_error(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.abs(np.angle(np.exp(1j * (a - b))))
+
+
+# check_conformance允许的最大误差，C库使用float32计算
+RM_CONFORMANCE_TOLERANCE = 1e-6
+# 单独设置允许误差的转换：四元数转欧拉角的误差随ry接近±90°按1/cos(ry)放大
+RM_CONFORMANCE_TOLERANCES = {'quaternion2euler': 1e-4}
+
+
+def _conformance_errors(algo, count: int, seed: int, gimbal_fraction: float) -> dict[str, float]:
+    rng = np.random.default_rng(seed)
+    poses = np.column_stack([rng.uniform(-1.0, 1.0, (count, 3)), rng.uniform(-np.pi, np.pi, (count, 3))])
+    gimbal = rng.random(count) < gimbal_fraction
+    poses[gimbal, 4] = np.sign(poses[gimbal, 4]) * (np.pi / 2 - rng.choice([0.0, 1e-5, 1e-3], gimbal.sum()))
+    euler = poses[:, 3:]
+
+    quat = np.array([algo.rm_algo_euler2quaternion(list(row)) for row in euler])
+    euler_c = np.array([algo.rm_algo_quaternion2euler(list(row)) for row in quat])
+    euler_matrix = np.array([np.reshape(algo.rm_algo_euler2matrix(list(row)).data, (4, 4)) for row in euler])
+    matrices = [algo.rm_algo_pos2matrix(list(row)) for row in poses]
+    pose_matrix = np.array([np.reshape(matrix.data, (4, 4)) for matrix in matrices])
+    pose_euler = np.array([algo.rm_algo_matrix2pos(matrix, 1) for matrix in matrices])
+    pose_quat = np.array([algo.rm_algo_matrix2pos(matrix, 0) for matrix in matrices])
+
+    # 万向节锁附近比较欧拉角对应的旋转矩阵
+    near = np.abs(np.sin(euler[:, 1])) >= 1.0 - 1e-5
+    euler_n = quaternion2euler(quat)
+    euler_error = max(_angle_error(euler_n[~near], euler_c[~near]).max(initial=0.0),
+                      np.abs(_rotation(euler_n[near]) - _rotation(euler_c[near])).max(initial=0.0))
+    pose_n = matrix2pos(pose_matrix, 1)
+    pose_error = max(np.abs(pose_n[:, :3] - pose_euler[:, :3]).max(),
+                     _angle_error(pose_n[~near, 3:], pose_euler[~near, 3:]).max(initial=0.0),
+                     np.abs(_rotation(pose_n[near, 3:]) - _rotation(pose_euler[near, 3:])).max(initial=0.0))
+    return {
+        'euler2quaternion': float(np.abs(euler2quaternion(euler) - quat).max()),
+        'quaternion2euler': float(euler_error),
+        'euler2matrix': float(np.abs(euler2matrix(euler) - euler_matrix).max()),
+        'pos2matrix': float(np.abs(pos2matrix(poses) - pose_matrix).max()),
+        'matrix2pos': float(pose_error),
+        'matrix2pos_quaternion': float(np.abs(matrix2pos(pose_matrix, 0) - pose_quat).max()),
+    }
+
+
+def check_conformance(algo=None, count: int = 1000, seeds: tuple[int, ...] = (0, 1, 2, 3, 4),
+                      gimbal_fraction: float = 0.1) -> dict[str, float]:
+    """
+    与C库逐个转换的结果比较，检查本模块的转换是否与C库一致
+
+    Args:
+        algo (Algo, optional): 用于调用C库的算法对象，为None时按RM_65-B创建. Defaults to None.
+        count (int, optional): 每个随机数种子生成的随机位姿个数. Defaults to 1000.
+        seeds (tuple[int, ...], optional): 随机数种子，每个种子分别生成一组位姿. Defaults to (0, 1, 2, 3, 4).
+        gimbal_fraction (float, optional): 随机位姿中ry接近±90°的比例，用于覆盖万向节锁分支. Defaults to 0.1.
+
+    Returns:
+        dict[str, float]: 全部种子中各转换与C库结果的最大绝对误差，欧拉角按角度差（绕回±π）计算，
+            ry接近±90°时rx、rz本身病态，比较对应的旋转矩阵。包含以下键：
+            euler2quaternion、quaternion2euler、euler2matrix、pos2matrix、matrix2pos、matrix2pos_quaternion
+
+    Raises:
+        RuntimeError: 任一误差超过RM_CONFORMANCE_TOLERANCES中单独设置的允许值或RM_CONFORMANCE_TOLERANCE
+    """
+    from .algo import Algo
+    from .rm_ctypes_wrap import rm_force_type_e, rm_robot_arm_model_e
+
+    if algo is None:
+        algo = Algo(rm_robot_arm_model_e.RM_MODEL_RM_65_E, rm_force_type_e.RM_MODEL_RM_B_E)
+    errors = {}
+    for seed in seeds:
+        for name, error in _conformance_errors(algo, count, seed, gimbal_fraction).items():
+            errors[name] = max(errors.get(name, 0.0), error)
+    exceeded = []
+    for name, error in errors.items():
+        tolerance = RM_CONFORMANCE_TOLERANCES.get(name, RM_CONFORMANCE_TOLERANCE)
+        if error > tolerance:
+            exceeded.append('%s: %.3g > %.3g' % (name, error, tolerance))
+    if exceeded:
+        raise RuntimeError("pose conversions differ from the C library: " + ', '.join(exceeded))
+    return errors
@@ -0,0 +1,234 @@
+"""
+@brief 多进程算法计算池
+
+@details
+Algo初始化时调用的rm_algo_init_sys_data会配置C库中的进程级全局数据，因此一个进程同一时刻只能使用一组
+机械臂型号、工具坐标系、工作坐标系及DH参数，且算法接口无法在多线程中安全并行。
+此模块提供AlgoPool类，为每组算法配置维护一组已完成初始化的工作进程，将批量正解、逆解、自碰撞检测请求
+分片到多个CPU核上并行计算，并将结果合并为NumPy数组。
+
+**注意**
+- 本模块依赖NumPy。
+- 工作进程默认以spawn方式启动，使用脚本需包含if __name__ == "__main__"保护。
+"""
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .rm_ctypes_wrap import ARM_DOF, c_float, rm_dh_t, rm_force_type_e, rm_frame_t, rm_robot_arm_model_e
+
+
+class AlgoConfig:
+    """
+    算法配置
+    @details 描述一个工作进程中Algo的初始化参数，可哈希、可序列化，相同配置的请求共享同一组工作进程。
+
+    **Attributes**:
+        - arm_model (int): 机械臂型号，rm_robot_arm_model_e
+        - force_type (int): 传感器类型，rm_force_type_e
+        - arm_dof (int): 机械臂自由度，通用型或指定DH参数时需设置
+        - dh (tuple | None): DH参数(d, a, alpha, offset)，每项为长度8的元组
+        - toolframe (tuple | None): 工具坐标系位姿(x, y, z, rx, ry, rz)
+        - workframe (tuple | None): 工作坐标系位姿(x, y, z, rx, ry, rz)
+    """
+
+    def __init__(self, arm_model: rm_robot_arm_model_e, force_type: rm_force_type_e, arm_dof: int = -1,
+                 dh: dict[str, list[float]] = None, toolframe: list[float] = None, workframe: list[float] = None):
+        """
+        Args:
+            arm_model (rm_robot_arm_model_e): 机械臂型号
+            force_type (rm_force_type_e): 传感器类型
+            arm_dof (int, optional): 机械臂自由度. Defaults to -1.
+            dh (dict[str, list[float]], optional): DH参数字典，键为d、a、alpha、offset，格式同rm_algo_get_dh返回值. Defaults to None.
+            toolframe (list[float], optional): 工具坐标系位姿[x,y,z,rx,ry,rz]，单位：m、rad. Defaults to None.
+            workframe (list[float], optional): 工作坐标系位姿[x,y,z,rx,ry,rz]，单位：m、rad. Defaults to None.
+        """
+        self.arm_model = int(arm_model)
+        self.force_type = int(force_type)
+        self.arm_dof = arm_dof
+        self.dh = None if dh is None else tuple(
+            tuple(float(value) for value in dh[key]) + (0.0,) * (8 - len(dh[key]))
+            for key in ('d', 'a', 'alpha', 'offset'))
+        self.toolframe = None if toolframe is None else tuple(float(value) for value in toolframe)
+        self.workframe = None if workframe is None else tuple(float(value) for value in workframe)
+
+    def _key(self) -> tuple:
+        return self.arm_model, self.force_type, self.arm_dof, self.dh, self.toolframe, self.workframe
+
+    def __eq__(self, other):
+        return isinstance(other, AlgoConfig) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def create_algo(self):
+        """
+        在当前进程中按配置创建并初始化Algo
+
+        Returns:
+            Algo: 已设置DH参数及工具、工作坐标系的算法对象
+        """
+        from .algo import Algo
+
+        dh = None if self.dh is None else rm_dh_t(*[list(values) for values in self.dh])
+        algo = Algo(rm_robot_arm_model_e(self.arm_model), rm_force_type_e(self.force_type), self.arm_dof, dh)
+        if self.toolframe is not None:
+            algo.rm_algo_set_toolframe(rm_frame_t('tool', self.toolframe, 0, 0, 0, 0))
+        if self.workframe is not None:
+            algo.rm_algo_set_workframe(rm_frame_t('work', self.workframe, 0, 0, 0, 0))
+        return algo
+
+
+# 工作进程中的算法对象，由进程初始化函数创建
+_worker_algo = None
+
+
+def _init_worker(config: AlgoConfig) -> None:
+    global _worker_algo
+    _worker_algo = config.create_algo()
+
+
+def _worker_ready() -> bool:
+    return _worker_algo is not None
+
+
+def _worker_forward_kinematics(joints: np.ndarray, flag: int) -> np.ndarray:
+    return _worker_algo.rm_algo_forward_kinematics_batch(joints, flag)
+
+
+def _worker_inverse_kinematics(poses: np.ndarray, q_seed: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return _worker_algo.rm_algo_inverse_kinematics_batch(poses, q_seed)
+
+
+def _worker_self_collision(joints: np.ndarray) -> np.ndarray:
+    from .rm_ctypes_wrap import rm_algo_safety_robot_self_collision_detection
+
+    # 复用同一个关节角度缓冲区，通过NumPy视图逐行写入
+    buffer = (c_float * ARM_DOF)()
+    view = np.frombuffer(buffer, dtype=np.float32)
+    result = np.empty(joints.shape[0], dtype=np.int32)
+    for i in range(joints.shape[0]):
+        view[:joints.shape[1]] = joints[i]
+        result[i] = rm_algo_safety_robot_self_collision_detection(buffer)
+    return result
+
+
+class AlgoPool:
+    """
+    多进程算法计算池
+    @details 每组AlgoConfig对应一组独立的、已完成Algo初始化的工作进程，批量请求按行分片后并行计算并按原顺序合并。
+    同一个计算池可同时服务多个机械臂型号或坐标系配置。
+
+        pool = AlgoPool(processes=8)
+        config = AlgoConfig(rm_robot_arm_model_e.RM_MODEL_RM_65_E, rm_force_type_e.RM_MODEL_RM_B_E)
+        poses = pool.rm_algo_forward_kinematics_batch(config, joints)
+    """
+
+    def __init__(self, processes: int = None, min_chunk: int = 256, mp_context=None):
+        """
+        Args:
+            processes (int, optional): 每组配置的工作进程数，默认为CPU核数. Defaults to None.
+            min_chunk (int, optional): 每个分片的最小行数，避免小批量请求的进程间通信开销超过计算本身. Defaults to 256.
+            mp_context (optional): multiprocessing上下文，默认为spawn. Defaults to None.
+        """
+        self.processes = processes or multiprocessing.cpu_count()
+        self.min_chunk = min_chunk
+        self._mp_context = mp_context or multiprocessing.get_context('spawn')
+        self._executors = {}
+
+    def prepare(self, config: AlgoConfig) -> None:
+        """
+        启动并初始化指定配置的全部工作进程，首次计算不再包含进程启动耗时
+
+        Args:
+            config (AlgoConfig): 算法配置
+        """
+        self._executor(config)
+
+    def _executor(self, config: AlgoConfig) -> ProcessPoolExecutor:
+        executor = self._executors.get(config)
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=self._mp_context,
+                                           initializer=_init_worker, initargs=(config,))
+            # 提交与进程数相同的空任务，使全部工作进程提前启动并完成初始化
+            for future in [executor.submit(_worker_ready) for _ in range(self.processes)]:
+                future.result()
+            self._executors[config] = executor
+        return executor
+
+    def _map(self, config: AlgoConfig, function, args: tuple, sharded: tuple[int, ...] = (0,)) -> list:
+        # sharded为按行拆分到各分片的参数序号，其余参数原样传给每个分片
+        count = len(args[0])
+        shards = max(1, min(self.processes, math.ceil(count / self.min_chunk)))
+        bounds = np.linspace(0, count, shards + 1).astype(int)
+        executor = self._executor(config)
+        futures = [executor.submit(function, *[arg[start:end] if index in sharded else arg
+                                               for index, arg in enumerate(args)])
+                   for start, end in zip(bounds[:-1], bounds[1:])]
+        return [future.result() for future in futures]
+
+    def rm_algo_forward_kinematics_batch(self, config: AlgoConfig, joints: np.ndarray, flag: int = 1) -> np.ndarray:
+        """
+        并行批量正解
+
+        Args:
+            config (AlgoConfig): 算法配置
+            joints (np.ndarray): 形状为(N, 自由度)的关节角度数组，单位：°
+            flag (int, optional): 姿态表示方式，0-四元数，1-欧拉角. Defaults to 1.
+
+        Returns:
+            np.ndarray: 形状为(N, 6)或(N, 7)的位姿数组，同Algo.rm_algo_forward_kinematics_batch
+        """
+        joints = np.ascontiguousarray(joints, dtype=np.float32)
+        return np.concatenate(self._map(config, _worker_forward_kinematics, (joints, flag)))
+
+    def rm_algo_inverse_kinematics_batch(self, config: AlgoConfig, poses: np.ndarray,
+                                         q_seed: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        并行批量逆解
+
+        Args:
+            config (AlgoConfig): 算法配置
+            poses (np.ndarray): 形状为(N, 6)或(N, 7)的目标位姿数组
+            q_seed (np.ndarray): 上一时刻关节角度，单位°
+                - 形状为(N, 自由度)：每个位姿独立求解，适用于抓取候选等互不相关的位姿
+                - 长度为自由度的一维数组：每个分片均以其作为首点q_in，分片内依次链式求解
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: 关节角度数组与逆解结果数组，同Algo.rm_algo_inverse_kinematics_batch
+        """
+        poses = np.ascontiguousarray(poses, dtype=np.float32)
+        q_seed = np.asarray(q_seed, dtype=np.float32)
+        # 一维q_seed为各分片共用的首点，不拆分
+        sharded = (0, 1) if q_seed.ndim == 2 else (0,)
+        results = self._map(config, _worker_inverse_kinematics, (poses, q_seed), sharded)
+        return np.concatenate([q for q, _ in results]), np.concatenate([status for _, status in results])
+
+    def rm_algo_self_collision_batch(self, config: AlgoConfig, joints: np.ndarray) -> np.ndarray:
+        """
+        并行批量自碰撞检测
+
+        Args:
+            config (AlgoConfig): 算法配置
+            joints (np.ndarray): 形状为(N, 自由度)的关节角度数组，单位：°
+
+        Returns:
+            np.ndarray: 形状为(N,)的检测结果，0-无碰撞，1-发生碰撞（超出关节限位视为碰撞）
+        """
+        joints = np.ascontiguousarray(joints, dtype=np.float32)
+        return np.concatenate(self._map(config, _worker_self_collision, (joints,)))
+
+    def close(self) -> None:
+        """关闭全部工作进程"""
+        for executor in self._executors.values():
+            executor.shutdown()
+        self._executors.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,120 @@
+"""
+@brief 机械臂asyncio接口
+
+@details
+此模块提供AsyncRoboticArm类，将RoboticArm的所有rm_*接口封装为可await的协程，接口调用在有界线程池中执行。
+多线程阻塞模式（block=RM_MOVE_MULTI_BLOCK）下的运动指令改为非阻塞发送，运动完成由机械臂到位事件通知，
+运动期间不占用任何线程，适合在单个asyncio服务中同时控制多台机械臂。
+
+**注意**
+- 到位事件依赖rm_event模块的事件路由器，仅在双线程或三线程模式下使用；单线程模式下block=1表示超时1s，
+  运动指令与其他接口一样在线程池中原样执行。
+"""
+
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from .rm_ctypes_wrap import RM_MOVE_MULTI_BLOCK, RM_MOVE_NBLOCK, rm_thread_mode_e
+from .rm_event import (RM_EVENT_DEVICE_EXPAND, RM_EVENT_DEVICE_JOINT, RM_EVENT_DEVICE_LIFT,
+                       rm_send_with_arrival)
+from .rm_robot_interface import RoboticArm
+
+# 多线程阻塞模式下由到位事件完成的接口及对应的到位设备
+RM_ARRIVAL_DEVICES = {
+    'rm_movej': RM_EVENT_DEVICE_JOINT,
+    'rm_movel': RM_EVENT_DEVICE_JOINT,
+    'rm_movel_offset': RM_EVENT_DEVICE_JOINT,
+    'rm_moves': RM_EVENT_DEVICE_JOINT,
+    'rm_movec': RM_EVENT_DEVICE_JOINT,
+    'rm_movej_p': RM_EVENT_DEVICE_JOINT,
+    'rm_set_joint_step': RM_EVENT_DEVICE_JOINT,
+    'rm_set_pos_step': RM_EVENT_DEVICE_JOINT,
+    'rm_set_ort_step': RM_EVENT_DEVICE_JOINT,
+    'rm_set_lift_height': RM_EVENT_DEVICE_LIFT,
+    'rm_set_expand_pos': RM_EVENT_DEVICE_EXPAND,
+}
+
+
+class AsyncRoboticArm:
+    """
+    RoboticArm的asyncio封装
+    @details 通过属性访问获得与RoboticArm同名、同参数、同返回值的协程函数，例如：
+
+        arm = AsyncRoboticArm(RoboticArm(rm_thread_mode_e.RM_TRIPLE_MODE_E))
+        await arm.rm_create_robot_arm("192.168.1.18", 8080)
+        ret = await arm.rm_movej([0, 20, 70, 0, 90, 0], 20, 0, 0, 1)
+
+    **Attributes**:
+        - arm (RoboticArm): 被封装的机械臂对象
+    """
+
+    def __init__(self, arm: RoboticArm, max_workers: int = 4):
+        """
+        初始化asyncio封装
+
+        Args:
+            arm (RoboticArm): 机械臂对象，可在封装后再通过rm_create_robot_arm连接
+            max_workers (int, optional): 执行接口调用的线程池大小. Defaults to 4.
+        """
+        self.arm = arm
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='rm_async')
+        # 单线程模式不会触发到位事件，运动指令不改为非阻塞发送
+        self._arrival = RoboticArm._thread_mode in (rm_thread_mode_e.RM_DUAL_MODE_E, rm_thread_mode_e.RM_TRIPLE_MODE_E)
+
+    def __getattr__(self, name: str):
+        if name.startswith('_') or name == 'arm':
+            raise AttributeError(name)
+        attr = getattr(self.arm, name)
+        if not name.startswith('rm_') or not callable(attr):
+            return attr
+        if name in RM_ARRIVAL_DEVICES and self._arrival:
+            wrapper = self._wrap_arrival(attr, RM_ARRIVAL_DEVICES[name])
+        else:
+            wrapper = self._wrap_blocking(attr)
+        # 缓存生成的协程函数，后续访问不再经过__getattr__
+        setattr(self, name, wrapper)
+        return wrapper
+
+    def _wrap_blocking(self, method):
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+
+        return wrapper
+
+    def _wrap_arrival(self, method, device: int):
+        signature = inspect.signature(method)
+        blocking = self._wrap_blocking(method)
+
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            if bound.arguments.get('block') != RM_MOVE_MULTI_BLOCK:
+                # 非阻塞模式保持原有行为
+                return await blocking(*args, **kwargs)
+            bound.arguments['block'] = RM_MOVE_NBLOCK
+            send = functools.partial(method, *bound.args, **bound.kwargs)
+            loop = asyncio.get_running_loop()
+            future = await loop.run_in_executor(self._executor, rm_send_with_arrival, self.arm.handle.contents.id,
+                                                send, device, bound.arguments.get('connect', 0))
+            return await asyncio.wrap_future(future)
+
+        return wrapper
+
+    def close(self, wait: bool = True) -> None:
+        """
+        关闭线程池，不会断开机械臂连接
+
+        Args:
+            wait (bool, optional): 是否等待正在执行的接口调用结束. Defaults to True.
+        """
+        self._executor.shutdown(wait=wait)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,294 @@
+"""
+@brief 接口耗时基准测试
+
+@details
+测量一次接口调用中Python封装层与通信各自的耗时，结果以JSON输出，可作为回归比较的基线。测试项分为：
+    - baseline：空调用，即计时本身的开销
+    - marshal：参数转换及结构体创建，不调用C库
+    - convert：C库输出结构体转换为字典
+    - algo：Algo正逆解及位姿转换
+    - roundtrip：连接本地模拟控制器（rm_mock.MockArmController）的完整调用，每个接口同时测量
+      RoboticArm接口（wrapper）与预先分配参数后直接调用C库（c_call），两者之差即Python封装层的开销
+    - import：在新的解释器进程中导入模块的耗时，与RM_IMPORT_BUDGET_MS中的预算比较
+
+命令行用法：
+
+    python -m Robotic_Arm.rm_benchmark --number 2000 --output bench.json
+
+**注意**
+- 每次调用单独计时，结果包含约数十纳秒的计时开销，可参考baseline项扣除。
+- roundtrip项在本机回环网络上测量，不包含真实控制器的处理时间。
+- import项超出预算时命令行以状态码1退出，可用于持续集成中检查导入耗时的回归。
+"""
+
+import argparse
+import contextlib
+import ctypes
+import json
+import math
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable
+
+from .rm_ctypes_wrap import (ARM_DOF, byref, c_float, c_int, rm_api_version, rm_current_arm_state_t,
+                             rm_force_type_e, rm_get_current_arm_state, rm_get_global_waypoints_list,
+                             rm_inverse_kinematics_params_t, rm_modbus_rtu_read_params_t, rm_movej_canfd,
+                             rm_movej_canfd_mode_t, rm_read_modbus_rtu_holding_registers,
+                             rm_realtime_arm_joint_state_t, rm_realtime_push_config_t, rm_robot_arm_model_e,
+                             rm_thread_mode_e, rm_waypoint_list_t, rm_waypoint_t)
+from .rm_mock import MockArmController
+from .algo import Algo
+from .rm_robot_interface import RoboticArm
+
+_JOINT = [0.0, 20.0, 70.0, 0.0, 90.0, 0.0]
+_POSE = [0.3, 0.0, 0.3, 3.14, 0.0, 0.0]
+# 批量位姿转换测试项的位姿数
+_POSE_CLOUD = 1000
+
+# 新进程中导入模块的耗时预算（中位数），单位：ms，不含解释器自身的启动时间，
+# 为常见x86主机实测值留有约一倍的余量，仅用于发现明显的回归
+RM_IMPORT_BUDGET_MS = {
+    'Robotic_Arm.rm_ctypes_wrap': 60.0,
+    'Robotic_Arm.algo': 60.0,
+    'Robotic_Arm.rm_robot_interface': 150.0,
+}
+
+
+def measure(function: Callable[[], any], number: int = 1000, warmup: int = 100) -> dict[str, float]:
+    """
+    逐次计时调用函数并统计
+
+    Args:
+        function (Callable[[], any]): 被测函数，返回值为非0整数时计为一次错误
+        number (int, optional): 计时调用次数. Defaults to 1000.
+        warmup (int, optional): 计时前的预热调用次数. Defaults to 100.
+
+    Returns:
+        dict[str, float]: 包含以下键的字典，时间单位：us
+            - 'number' (int): 计时调用次数
+            - 'errors' (int): 返回非0整数的次数
+            - 'mean_us'、'stdev_us' (float): 均值、标准差
+            - 'min_us'、'median_us'、'p90_us'、'p99_us'、'max_us' (float): 最小值、中位数、90及99分位数、最大值
+    """
+    for _ in range(warmup):
+        function()
+    clock = time.perf_counter_ns
+    samples = [0] * number
+    errors = 0
+    for i in range(number):
+        begin = clock()
+        result = function()
+        samples[i] = clock() - begin
+        if result.__class__ is int and result != 0:
+            errors += 1
+    samples.sort()
+
+    def percentile(q):
+        return samples[min(number - 1, math.ceil(q * number) - 1)] / 1e3
+
+    return {'number': number, 'errors': errors, 'mean_us': statistics.fmean(samples) / 1e3,
+            'stdev_us': statistics.pstdev(samples) / 1e3, 'min_us': samples[0] / 1e3,
+            'median_us': percentile(0.5), 'p90_us': percentile(0.9), 'p99_us': percentile(0.99),
+            'max_us': samples[-1] / 1e3}
+
+
+def measure_import(module: str, number: int = 20) -> dict[str, float]:
+    """
+    逐次启动新的解释器进程并测量导入模块的耗时
+
+    Args:
+        module (str): 模块名称，如'Robotic_Arm.rm_ctypes_wrap'
+        number (int, optional): 计时的进程数，另有一次不计时的预热用于生成字节码缓存. Defaults to 20.
+
+    Returns:
+        dict[str, float]: 包含以下键的字典，时间单位：ms
+            - 'number' (int): 计时的进程数
+            - 'mean_ms'、'min_ms'、'median_ms'、'max_ms' (float): 均值、最小值、中位数、最大值
+    """
+    code = ('import time; begin = time.perf_counter_ns(); import %s; '
+            'print(time.perf_counter_ns() - begin)') % module
+    # 在包的上级目录中启动，优先导入当前源码树中的包
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for i in range(number + 1):
+        output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True,
+                                check=True).stdout
+        if i > 0:
+            samples.append(int(output) / 1e6)
+    samples.sort()
+    return {'number': number, 'mean_ms': statistics.fmean(samples), 'min_ms': samples[0],
+            'median_ms': statistics.median(samples), 'max_ms': samples[-1]}
+
+
+def _local_cases(algo: Algo, waypoints: int) -> list[tuple[str, str, Callable[[], any]]]:
+    state = rm_current_arm_state_t()
+    for i in range(ARM_DOF):
+        state.joint[i] = _JOINT[i % len(_JOINT)]
+    waypoint_list = rm_waypoint_list_t()
+    waypoint_list.total_size = waypoint_list.list_len = waypoints
+    for i in range(waypoints):
+        waypoint_list.points_list[i] = rm_waypoint_t('point_%d' % i, _JOINT, _POSE, 'World', 'Arm_Tip')
+    push_config = rm_realtime_push_config_t(5, True, 8089, 0, '192.168.1.10')
+    push_state = rm_realtime_arm_joint_state_t()
+
+    def movej_canfd_config():
+        config = rm_movej_canfd_mode_t()
+        config.joint = ctypes.pointer((c_float * 7)(*_JOINT))
+        config.follow = True
+        return config
+
+    ik_params = rm_inverse_kinematics_params_t(_JOINT, algo.rm_algo_forward_kinematics(_JOINT), 1)
+    pose_cloud = [[0.3, 0.0, 0.3, 0.001 * i, 0.5, -0.002 * i] for i in range(_POSE_CLOUD)]
+    quaternion = algo.rm_algo_euler2quaternion(_POSE[3:])
+    matrix = algo.rm_algo_pos2matrix(_POSE)
+
+    return [
+        ('baseline', 'noop', lambda: None),
+        ('marshal', 'rm_current_arm_state_t()', rm_current_arm_state_t),
+        ('marshal', 'rm_waypoint_list_t()', rm_waypoint_list_t),
+        ('marshal', 'joint_array', lambda: (c_float * 7)(*_JOINT)),
+        ('marshal', 'rm_movej_canfd_mode_t', movej_canfd_config),
+        ('marshal', 'rm_inverse_kinematics_params_t', lambda: rm_inverse_kinematics_params_t(_JOINT, _POSE, 1)),
+        ('convert', 'rm_current_arm_state_t.to_dictionary', lambda: state.to_dictionary(6)),
+        ('convert', 'rm_waypoint_list_t.to_dict[%d]' % waypoints, waypoint_list.to_dict),
+        ('convert', 'rm_realtime_push_config_t.to_dict', push_config.to_dict),
+        ('convert', 'rm_realtime_push_config_t.to_record', push_config.to_record),
+        ('convert', 'rm_realtime_arm_joint_state_t.to_dict', push_state.to_dict),
+        ('convert', 'rm_realtime_arm_joint_state_t.to_record', push_state.to_record),
+        ('algo', 'rm_algo_forward_kinematics', lambda: algo.rm_algo_forward_kinematics(_JOINT)),
+        ('algo', 'rm_algo_inverse_kinematics', lambda: algo.rm_algo_inverse_kinematics(ik_params)[0]),
+        ('algo', 'rm_algo_euler2quaternion', lambda: algo.rm_algo_euler2quaternion(_POSE[3:])),
+        ('algo', 'rm_algo_quaternion2euler', lambda: algo.rm_algo_quaternion2euler(quaternion)),
+        ('algo', 'rm_algo_euler2matrix', lambda: algo.rm_algo_euler2matrix(_POSE[3:])),
+        ('algo', 'rm_algo_pos2matrix', lambda: algo.rm_algo_pos2matrix(_POSE)),
+        ('algo', 'rm_algo_matrix2pos', lambda: algo.rm_algo_matrix2pos(matrix)),
+        ('algo', 'rm_algo_pos2matrix+matrix2pos[%d]' % _POSE_CLOUD,
+         lambda: [algo.rm_algo_matrix2pos(algo.rm_algo_pos2matrix(pose)) for pose in pose_cloud]),
+        ('algo', 'rm_algo_pos2matrix_batch+matrix2pos_batch[%d]' % _POSE_CLOUD,
+         lambda: algo.rm_algo_matrix2pos_batch(algo.rm_algo_pos2matrix_batch(pose_cloud))),
+    ]
+
+
+def _roundtrip_cases(arm: RoboticArm, waypoints: int) -> list[tuple[str, str, Callable[[], any]]]:
+    handle = arm.handle
+    state = rm_current_arm_state_t()
+    waypoint_list = rm_waypoint_list_t()
+    config = rm_movej_canfd_mode_t()
+    config.joint = ctypes.pointer((c_float * 7)(*_JOINT))
+    config.follow = True
+    modbus_params = rm_modbus_rtu_read_params_t(0, 1, 1, 4)
+    modbus_data = (c_int * 4)()
+
+    return [
+        ('roundtrip', 'rm_get_current_arm_state/wrapper', lambda: arm.rm_get_current_arm_state()[0]),
+        ('roundtrip', 'rm_get_current_arm_state/c_call', lambda: rm_get_current_arm_state(handle, byref(state))),
+        ('roundtrip', 'rm_get_joint_degree/wrapper', lambda: arm.rm_get_joint_degree()[0]),
+        ('roundtrip', 'rm_movej_canfd/wrapper', lambda: arm.rm_movej_canfd(_JOINT, True)),
+        ('roundtrip', 'rm_movej_canfd/c_call', lambda: rm_movej_canfd(handle, config)),
+        ('roundtrip', 'rm_get_global_waypoints_list[%d]/wrapper' % waypoints,
+         lambda: arm.rm_get_global_waypoints_list(1, waypoints, '')[0]),
+        ('roundtrip', 'rm_get_global_waypoints_list[%d]/c_call' % waypoints,
+         lambda: rm_get_global_waypoints_list(handle, 1, waypoints, '', byref(waypoint_list))),
+        ('roundtrip', 'rm_read_modbus_rtu_holding_registers/wrapper',
+         lambda: arm.rm_read_modbus_rtu_holding_registers(modbus_params)[0]),
+        ('roundtrip', 'rm_read_modbus_rtu_holding_registers/c_call',
+         lambda: rm_read_modbus_rtu_holding_registers(handle, modbus_params, modbus_data)),
+        ('roundtrip', 'rm_movej/wrapper', lambda: arm.rm_movej(_JOINT, 20, 0, 0, 0)),
+    ]
+
+
+def run_benchmarks(number: int = 1000, roundtrip: bool = True, pattern: str = None, waypoints: int = 20,
+                   port: int = 0, imports: bool = True, import_number: int = 20) -> dict[str, any]:
+    """
+    运行全部基准测试
+
+    Args:
+        number (int, optional): 每项的计时调用次数. Defaults to 1000.
+        roundtrip (bool, optional): 是否启动模拟控制器测量往返耗时. Defaults to True.
+        pattern (str, optional): 仅运行名称匹配该正则表达式的测试项，为None时运行全部. Defaults to None.
+        waypoints (int, optional): 路点列表相关测试项的路点数，范围：1~100. Defaults to 20.
+        port (int, optional): 模拟控制器端口，为0时由系统分配. Defaults to 0.
+        imports (bool, optional): 是否测量RM_IMPORT_BUDGET_MS中各模块的导入耗时. Defaults to True.
+        import_number (int, optional): 每个模块导入耗时的计时进程数. Defaults to 20.
+
+    Returns:
+        dict[str, any]: 包含以下键的字典
+            - 'meta' (dict): 运行环境，包含python、platform、api_version、number、timestamp
+            - 'results' (list[dict]): 每个测试项的group、name及measure返回的统计值，
+              import项为measure_import返回的统计值及budget_ms、within_budget
+    """
+    algo = Algo(rm_robot_arm_model_e.RM_MODEL_RM_65_E, rm_force_type_e.RM_MODEL_RM_B_E)
+    cases = _local_cases(algo, waypoints)
+
+    controller = arm = None
+    if roundtrip:
+        controller = MockArmController(port=port).start()
+        # RoboticArm初始化时打印的API版本不输出到标准输出，避免混入JSON结果
+        with contextlib.redirect_stdout(sys.stderr):
+            arm = RoboticArm(rm_thread_mode_e.RM_TRIPLE_MODE_E)
+        if arm.rm_create_robot_arm('127.0.0.1', controller.port).id == -1:
+            controller.stop()
+            raise RuntimeError("failed to connect to the mock controller")
+        for i in range(waypoints):
+            arm.rm_add_global_waypoint(rm_waypoint_t('point_%d' % i, _JOINT, _POSE, 'World', 'Arm_Tip'))
+        cases += _roundtrip_cases(arm, waypoints)
+
+    try:
+        results = []
+        for group, name, function in cases:
+            if pattern is not None and not re.search(pattern, name):
+                continue
+            results.append(dict(group=group, name=name, **measure(function, number)))
+    finally:
+        if arm is not None:
+            arm.rm_delete_robot_arm()
+            controller.stop()
+
+    if imports:
+        for module, budget in RM_IMPORT_BUDGET_MS.items():
+            if pattern is not None and not re.search(pattern, module):
+                continue
+            result = measure_import(module, import_number)
+            results.append(dict(group='import', name=module, budget_ms=budget,
+                                within_budget=result['median_ms'] <= budget, **result))
+
+    meta = {'python': platform.python_version(), 'platform': platform.platform(), 'api_version': str(rm_api_version()),
+            'number': number, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')}
+    return {'meta': meta, 'results': results}
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='Robotic_Arm接口耗时基准测试')
+    parser.add_argument('--number', type=int, default=1000, help='每项的计时调用次数')
+    parser.add_argument('--filter', dest='pattern', default=None, help='仅运行名称匹配该正则表达式的测试项')
+    parser.add_argument('--waypoints', type=int, default=20, help='路点列表相关测试项的路点数')
+    parser.add_argument('--no-roundtrip', dest='roundtrip', action='store_false', help='不测量模拟控制器往返耗时')
+    parser.add_argument('--no-import', dest='imports', action='store_false', help='不测量模块导入耗时')
+    parser.add_argument('--import-number', type=int, default=20, help='每个模块导入耗时的计时进程数')
+    parser.add_argument('--output', default=None, help='结果JSON文件路径，默认输出到标准输出')
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.number, args.roundtrip, args.pattern, args.waypoints,
+                            imports=args.imports, import_number=args.import_number)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output is None:
+        sys.stdout.write(text + '\n')
+    else:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text + '\n')
+
+    exceeded = [result for result in report['results'] if result['group'] == 'import' and not result['within_budget']]
+    for result in exceeded:
+        sys.stderr.write('import %s: median %.1f ms exceeds budget %.1f ms\n'
+                         % (result['name'], result['median_ms'], result['budget_ms']))
+    if exceeded:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+@brief 角度透传定周期发送
+
+@details
+高跟随模式下的角度透传要求发送周期稳定且不超过10ms，使用time.sleep逐点等待时，睡眠误差与发送耗时会不断累积，
+周期抖动可达数毫秒。此模块提供CanfdStreamer类，预先分配透传配置结构体及关节角度数组，
+按绝对时间截止点发送NumPy轨迹：每个周期的截止时间由起始时间与周期直接计算，不受之前周期误差的影响，
+等待时先睡眠至截止点前再忙等至截止点，并统计每个周期的发送耗时、唤醒延迟及超时次数。
+
+**注意**
+- 本模块依赖NumPy。
+- 忙等阶段会占用一个CPU核，可通过spin参数调整忙等时长。
+"""
+
+import ctypes
+import threading
+import time
+
+import numpy as np
+
+from .rm_ctypes_wrap import c_float, rm_movej_canfd, rm_movej_canfd_mode_t
+
+
+class CanfdStreamStats:
+    """
+    透传发送统计
+
+    **Attributes**:
+        - tags (np.ndarray): 每个周期rm_movej_canfd的状态码
+        - latency_ns (np.ndarray): 每个周期发送接口的耗时，单位：ns
+        - lateness_ns (np.ndarray): 每个周期实际发送时刻相对截止时间的延迟，单位：ns
+        - overruns (int): 超时周期数，即发送完成时已晚于下一个截止时间的周期数，超时后以当前时刻重新对齐截止时间
+    """
+
+    def __init__(self, tags: np.ndarray, latency_ns: np.ndarray, lateness_ns: np.ndarray, overruns: int):
+        self.tags = tags
+        self.latency_ns = latency_ns
+        self.lateness_ns = lateness_ns
+        self.overruns = overruns
+
+    @property
+    def cycles(self) -> int:
+        """实际发送的周期数"""
+        return len(self.tags)
+
+    def summary(self) -> dict[str, float]:
+        """
+        获取统计摘要
+
+        Returns:
+            dict[str, float]: 包含以下键的字典，时间单位：us
+                - 'cycles' (int): 实际发送的周期数
+                - 'overruns' (int): 超时周期数
+                - 'errors' (int): 状态码非0的周期数
+                - 'latency_mean'、'latency_p99'、'latency_max' (float): 发送耗时的均值、99分位数、最大值
+                - 'lateness_mean'、'lateness_p99'、'lateness_max' (float): 发送延迟的均值、99分位数、最大值
+        """
+        result = {'cycles': self.cycles, 'overruns': self.overruns, 'errors': int(np.count_nonzero(self.tags))}
+        for name, values in (('latency', self.latency_ns), ('lateness', self.lateness_ns)):
+            if len(values):
+                result[name + '_mean'] = float(values.mean()) / 1e3
+                result[name + '_p99'] = float(np.percentile(values, 99)) / 1e3
+                result[name + '_max'] = float(values.max()) / 1e3
+            else:
+                result[name + '_mean'] = result[name + '_p99'] = result[name + '_max'] = 0.0
+        return result
+
+
+class CanfdStreamer:
+    """
+    角度透传定周期发送器
+    @details 与MovePlan.rm_movej_canfd发送的指令相同，但配置结构体与关节角度数组只分配一次，每个周期仅拷贝一行轨迹数据。
+
+        streamer = CanfdStreamer(arm, period=0.005, follow=True)
+        stats = streamer.run(trajectory)
+        print(stats.summary())
+    """
+
+    def __init__(self, arm, period: float = 0.01, follow: bool = True, trajectory_mode: int = 0, radio: int = 0,
+                 spin: float = 0.001):
+        """
+        Args:
+            arm (RoboticArm): 已连接的机械臂对象
+            period (float, optional): 发送周期，单位：s，高跟随模式下应为0.002~0.01. Defaults to 0.01.
+            follow (bool, optional): True-高跟随，False-低跟随. Defaults to True.
+            trajectory_mode (int, optional): 高跟随模式下，0-完全透传模式、1-曲线拟合模式、2-滤波模式. Defaults to 0.
+            radio (int, optional): 曲线拟合模式和滤波模式下的平滑系数. Defaults to 0.
+            spin (float, optional): 截止时间前的忙等时长，单位：s，其余等待时间使用睡眠. Defaults to 0.001.
+        """
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.arm = arm
+        self.period = period
+        self.spin = spin
+        self._joint = (c_float * 7)()
+        self._joint_view = np.frombuffer(self._joint, dtype=np.float32)
+        self._config = rm_movej_canfd_mode_t()
+        self._config.joint = ctypes.pointer(self._joint)
+        self._config.follow = follow
+        self._config.expand = 0
+        self._config.trajectory_mode = trajectory_mode
+        self._config.radio = radio
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """停止正在执行的run，可在其他线程中调用"""
+        self._stop.set()
+
+    def run(self, trajectory: np.ndarray, expand: np.ndarray = None, stop_on_error: bool = False) -> CanfdStreamStats:
+        """
+        按周期依次发送轨迹点，阻塞至全部发送完成或被stop停止
+
+        Args:
+            trajectory (np.ndarray): 形状为(N, 自由度)的关节角度轨迹，单位：°
+            expand (np.ndarray, optional): 长度为N的扩展关节角度，无扩展关节时为None. Defaults to None.
+            stop_on_error (bool, optional): 发送状态码非0时是否立即停止. Defaults to False.
+
+        Returns:
+            CanfdStreamStats: 发送统计
+        """
+        trajectory = np.ascontiguousarray(trajectory, dtype=np.float32)
+        if trajectory.ndim != 2 or trajectory.shape[1] > 7:
+            raise ValueError("trajectory must have shape (N, dof) with dof <= 7")
+        count, dof = trajectory.shape
+        if expand is not None:
+            expand = np.asarray(expand, dtype=np.float32)
+            if expand.shape != (count,):
+                raise ValueError("expand must have shape (N,)")
+
+        tags = np.zeros(count, dtype=np.int32)
+        latency = np.zeros(count, dtype=np.int64)
+        lateness = np.zeros(count, dtype=np.int64)
+        overruns = 0
+
+        handle = self.arm.handle
+        config = self._config
+        joint = self._joint_view
+        period_ns = int(self.period * 1e9)
+        spin_ns = int(self.spin * 1e9)
+        clock = time.perf_counter_ns
+        self._stop.clear()
+
+        start = clock()
+        sent = 0
+        for i in range(count):
+            if self._stop.is_set():
+                break
+            # 截止时间由起始时间直接计算，睡眠误差不会在周期间累积
+            deadline = start + i * period_ns
+            remaining = deadline - clock()
+            if remaining > spin_ns:
+                time.sleep((remaining - spin_ns) / 1e9)
+            while clock() < deadline:
+                pass
+
+            joint[:dof] = trajectory[i]
+            if expand is not None:
+                config.expand = expand[i]
+            begin = clock()
+            tag = rm_movej_canfd(handle, config)
+            end = clock()
+
+            tags[i] = tag
+            latency[i] = end - begin
+            lateness[i] = begin - deadline
+            sent = i + 1
+            if end > deadline + period_ns:
+                # 已错过下一个截止时间，以当前时刻重新对齐，避免连续突发发送积压的轨迹点
+                overruns += 1
+                start = end - i * period_ns
+            if tag != 0 and stop_on_error:
+                break
+
+        return CanfdStreamStats(tags[:sent], latency[:sent], lateness[:sent], overruns)
@@ -17,10 +17,10 @@
 
 from enum import IntEnum
 import re
-import platform
+import collections
+import keyword
 import os.path
 import glob
-import ctypes.util
 import ctypes
 import sys
 from ctypes import *  # noqa: F401, F403
@@ -444,6 +444,71 @@ class _variadic_function(object):
         return self.func(*fixed_args + list(args[i:]))
 
 
+class _lazy_function(object):
+    """
+    C函数的延迟绑定代理
+    @details 导入时只记录argtypes、restype及errcheck，首次调用时才查找符号并设置类型，
+    同时将本包各模块中引用该代理的同名全局变量替换为实际的函数对象。
+    """
+
+    __slots__ = ("_lookup", "_name", "_calling_convention", "_function", "argtypes", "restype", "errcheck")
+
+    def __init__(self, lookup, name, calling_convention):
+        self._lookup = lookup
+        self._name = name
+        self._calling_convention = calling_convention
+        self._function = None
+
+    def _bind(self):
+        function = self._lookup.get(self._name, self._calling_convention)
+        for attribute in ("argtypes", "restype", "errcheck"):
+            try:
+                value = getattr(self, attribute)
+            except AttributeError:
+                # 未设置的属性保持ctypes默认值
+                continue
+            setattr(function, attribute, value)
+        self._function = function
+        # 同时替换本包其他模块（如通过import *导入的rm_robot_interface）中的引用，之后的调用不再经过代理
+        for module_name, module in list(sys.modules.items()):
+            if module_name == __name__ or (__package__ and module_name.startswith(__package__ + ".")):
+                namespace = getattr(module, "__dict__", None)
+                if namespace is not None and namespace.get(self._name) is self:
+                    namespace[self._name] = function
+        return function
+
+    def __call__(self, *args):
+        function = self._function
+        if function is None:
+            function = self._bind()
+        return function(*args)
+
+    def __repr__(self):
+        return "<lazy C function %s>" % self._name
+
+
+class _lazy_library(object):
+    """
+    延迟绑定符号的库对象，接口同LibraryLoader.Lookup
+    @details has查找符号是否存在，使库中不存在的符号与原先一样不定义对应的名称；
+    get返回_lazy_function，argtypes、restype等类型设置推迟到首次调用时进行。
+    """
+
+    def __init__(self, lookup):
+        self._lookup = lookup
+
+    def has(self, name, calling_convention="cdecl"):
+        return self._lookup.has(name, calling_convention)
+
+    def get(self, name, calling_convention="cdecl"):
+        if calling_convention not in self._lookup.access:
+            return self._lookup.get(name, calling_convention)
+        return _lazy_function(self._lookup, name, calling_convention)
+
+    def __getattr__(self, name):
+        return getattr(self._lookup, name)
+
+
 def ord_if_char(value):
     """
     Simple helper used for casts to simple builtin types:  if the argument is a
@@ -598,6 +663,9 @@ class LibraryLoader:
                     yield os.path.abspath(os.path.join(os.path.dirname(__file__), fmt % libname))
 
             # now, use the ctypes tools to try to find the library
+            # ctypes.util依赖subprocess等模块，导入较慢，仅在前面的路径均未找到库时导入
+            import ctypes.util
+
             for fmt in self.name_formats:
                 path = ctypes.util.find_library(fmt % libname)
                 if path:
@@ -773,6 +841,8 @@ class PosixLibraryLoader(LibraryLoader):
 
         self._get_ld_so_conf_dirs("/etc/ld.so.conf", directories)
 
+        import platform
+
         bitage = platform.architecture()[0]
 
         unix_lib_dirs_list = []
@@ -886,7 +956,8 @@ package_dir = os.path.dirname(module_path)
 dll_path = os.path.join(package_dir, 'libs')
 
 # End loader
-if platform.machine() == "x86_64":
+# 同platform.machine()，避免导入platform模块；Windows下platform.machine()不会返回x86_64
+if hasattr(os, "uname") and os.uname().machine == "x86_64":
     dll_path = os.path.join(dll_path, 'linux_x86')
     add_library_search_dirs([dll_path])
 elif sys.platform == "win32":
@@ -906,12 +977,143 @@ if sys.platform == "linux":
     libname = "libapi_c.so"
 elif sys.platform == "win32":
     libname = "api_c.dll"
-_libs[libname] = load_library(libname)
+_libs[libname] = _lazy_library(load_library(libname))
 
 __uint8_t = c_ubyte
 __uint16_t = c_ushort
 uint8_t = __uint8_t
 uint16_t = __uint16_t
+
+
+def _decode_bytes(value):
+    """字节串按UTF-8解码，非UTF-8编码时转换为十六进制字符串，非字节类型直接返回"""
+    if value.__class__ is not bytes:
+        return value
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        return value.hex()
+
+
+def _is_bytes_field(ctype):
+    if ctype is c_char or ctype is c_char_p:
+        return True
+    return isinstance(ctype, type) and issubclass(ctype, Array) and ctype._type_ is c_char
+
+
+def _is_struct_field(ctype):
+    return isinstance(ctype, type) and issubclass(ctype, Structure)
+
+
+def _field_access(field):
+    return 'self.%s' % field if field.isidentifier() and not keyword.iskeyword(field) else 'getattr(self, %r)' % field
+
+
+def _compile_to_dict(cls):
+    # 按_fields_生成专用转换函数，结果与逐字段反射判断类型的实现一致：
+    # 嵌套结构体递归调用其to_dict，字节串字段解码，其余字段（含数组）直接返回
+    plain, nested = [], []
+    for field in cls._fields_:
+        name, ctype = field[0], field[1]
+        access = _field_access(name)
+        if _is_bytes_field(ctype):
+            access = '_decode_bytes(%s)' % access
+        plain.append('%r: %s' % (name, access))
+        nested.append('%r: %s.to_dict(recurse=True)' % (name, access) if _is_struct_field(ctype)
+                      else plain[-1])
+    source = ('def to_dict(self, recurse=True):\n'
+              '    if recurse:\n'
+              '        return {%s}\n'
+              '    return {%s}\n') % (', '.join(nested), ', '.join(plain))
+    namespace = {'_decode_bytes': _decode_bytes}
+    exec(compile(source, '<%s.to_dict>' % cls.__name__, 'exec'), namespace)
+    function = namespace['to_dict']
+    function.__doc__ = _struct_to_dict.__doc__
+    function.__qualname__ = '%s.to_dict' % cls.__name__
+    return function
+
+
+# 结构体类 -> 生成的字典转换函数
+_dict_converters = {}
+
+
+def _dict_converter(cls):
+    function = _dict_converters.get(cls)
+    if function is None:
+        function = _dict_converters[cls] = _compile_to_dict(cls)
+    return function
+
+
+def _struct_to_dict(self, recurse=True):
+    """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
+    cls = self.__class__
+    function = _dict_converter(cls)
+    # 首次调用时替换为该类的专用转换函数，之后直接调用
+    cls.to_dict = function
+    return function(self, recurse)
+
+
+# 结构体类 -> 生成的具名元组转换函数
+_record_converters = {}
+
+
+def _array_to_tuple(value):
+    if isinstance(value, Structure):
+        return _struct_to_record(value)
+    if isinstance(value, Array):
+        if value._type_ is c_char:
+            return _decode_bytes(value.value)
+        return tuple(_array_to_tuple(item) for item in value)
+    return _decode_bytes(value)
+
+
+def _compile_to_record(cls):
+    names, values = [], []
+    for field in cls._fields_:
+        name, ctype = field[0], field[1]
+        access = _field_access(name)
+        if _is_bytes_field(ctype):
+            access = '_decode_bytes(%s)' % access
+        elif _is_struct_field(ctype):
+            access = '_struct_to_record(%s)' % access
+        elif isinstance(ctype, type) and issubclass(ctype, Array):
+            if _is_struct_field(ctype._type_):
+                access = 'tuple([_struct_to_record(item) for item in %s])' % access
+            elif isinstance(ctype._type_, type) and issubclass(ctype._type_, Array):
+                access = '_array_to_tuple(%s)' % access
+            else:
+                # 数值数组直接转换，无需逐元素判断类型
+                access = 'tuple(%s)' % access
+        names.append(name)
+        values.append(access)
+    base = cls.__name__[:-2] if cls.__name__.endswith('_t') else cls.__name__
+    record = collections.namedtuple(base + '_record', names, rename=True)
+    source = ('def to_record(self):\n'
+              '    return _record(%s)\n') % ', '.join(values)
+    namespace = {'_decode_bytes': _decode_bytes, '_array_to_tuple': _array_to_tuple,
+                 '_struct_to_record': _struct_to_record, '_record': record}
+    exec(compile(source, '<%s.to_record>' % cls.__name__, 'exec'), namespace)
+    function = namespace['to_record']
+    function.__doc__ = _struct_to_record.__doc__
+    function.__qualname__ = '%s.to_record' % cls.__name__
+    function.record_type = record
+    return function
+
+
+def _struct_to_record(self):
+    """
+    将类的变量返回为只读的具名元组，字段名同结构体字段名
+
+    Returns:
+        tuple: 该结构体类对应的collections.namedtuple实例，嵌套结构体同样转换为具名元组，
+            数组转换为元组，字节串按UTF-8解码
+    """
+    cls = self.__class__
+    function = _record_converters.get(cls)
+    if function is None:
+        function = _record_converters[cls] = _compile_to_record(cls)
+    return function(self)
+
 # @endcond
 
 
@@ -1148,29 +1350,8 @@ class rm_udp_custom_config_t(Structure):
         self.plus_base = plus_base
         self.plus_state = plus_state
     
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 class rm_realtime_push_config_t(Structure):
     """  
@@ -1224,29 +1405,8 @@ class rm_realtime_push_config_t(Structure):
                custom_config=rm_udp_custom_config_t()
             self.custom_config = custom_config
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
     
 
 class rm_io_real_time_config_t(Structure):
@@ -1260,29 +1420,8 @@ class rm_io_real_time_config_t(Structure):
         self.mode = mode
 
     
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
         
 
 class rm_io_config_t(Structure):
@@ -1326,29 +1465,8 @@ class rm_io_config_t(Structure):
             else:
                 self.io_real_time_config_t = io_real_time_config_t
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_io_get_t(Structure):
@@ -1372,29 +1490,8 @@ class rm_io_get_t(Structure):
             else:
                 self.io_config = io_config
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_quat_t(Structure):
@@ -1414,29 +1511,8 @@ class rm_quat_t(Structure):
         ('z', c_float),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_position_t(Structure):
@@ -1456,29 +1532,8 @@ class rm_position_t(Structure):
         ('z', c_float),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_euler_t(Structure):
@@ -1496,29 +1551,8 @@ class rm_euler_t(Structure):
         ('rz', c_float),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_pose_t(Structure):
@@ -1536,29 +1570,8 @@ class rm_pose_t(Structure):
         ('euler', rm_euler_t),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_frame_name_t(Structure):
@@ -1628,6 +1641,8 @@ class rm_frame_t(Structure):
             self.y = y
             self.z = z
 
+    to_record = _struct_to_record
+
     def to_dictionary(self) -> dict[str, any]:
         """将rm_frame_t对象转换为字典表现形式
 
@@ -1671,6 +1686,8 @@ class rm_ctrl_version_t(Structure):
         ('version', c_char * int(10)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         result = {
             "build_time": self.build_time.decode("utf-8"),
@@ -1694,6 +1711,8 @@ class rm_dynamic_version_t(Structure):
         ('model_version', c_char * int(5)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self):
         result = {
             "model_version": self.model_version.decode("utf-8")
@@ -1718,6 +1737,8 @@ class rm_planinfo_t(Structure):
         ('version', c_char * int(20)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self):
         result = {
             "build_time": self.build_time.decode("utf-8"),
@@ -1741,6 +1762,8 @@ class rm_algorithm_version_t(Structure):
         ('version', c_char * int(20)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self):
         result = {
             "version": self.version.decode("utf-8")
@@ -1765,6 +1788,8 @@ class rm_software_build_info_t(Structure):
         ('version', c_char * int(20)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self):
         out_dict = {
             "build_time": self.build_time.decode("utf-8"),
@@ -1801,6 +1826,8 @@ class rm_arm_software_version_t(Structure):
         ('program_info', rm_software_build_info_t),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, robot_controller_version = 4):
         out_dict = {
             "product_version": self.product_version.decode("utf-8"),
@@ -1832,6 +1859,8 @@ class rm_err_t(Structure):
         ('err', c_int * int(24)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
         result = {
@@ -1866,6 +1895,8 @@ class rm_current_arm_state_t(Structure):
         ('err', rm_err_t),
     ]
 
+    to_record = _struct_to_record
+
     def to_dictionary(self, arm_dof):
         position = self.pose.position
         euler = self.pose.euler
@@ -1905,6 +1936,8 @@ class rm_joint_status_t(Structure):
         ('joint_speed', c_float * int(7)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         result = {
             'joint_current': list(self.joint_current),
@@ -1966,33 +1999,16 @@ class rm_wifi_net_t(Structure):
         ('ssid', c_char * int(32)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
+        result = _dict_converter(self.__class__)(self, recurse)
 
         if self.mode.decode('utf-8') == "off":
             del result['password']
             del result['ssid']
             del result['channel']
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
         return result
 
 
@@ -2020,6 +2036,8 @@ class rm_arm_all_state_t(Structure):
         ('err', rm_err_t),
     ]
 
+    to_record = _struct_to_record
+
     def to_dictionary(self):
         output_dict = {
             'joint_current': list(self.joint_current),
@@ -2058,29 +2076,8 @@ class rm_gripper_state_t(Structure):
         ('actpos', c_int),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_force_data_t(Structure):
@@ -2103,29 +2100,8 @@ class rm_force_data_t(Structure):
         ('tool_zero_force_data', c_float * int(6)),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_fz_data_t(Structure):
@@ -2149,29 +2125,8 @@ class rm_fz_data_t(Structure):
         ('tool_zero_Fz', c_float),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_peripheral_read_write_params_t(Structure):
@@ -2233,29 +2188,8 @@ class rm_expand_state_t(Structure):
         ('mode', c_int),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 # rm_expand_state_t = struct_anon_30
 
@@ -2349,29 +2283,8 @@ class rm_trajectory_data_t(Structure):
         ('trajectory_name', c_char * int(32)),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_program_trajectorys_t(Structure):
@@ -2396,35 +2309,19 @@ class rm_program_trajectorys_t(Structure):
         ('trajectory_list', rm_trajectory_data_t * int(100)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
+        result = _dict_converter(self.__class__)(self, recurse)
 
         non_empty_outputs = []
-        for i in range(self.list_size):
+        # list_size为符合条件的总数，可能超过单页数组长度
+        for i in range(min(self.list_size, len(self.trajectory_list))):
             if self.trajectory_list[i].trajectory_name != b'':  # 判断列表是否为空
                 output = self.trajectory_list[i].to_dict()
                 non_empty_outputs.append(output)
         result["trajectory_list"] = non_empty_outputs
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
         return result
 
 
@@ -2459,15 +2356,11 @@ class rm_program_run_state_t(Structure):
         ('loop_cont', c_int * int(100)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
+        result = _dict_converter(self.__class__)(self, recurse)
         loop_num = []
         loop_cont = []
         for i in range(self.total_loop):
@@ -2477,19 +2370,6 @@ class rm_program_run_state_t(Structure):
             loop_cont.append(output1)
         result["loop_num"] = loop_num
         result["loop_cont"] = loop_cont
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
         if 0 == self.run_state:
             del result['plan_num']
             del result['loop_num']
@@ -2527,6 +2407,8 @@ class rm_flowchart_run_state_t(Structure):
         ('modal_id', c_char * int(50)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         output_dict = {
             "run_state": self.run_state,
@@ -2585,6 +2467,8 @@ class rm_waypoint_t(Structure):
             # 路点新增或修改时间
             self.time = time.encode('utf-8')
 
+    to_record = _struct_to_record
+
     def to_dict(self):
         """将类的变量返回为字典"""
         if os.name == "nt":
@@ -2634,6 +2518,8 @@ class rm_waypoint_list_t(Structure):
         ('points_list', rm_waypoint_t * int(100)),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self):
         vague_search = self.vague_search.decode("utf-8")
         non_empty_outputs = []
@@ -2817,6 +2703,8 @@ class rm_fence_config_t(Structure):
             else:
                 self.sphere = rm_fence_config_sphere_t()
 
+    to_record = _struct_to_record
+
     def to_dict(self):
         name = self.name.decode("utf-8").strip()  # 去除字符串两端的空白字符
         output_dict = {"name": name}
@@ -2915,6 +2803,8 @@ class rm_envelopes_ball_t(Structure):
             # 工具包络球体球心基于末端法兰坐标系的 Z 轴坐标，单位 m
             self.z = z
 
+    to_record = _struct_to_record
+
     def to_dictionary(self):
         """输出结果为字典"""
         name = self.name.decode("utf-8")
@@ -2957,6 +2847,8 @@ class rm_envelope_balls_list_t(Structure):
             self.size = size
             """包络球的数量。"""
 
+    to_record = _struct_to_record
+
     def to_dictionary(self):
         """将类的变量输出为字典"""
         name = self.tool_name.decode("utf-8")
@@ -2994,30 +2886,8 @@ class rm_electronic_fence_enable_t(Structure):
             # 0-电子围栏针对整臂区域生效，1-虚拟墙针对末端生效
             self.effective_region = effective_region
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 class rm_movej_canfd_mode_t(Structure):
     """
@@ -3091,6 +2961,8 @@ class rm_force_sensor_t(Structure):
         ('coordinate', c_int),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         result = {
             'force': list(self.force),
@@ -3121,29 +2993,8 @@ class rm_udp_expand_state_t(Structure):
         ('mode', c_int),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 class rm_udp_lift_state_t(Structure):
     """  
@@ -3164,29 +3015,8 @@ class rm_udp_lift_state_t(Structure):
         ('en_flag', c_int),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 class rm_udp_hand_state_t(Structure):
     """  
@@ -3214,6 +3044,8 @@ class rm_udp_hand_state_t(Structure):
         ('hand_err', c_int),
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         result = {
             'hand_pos': list(self.hand_pos),
@@ -3238,29 +3070,8 @@ class rm_udp_aloha_state_t(Structure):
         ('io2_state', c_int),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_udp_arm_current_status_e(IntEnum):
@@ -3311,6 +3122,8 @@ class rm_plus_base_info_t(Structure):
         ("force_low", c_int * 6),           # 力下限
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         output_dict = {
             "manu": self.manu.decode('utf-8'),
@@ -3356,6 +3169,8 @@ class rm_plus_state_info_t(Structure):
         ("force",c_int * 6),                   # 自由度力矩,闭合正，松开负，单位0.001N
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         output_dict = {
             "sys_state" : self.sys_state,
@@ -3415,29 +3230,8 @@ class rm_realtime_arm_joint_state_t(Structure):
         ('plus_state_info',rm_plus_state_info_t),
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_inverse_kinematics_params_t(Structure):
@@ -3556,6 +3350,8 @@ class rm_robot_info_t(Structure):
         ('robot_controller_version', uint8_t)
     ]
 
+    to_record = _struct_to_record
+
     def to_dictionary(self):
         """将int类型数据转化为字符串，并输出结果为字典
         @return dict: 包含机械臂自由度'arm_dof'、型号'arm_model'、末端力控版本'force_type'值的字典
@@ -3721,6 +3517,8 @@ class rm_dh_t(Structure):
             self.alpha = (c_float * 8)(*alpha)
             self.offset = (c_float * 8)(*offset)
 
+    to_record = _struct_to_record
+
     def to_dict(self, dof, recurse=True):
         output_dict = {
             "d": list(self.d[:dof]),
@@ -3750,6 +3548,8 @@ class rm_trajectory_info_t(Structure):
         ('create_time', c_char * int(20)),      # 创建时间
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         output_dict = {
             "point_num": self.point_num,
@@ -3768,6 +3568,8 @@ class rm_trajectory_list_t(Structure):
         ('tra_list', rm_trajectory_info_t * int(100)),      # 返回符合的轨迹列表
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         vague_search = self.vague_search.decode("utf-8")
         non_empty_outputs = []
@@ -3801,6 +3603,8 @@ class rm_modbus_tcp_master_info_t(Structure):
             self.port = port
 
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         output_dict = {
             "master_name": self.master_name.decode('utf-8'),
@@ -3819,6 +3623,8 @@ class rm_modbus_tcp_master_list_t(Structure):
         ('list_len', c_int),        # 返回符合的TCP主站列表长度
         ('master_list', rm_modbus_tcp_master_info_t * int(100)),        # 返回符合的TCP主站列表
     ]
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         output_dict = {
             "page_num": self.page_num,
@@ -3921,29 +3727,8 @@ class rm_tool_action_info_t(Structure):
         ('hand_angle', c_int * int(100)),   #动作角度
     ]
 
-    def to_dict(self, recurse=True):
-        """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
-        return result
+    to_dict = _struct_to_dict
+    to_record = _struct_to_record
 
 
 class rm_tool_action_list_t(Structure):
@@ -3956,35 +3741,19 @@ class rm_tool_action_list_t(Structure):
         ('act_list', rm_tool_action_info_t * int(100)),      #返回符合的动作列表
     ]
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         """将类的变量返回为字典，如果recurse为True，则递归处理ctypes结构字段"""
-        result = {}
-        for field, ctype in self._fields_:
-            value = getattr(self, field)
-
-            if recurse and isinstance(ctype, type) and issubclass(ctype, Structure):
-                value = value.to_dict(recurse=recurse)
-            result[field] = value
+        result = _dict_converter(self.__class__)(self, recurse)
 
         non_empty_outputs = []
-        for i in range(self.total_size):
+        # total_size为符合条件的总数，可能超过单页数组长度
+        for i in range(min(self.total_size, len(self.act_list))):
             if self.act_list[i].name != b'':  # 判断列表是否为空
                 output = self.act_list[i].to_dict()
                 non_empty_outputs.append(output)
         result["act_list"] = non_empty_outputs
-
-        for key, value in result.items():
-            if isinstance(value, bytes):
-                try:
-                    # 尝试使用 UTF-8 解码
-                    result[key] = value.decode('utf-8')
-                except UnicodeDecodeError:
-                    # 如果不是 UTF-8 编码，则可能需要根据实际情况处理
-                    # 这里简单地将字节转换为十六进制字符串作为替代方案
-                    result[key] = value.hex()
-            else:
-                # 值不是字节类型，直接保留
-                result[key] = value
         return result
     
 class rm_Mat_t(Structure):
@@ -4048,6 +3817,8 @@ class rm_Mat_t(Structure):
                         # 无法转换时置0
                         self.data[i][j] = 0.0
 
+    to_record = _struct_to_record
+
     def to_dict(self, recurse=True):
         """
         将结构体转换为字典，适配二维数组的特殊处理
@@ -5682,6 +5453,9 @@ if _libs[libname].has("rm_algo_inverse_kinematics", "cdecl"):
     rm_algo_inverse_kinematics.argtypes = [POINTER(rm_robot_handle), rm_inverse_kinematics_params_t,
                                            POINTER(c_float)]
     rm_algo_inverse_kinematics.restype = c_int
+    # 批量逆解使用的地址参数版本，直接传入句柄与输出关节数组的内存地址
+    rm_algo_inverse_kinematics_addr = CFUNCTYPE(c_int, c_void_p, rm_inverse_kinematics_params_t, c_void_p)(
+        ("rm_algo_inverse_kinematics", _libs[libname].access["cdecl"]))
 
 if _libs[libname].has("rm_algo_inverse_kinematics_all", "cdecl"):
     rm_algo_inverse_kinematics_all = _libs[libname].get(
@@ -5725,6 +5499,9 @@ if _libs[libname].has("rm_algo_forward_kinematics", "cdecl"):
     rm_algo_forward_kinematics.argtypes = [
         POINTER(rm_robot_handle), POINTER(c_float)]
     rm_algo_forward_kinematics.restype = rm_pose_t
+    # 批量正解使用的地址参数版本，直接传入句柄与关节数组的内存地址，避免逐点构造ctypes参数对象
+    rm_algo_forward_kinematics_addr = CFUNCTYPE(rm_pose_t, c_void_p, c_void_p)(
+        ("rm_algo_forward_kinematics", _libs[libname].access["cdecl"]))
 
 if _libs[libname].has("rm_algo_euler2quaternion", "cdecl"):
     rm_algo_euler2quaternion = _libs[libname].get(
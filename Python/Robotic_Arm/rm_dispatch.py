@@ -0,0 +1,195 @@
+"""
+@brief 回调分发
+
+@details
+通过rm_realtime_arm_state_call_back、rm_get_arm_event_call_back注册的Python回调直接在C库的UDP接收线程、数据接收线程中执行，
+回调耗时过长会阻塞所有已连接机械臂的数据接收。此模块提供CallbackDispatcher类，在接收线程中仅将数据放入有界队列，
+由独立的工作线程调用用户回调，队列已满时按设定的策略处理：
+    - RM_DISPATCH_DROP_OLDEST：丢弃队列中最旧的数据
+    - RM_DISPATCH_LATEST：同一数据源只保留最新的一条，未处理的旧数据被新数据替换
+    - RM_DISPATCH_BLOCK：阻塞接收线程直至队列有空位，不丢弃数据
+
+**注意**
+- ctypes以值传递方式调用回调时，回调收到的结构体已是Python持有的拷贝，可直接放入队列。
+- 工作线程数大于1时，同一队列中的数据不保证按顺序处理。
+"""
+
+import threading
+from collections import OrderedDict, deque
+from typing import Callable
+
+from .rm_ctypes_wrap import rm_event_callback_ptr, rm_realtime_arm_state_callback_ptr
+
+# 队列已满时丢弃最旧的数据
+RM_DISPATCH_DROP_OLDEST = 'drop_oldest'
+# 同一数据源只保留最新的数据
+RM_DISPATCH_LATEST = 'latest'
+# 队列已满时阻塞接收线程
+RM_DISPATCH_BLOCK = 'block'
+
+
+class CallbackDispatcher:
+    """
+    回调分发器
+    @details 将C库接收线程中收到的数据放入有界队列，由工作线程调用处理函数，例如：
+
+        dispatcher = CallbackDispatcher(on_state, maxsize=64, policy=RM_DISPATCH_LATEST, key=lambda s: s.arm_ip)
+        arm.rm_realtime_arm_state_call_back(dispatcher.realtime_arm_state_callback)
+        arm_event_router.add_listener(CallbackDispatcher(on_event).submit)
+
+    **Attributes**:
+        - maxsize (int): 队列容量，RM_DISPATCH_LATEST策略下为可同时保留的数据源数
+        - policy (str): 队列已满时的处理策略
+    """
+
+    def __init__(self, handler: Callable[[any], None], maxsize: int = 1024, policy: str = RM_DISPATCH_DROP_OLDEST,
+                 workers: int = 1, key: Callable[[any], any] = None):
+        """
+        Args:
+            handler (Callable[[any], None]): 处理函数，在工作线程中调用，参数为回调收到的结构体
+            maxsize (int, optional): 队列容量. Defaults to 1024.
+            policy (str, optional): 队列已满时的处理策略，RM_DISPATCH_DROP_OLDEST、RM_DISPATCH_LATEST或RM_DISPATCH_BLOCK.
+                Defaults to RM_DISPATCH_DROP_OLDEST.
+            workers (int, optional): 工作线程数. Defaults to 1.
+            key (Callable[[any], any], optional): RM_DISPATCH_LATEST策略下区分数据源的函数，
+                如实时状态的arm_ip、事件的handle_id，为None时所有数据视为同一数据源. Defaults to None.
+        """
+        if policy not in (RM_DISPATCH_DROP_OLDEST, RM_DISPATCH_LATEST, RM_DISPATCH_BLOCK):
+            raise ValueError("unknown dispatch policy: %s" % policy)
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._handler = handler
+        self._key = key
+        self._queue = OrderedDict() if policy == RM_DISPATCH_LATEST else deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+        self._submitted = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._blocked = 0
+        self._errors = 0
+        self._max_depth = 0
+        self.last_error = None
+        self._realtime_callback = None
+        self._event_callback = None
+        self._threads = [threading.Thread(target=self._worker, name='rm_dispatch', daemon=True)
+                         for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def realtime_arm_state_callback(self) -> rm_realtime_arm_state_callback_ptr:
+        """rm_realtime_arm_state_call_back可直接使用的回调函数，生命周期与分发器一致"""
+        if self._realtime_callback is None:
+            self._realtime_callback = rm_realtime_arm_state_callback_ptr(self.submit)
+        return self._realtime_callback
+
+    @property
+    def event_callback(self) -> rm_event_callback_ptr:
+        """rm_get_arm_event_call_back可直接使用的回调函数，生命周期与分发器一致"""
+        if self._event_callback is None:
+            self._event_callback = rm_event_callback_ptr(self.submit)
+        return self._event_callback
+
+    def submit(self, data) -> None:
+        """
+        放入一条数据，通常在C库接收线程中调用
+
+        Args:
+            data: 回调收到的结构体
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._submitted += 1
+            queue = self._queue
+            if self.policy == RM_DISPATCH_LATEST:
+                key = None if self._key is None else self._key(data)
+                if key in queue:
+                    # 替换尚未处理的旧数据，数据源在队列中的位置保持不变
+                    self._dropped += 1
+                elif len(queue) >= self.maxsize:
+                    queue.popitem(last=False)
+                    self._dropped += 1
+                queue[key] = data
+            elif self.policy == RM_DISPATCH_DROP_OLDEST:
+                if len(queue) >= self.maxsize:
+                    queue.popleft()
+                    self._dropped += 1
+                queue.append(data)
+            else:
+                if len(queue) >= self.maxsize:
+                    self._blocked += 1
+                    while len(queue) >= self.maxsize and not self._closed:
+                        self._not_full.wait()
+                    if self._closed:
+                        return
+                queue.append(data)
+            if len(queue) > self._max_depth:
+                self._max_depth = len(queue)
+            self._not_empty.notify()
+
+    def _worker(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return
+                if self.policy == RM_DISPATCH_LATEST:
+                    _, data = self._queue.popitem(last=False)
+                else:
+                    data = self._queue.popleft()
+                self._not_full.notify()
+            try:
+                self._handler(data)
+            except Exception as error:
+                with self._lock:
+                    self._errors += 1
+                    self.last_error = error
+            else:
+                with self._lock:
+                    self._delivered += 1
+
+    def stats(self) -> dict[str, int]:
+        """
+        获取队列统计
+
+        Returns:
+            dict[str, int]: 包含以下键的字典
+                - 'depth' (int): 当前队列深度
+                - 'max_depth' (int): 历史最大队列深度
+                - 'submitted' (int): 放入的数据总数
+                - 'delivered' (int): 处理函数正常返回的次数
+                - 'dropped' (int): 被丢弃或被新数据替换的数据数
+                - 'blocked' (int): RM_DISPATCH_BLOCK策略下接收线程因队列已满而等待的次数
+                - 'errors' (int): 处理函数抛出异常的次数，最近一次异常见last_error
+        """
+        with self._lock:
+            return {'depth': len(self._queue), 'max_depth': self._max_depth, 'submitted': self._submitted,
+                    'delivered': self._delivered, 'dropped': self._dropped, 'blocked': self._blocked,
+                    'errors': self._errors}
+
+    def close(self, timeout: float = None) -> None:
+        """
+        停止接收新数据，等待工作线程处理完队列中剩余的数据后退出
+
+        Args:
+            timeout (float, optional): 等待每个工作线程退出的最长时间，单位：s，为None时一直等待. Defaults to None.
+        """
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,288 @@
+"""
+@brief 机械臂事件及实时状态分发
+
+@details
+C库的机械臂事件回调（rm_get_arm_event_call_back）与UDP实时状态回调（rm_realtime_arm_state_call_back）均为进程级全局注册，
+同一时刻只能生效一个回调函数，多机械臂进程中每个订阅者都会收到所有机械臂的数据。
+此模块提供进程内唯一的事件路由器与实时状态路由器，由其注册全局回调：
+    - 事件路由器根据rm_event_push_data_t中的handle_id与到位设备，将轨迹到位事件转发给等待中的concurrent.futures.Future，
+      从而无需为每次阻塞运动占用一个线程，并按handle_id将事件转发给对应机械臂的监听函数
+    - 实时状态路由器根据rm_realtime_arm_joint_state_t中的arm_ip、arm_port将数据转发给对应机械臂的监听函数
+路由表在订阅变化时预先生成，每条数据只需一次字典查找。
+
+**注意**
+- 事件回调仅在双线程、三线程模式下可用，实时状态回调仅在三线程模式下可用。
+- 路由器注册后会替换通过rm_get_arm_event_call_back、rm_realtime_arm_state_call_back注册的回调，反之亦然，
+  如仍需接收全部原始数据，请使用路由器的add_listener。
+"""
+
+import threading
+from concurrent.futures import Future, InvalidStateError
+from typing import Callable
+
+from .rm_ctypes_wrap import (rm_event_callback_ptr, rm_event_push_data_t, rm_event_type_e, rm_get_arm_event_call_back,
+                             rm_realtime_arm_joint_state_t, rm_realtime_arm_state_call_back,
+                             rm_realtime_arm_state_callback_ptr)
+
+# 到位设备：关节
+RM_EVENT_DEVICE_JOINT: int = 0
+# 到位设备：夹爪
+RM_EVENT_DEVICE_GRIPPER: int = 1
+# 到位设备：灵巧手
+RM_EVENT_DEVICE_HAND: int = 2
+# 到位设备：升降机构
+RM_EVENT_DEVICE_LIFT: int = 3
+# 到位设备：扩展关节
+RM_EVENT_DEVICE_EXPAND: int = 4
+
+
+class ArmEventRouter:
+    """
+    机械臂事件路由器
+    @details 进程内唯一地注册C库事件回调，按(handle_id, device)将当前轨迹到位事件分发给等待的Future，
+    按handle_id将事件转发给对应机械臂的监听函数，并将全部事件转发给全局监听函数。
+    请使用模块级实例arm_event_router，不要自行创建。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters = {}
+        self._listeners = []
+        self._handle_listeners = {}
+        self._callback = None
+
+    def _ensure_registered(self) -> None:
+        with self._lock:
+            if self._callback is None:
+                self._callback = rm_event_callback_ptr(self._on_event)
+                rm_get_arm_event_call_back(self._callback)
+
+    def add_listener(self, listener: Callable[[rm_event_push_data_t], None]) -> None:
+        """
+        添加事件监听函数，接收所有机械臂的全部事件
+
+        Args:
+            listener (Callable[[rm_event_push_data_t], None]): 监听函数，在C库接收线程中调用
+        """
+        self._ensure_registered()
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: Callable[[rm_event_push_data_t], None]) -> None:
+        """
+        移除事件监听函数
+
+        Args:
+            listener (Callable[[rm_event_push_data_t], None]): 已添加的监听函数
+        """
+        with self._lock:
+            self._listeners = [item for item in self._listeners if item is not listener]
+
+    def add_handle_listener(self, handle_id: int, listener: Callable[[rm_event_push_data_t], None]) -> None:
+        """
+        添加指定机械臂的事件监听函数，仅接收该机械臂的事件
+
+        Args:
+            handle_id (int): 机械臂句柄id
+            listener (Callable[[rm_event_push_data_t], None]): 监听函数，在C库接收线程中调用
+        """
+        self._ensure_registered()
+        with self._lock:
+            routes = dict(self._handle_listeners)
+            routes[handle_id] = routes.get(handle_id, ()) + (listener,)
+            self._handle_listeners = routes
+
+    def remove_handle_listener(self, handle_id: int, listener: Callable[[rm_event_push_data_t], None]) -> None:
+        """
+        移除指定机械臂的事件监听函数
+
+        Args:
+            handle_id (int): 机械臂句柄id
+            listener (Callable[[rm_event_push_data_t], None]): 已添加的监听函数
+        """
+        with self._lock:
+            routes = dict(self._handle_listeners)
+            listeners = tuple(item for item in routes.get(handle_id, ()) if item is not listener)
+            if listeners:
+                routes[handle_id] = listeners
+            else:
+                routes.pop(handle_id, None)
+            self._handle_listeners = routes
+
+    def expect_arrival(self, handle_id: int, device: int = RM_EVENT_DEVICE_JOINT) -> Future:
+        """
+        等待指定机械臂、指定设备的下一次轨迹全部到位事件
+
+        Args:
+            handle_id (int): 机械臂句柄id
+            device (int, optional): 到位设备，0-关节，1-夹爪，2-灵巧手，3-升降机构，4-扩展关节. Defaults to 0.
+
+        Returns:
+            Future: 到位后结果为0（轨迹成功）或1（轨迹失败）
+        """
+        self._ensure_registered()
+        future = Future()
+        future.set_running_or_notify_cancel()
+        with self._lock:
+            self._waiters.setdefault((handle_id, device), []).append(future)
+        return future
+
+    def discard(self, handle_id: int, device: int, future: Future) -> None:
+        """
+        取消等待，用于指令发送失败等不会再产生到位事件的情况
+
+        Args:
+            handle_id (int): 机械臂句柄id
+            device (int): 到位设备
+            future (Future): expect_arrival返回的Future
+        """
+        with self._lock:
+            waiters = self._waiters.get((handle_id, device))
+            if waiters and future in waiters:
+                waiters.remove(future)
+
+    def _on_event(self, data: rm_event_push_data_t) -> None:
+        if data.event_type == rm_event_type_e.RM_CURRENT_TRAJECTORY_STATE_E and data.trajectory_connect == 0:
+            with self._lock:
+                # 新轨迹可能打断尚未到位的旧轨迹，此时旧轨迹不会单独上报，因此一次到位事件完成该设备全部等待
+                waiters = self._waiters.pop((data.handle_id, data.device), None)
+            if waiters:
+                result = 0 if data.trajectory_state else 1
+                for future in waiters:
+                    _resolve(future, result)
+        for listener in self._handle_listeners.get(data.handle_id, ()):
+            listener(data)
+        for listener in self._listeners:
+            listener(data)
+
+
+class RealtimeStateRouter:
+    """
+    机械臂实时状态路由器
+    @details 进程内唯一地注册C库UDP实时状态回调，按数据中的arm_ip、arm_port将数据转发给对应机械臂的监听函数。
+    请使用模块级实例realtime_state_router，不要自行创建。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # arm_ip -> (不限端口的监听函数, {arm_port: 监听函数})
+        self._routes = {}
+        self._listeners = ()
+        self._callback = None
+
+    def _ensure_registered(self) -> None:
+        with self._lock:
+            if self._callback is None:
+                self._callback = rm_realtime_arm_state_callback_ptr(self._on_arm_state)
+                rm_realtime_arm_state_call_back(self._callback)
+
+    def add_listener(self, listener: Callable[[rm_realtime_arm_joint_state_t], None], ip: str = None,
+                     port: int = None) -> None:
+        """
+        添加实时状态监听函数
+
+        Args:
+            listener (Callable[[rm_realtime_arm_joint_state_t], None]): 监听函数，在C库UDP接收线程中调用
+            ip (str, optional): 只接收该IP机械臂的数据，为None时接收全部数据. Defaults to None.
+            port (int, optional): 只接收arm_port为该值的数据，为None时不区分端口. Defaults to None.
+        """
+        self._ensure_registered()
+        with self._lock:
+            if ip is None:
+                self._listeners = self._listeners + (listener,)
+                return
+            routes = dict(self._routes)
+            any_port, by_port = routes.get(ip.encode('utf-8'), ((), {}))
+            if port is None:
+                any_port = any_port + (listener,)
+            else:
+                by_port = dict(by_port)
+                by_port[port] = by_port.get(port, ()) + (listener,)
+            routes[ip.encode('utf-8')] = (any_port, by_port)
+            self._routes = routes
+
+    def remove_listener(self, listener: Callable[[rm_realtime_arm_joint_state_t], None], ip: str = None,
+                        port: int = None) -> None:
+        """
+        移除实时状态监听函数
+
+        Args:
+            listener (Callable[[rm_realtime_arm_joint_state_t], None]): 已添加的监听函数
+            ip (str, optional): 添加时指定的IP. Defaults to None.
+            port (int, optional): 添加时指定的端口. Defaults to None.
+        """
+        with self._lock:
+            if ip is None:
+                self._listeners = tuple(item for item in self._listeners if item is not listener)
+                return
+            routes = dict(self._routes)
+            key = ip.encode('utf-8')
+            if key not in routes:
+                return
+            any_port, by_port = routes[key]
+            if port is None:
+                any_port = tuple(item for item in any_port if item is not listener)
+            else:
+                by_port = dict(by_port)
+                listeners = tuple(item for item in by_port.get(port, ()) if item is not listener)
+                if listeners:
+                    by_port[port] = listeners
+                else:
+                    by_port.pop(port, None)
+            if any_port or by_port:
+                routes[key] = (any_port, by_port)
+            else:
+                del routes[key]
+            self._routes = routes
+
+    def _on_arm_state(self, data: rm_realtime_arm_joint_state_t) -> None:
+        route = self._routes.get(data.arm_ip)
+        if route is not None:
+            any_port, by_port = route
+            for listener in any_port:
+                listener(data)
+            if by_port:
+                for listener in by_port.get(data.arm_port, ()):
+                    listener(data)
+        for listener in self._listeners:
+            listener(data)
+
+
+def _resolve(future: Future, result: int) -> None:
+    # 到位事件与指令返回可能同时尝试完成同一个Future，以先完成者为准
+    try:
+        future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+# 进程内唯一的事件路由器
+arm_event_router = ArmEventRouter()
+# 进程内唯一的实时状态路由器
+realtime_state_router = RealtimeStateRouter()
+
+
+def rm_send_with_arrival(handle_id: int, send: Callable[[], int], device: int = RM_EVENT_DEVICE_JOINT,
+                         connect: int = 0) -> Future:
+    """
+    以非阻塞方式发送运动指令，并返回在到位事件中完成的Future
+
+    Args:
+        handle_id (int): 机械臂句柄id
+        send (Callable[[], int]): 以非阻塞模式发送指令的函数，返回指令状态码
+        device (int, optional): 到位设备. Defaults to 0.
+        connect (int, optional): 轨迹连接标志，为1时轨迹不会立即执行，Future在指令发送后即完成. Defaults to 0.
+
+    Returns:
+        Future: 结果与阻塞模式下接口返回值一致，指令发送失败时为对应错误码，到位后为0或1
+    """
+    future = arm_event_router.expect_arrival(handle_id, device)
+    try:
+        tag = send()
+    except BaseException:
+        arm_event_router.discard(handle_id, device, future)
+        raise
+    if tag != 0 or connect:
+        arm_event_router.discard(handle_id, device, future)
+        _resolve(future, tag)
+    return future
@@ -0,0 +1,217 @@
+"""
+@brief 多机械臂集群管理
+
+@details
+RoboticArm.rm_create_robot_arm逐台同步建立连接，大量机械臂上线耗时随数量线性增长。
+此模块提供RoboticArmFleet类，并行连接一组机械臂并缓存每台机械臂的基本信息、自由度及控制器版本，
+支持健康检查与断线自动重连，并可将同一接口调用并行分发到全部机械臂，全部返回后一次性汇总结果。
+
+**注意**
+- 集群内的机械臂共用进程级线程模式，由第一次创建时的mode决定。
+- 重连后机械臂句柄id会变化，按句柄id添加的事件监听函数需重新添加。
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .rm_ctypes_wrap import rm_thread_mode_e
+from .rm_robot_interface import RoboticArm
+
+
+class RoboticArmFleet:
+    """
+    多机械臂集群
+    @details 以(ip, port)标识集群中的机械臂，例如：
+
+        with RoboticArmFleet([("192.168.1.18", 8080), ("192.168.1.19", 8080)]) as fleet:
+            fleet.connect()
+            states = fleet.call('rm_get_current_arm_state')
+
+    **Attributes**:
+        - addresses (list[tuple[str, int]]): 集群中机械臂的(ip, port)列表
+    """
+
+    def __init__(self, addresses: list[tuple[str, int]], mode: rm_thread_mode_e = rm_thread_mode_e.RM_TRIPLE_MODE_E,
+                 max_workers: int = 16, level: int = 3):
+        """
+        Args:
+            addresses (list[tuple[str, int]]): 机械臂(ip, port)列表
+            mode (rm_thread_mode_e, optional): 线程模式. Defaults to RM_TRIPLE_MODE_E.
+            max_workers (int, optional): 并行连接及并行调用的线程数. Defaults to 16.
+            level (int, optional): 日志打印等级，同rm_create_robot_arm. Defaults to 3.
+        """
+        self.addresses = [(ip, port) for ip, port in addresses]
+        self._level = level
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='rm_fleet')
+        # 只需初始化一次线程模式，其余机械臂对象不再重复调用rm_init
+        self._arms = {}
+        for index, address in enumerate(self.addresses):
+            self._arms[address] = RoboticArm(mode) if index == 0 else RoboticArm()
+        self._locks = {address: threading.RLock() for address in self.addresses}
+        self._info = {}
+        self._connected = set()
+        self._monitor = None
+        self._monitor_stop = threading.Event()
+
+    def __getitem__(self, address: tuple[str, int]) -> RoboticArm:
+        return self._arms[address]
+
+    def __iter__(self):
+        return iter(self.addresses)
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def _connect_one(self, address: tuple[str, int]) -> int:
+        arm = self._arms[address]
+        with self._locks[address]:
+            if address in self._connected:
+                self._connected.discard(address)
+                arm.rm_delete_robot_arm()
+            self._info.pop(address, None)
+            try:
+                handle_id = arm.rm_create_robot_arm(address[0], address[1], self._level).id
+            except ValueError:
+                # 已达到C库可创建的机械臂数量上限时返回空句柄
+                return -1
+            if handle_id == -1:
+                # 连接失败的句柄同样占用C库中的机械臂数量，需删除
+                arm.rm_delete_robot_arm()
+                return -1
+            self._connected.add(address)
+            # 复用rm_create_robot_arm已读取的基本信息，不再向控制器查询
+            if arm._robot_info is not None:
+                self._info[address] = arm._robot_info
+            return handle_id
+
+    def connect(self) -> dict[tuple[str, int], int]:
+        """
+        并行连接全部机械臂，已连接的机械臂会断开后重新连接
+
+        Returns:
+            dict[tuple[str, int], int]: 每台机械臂的句柄id，-1表示连接失败
+        """
+        futures = {address: self._executor.submit(self._connect_one, address) for address in self.addresses}
+        return {address: future.result() for address, future in futures.items()}
+
+    def connected(self, address: tuple[str, int]) -> bool:
+        """
+        查询机械臂是否已建立连接
+
+        Args:
+            address (tuple[str, int]): 机械臂(ip, port)
+
+        Returns:
+            bool: 已创建有效句柄时为True
+        """
+        return address in self._connected
+
+    def info(self, address: tuple[str, int]) -> dict[str, any]:
+        """
+        获取连接时缓存的机械臂基本信息
+
+        Args:
+            address (tuple[str, int]): 机械臂(ip, port)
+
+        Returns:
+            dict[str, any]: 同RoboticArm.rm_get_robot_info返回的字典，包含arm_dof、arm_model、force_type、
+                robot_controller_version，未连接成功时为None
+        """
+        return self._info.get(address)
+
+    def call(self, method: str, *args, **kwargs) -> dict[tuple[str, int], any]:
+        """
+        在全部已连接的机械臂上并行调用同一接口，全部返回后汇总
+
+        Args:
+            method (str): RoboticArm的接口名称，如'rm_get_current_arm_state'
+            *args: 接口参数
+            **kwargs: 接口关键字参数
+
+        Returns:
+            dict[tuple[str, int], any]: 每台已连接机械臂的接口返回值，调用抛出异常时值为该异常对象
+        """
+        def invoke(address):
+            with self._locks[address]:
+                return getattr(self._arms[address], method)(*args, **kwargs)
+
+        futures = {address: self._executor.submit(invoke, address)
+                   for address in self.addresses if self.connected(address)}
+        results = {}
+        for address, future in futures.items():
+            error = future.exception()
+            results[address] = error if error is not None else future.result()
+        return results
+
+    def rm_get_current_arm_state(self) -> dict[tuple[str, int], tuple[int, dict[str, any]]]:
+        """
+        并行获取全部机械臂当前状态
+
+        Returns:
+            dict[tuple[str, int], tuple[int, dict[str, any]]]: 每台已连接机械臂的RoboticArm.rm_get_current_arm_state返回值
+        """
+        return self.call('rm_get_current_arm_state')
+
+    def check_health(self, reconnect: bool = True) -> dict[tuple[str, int], bool]:
+        """
+        并行检查全部机械臂的通信状态
+
+        Args:
+            reconnect (bool, optional): 是否重新连接检查失败或尚未连接的机械臂. Defaults to True.
+
+        Returns:
+            dict[tuple[str, int], bool]: 每台机械臂是否可正常通信（含重连后恢复的机械臂）
+        """
+        def probe(address):
+            if self.connected(address):
+                with self._locks[address]:
+                    if self._arms[address].rm_get_current_arm_state()[0] == 0:
+                        return True
+            if reconnect and self._connect_one(address) != -1:
+                with self._locks[address]:
+                    return self._arms[address].rm_get_current_arm_state()[0] == 0
+            return False
+
+        futures = {address: self._executor.submit(probe, address) for address in self.addresses}
+        return {address: future.result() for address, future in futures.items()}
+
+    def start_health_monitor(self, interval: float = 5.0) -> None:
+        """
+        启动后台健康检查线程，按周期检查全部机械臂并自动重连
+
+        Args:
+            interval (float, optional): 检查周期，单位：s. Defaults to 5.0.
+        """
+        if self._monitor is not None:
+            return
+        self._monitor_stop.clear()
+
+        def run():
+            while not self._monitor_stop.wait(interval):
+                self.check_health(reconnect=True)
+
+        self._monitor = threading.Thread(target=run, name='rm_fleet_health', daemon=True)
+        self._monitor.start()
+
+    def stop_health_monitor(self) -> None:
+        """停止后台健康检查线程"""
+        if self._monitor is not None:
+            self._monitor_stop.set()
+            self._monitor.join()
+            self._monitor = None
+
+    def close(self) -> None:
+        """停止健康检查，断开全部机械臂连接并关闭线程池"""
+        self.stop_health_monitor()
+        for address in self.addresses:
+            with self._locks[address]:
+                if address in self._connected:
+                    self._connected.discard(address)
+                    self._arms[address].rm_delete_robot_arm()
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,362 @@
+"""
+@brief 接口调用统计
+
+@details
+排查负载下偶发的-2（接收超时）等问题时，需要知道每个接口在每台机械臂上的调用次数、状态码分布及耗时分布。
+此模块提供ArmInstrumentation类，由RoboticArm.rm_enable_instrumentation启用后包装该机械臂对象的全部rm_*接口，
+按(句柄id, 接口名称)记录：
+    - 调用次数及抛出异常的次数
+    - 状态码分布，状态码取自返回值本身、返回元组的第一个元素或返回字典的return_code
+    - 耗时直方图LatencyHistogram，按对数分段、段内线性分桶，相对误差固定，适合同时统计微秒级与秒级耗时
+并可添加钩子函数，在每次调用后接收调用记录，用于对接外部监控系统。
+
+**注意**
+- 钩子函数在调用接口的线程中同步执行，耗时较长的处理请放入队列（如CallbackDispatcher）异步进行。
+- 接口内部调用其他rm_*接口时，内外两层调用均会被记录。
+"""
+
+import functools
+import threading
+import time
+from typing import Callable
+
+# 无状态码或抛出异常的调用在状态码分布中的键
+RM_METRICS_NO_CODE = None
+
+
+class LatencyHistogram:
+    """
+    耗时直方图
+    @details 小于2^significant_bits的值逐纳秒分桶，更大的值按2的幂分段，每段再等分为2^(significant_bits-1)个桶，
+    任意值所在桶的宽度不超过其值的1/2^(significant_bits-1)。
+
+    **Attributes**:
+        - significant_bits (int): 每段的精度位数
+        - count (int): 记录的值的个数
+        - total (int): 记录的值之和，单位：ns
+        - min (int): 最小值，单位：ns，无记录时为0
+        - max (int): 最大值，单位：ns
+    """
+
+    def __init__(self, significant_bits: int = 7):
+        """
+        Args:
+            significant_bits (int, optional): 每段的精度位数，默认7位即相对误差不超过1/64. Defaults to 7.
+        """
+        if significant_bits < 2:
+            raise ValueError("significant_bits must be at least 2")
+        self.significant_bits = significant_bits
+        self._full = 1 << significant_bits
+        self._half = 1 << (significant_bits - 1)
+        self._counts = []
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._full:
+            return value
+        shift = value.bit_length() - self.significant_bits
+        return self._full + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        if index < self._full:
+            return index, index
+        shift, offset = divmod(index - self._full, self._half)
+        shift += 1
+        low = (offset + self._half) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value: int) -> None:
+        """
+        记录一个值
+
+        Args:
+            value (int): 耗时，单位：ns，负值按0记录
+        """
+        if value < 0:
+            value = 0
+        index = self._index(value)
+        counts = self._counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """
+        合并另一个精度位数相同的直方图
+
+        Args:
+            other (LatencyHistogram): 被合并的直方图
+        """
+        if other.significant_bits != self.significant_bits:
+            raise ValueError("cannot merge histograms with different significant_bits")
+        if other.count == 0:
+            return
+        counts = self._counts
+        if len(other._counts) > len(counts):
+            counts.extend([0] * (len(other._counts) - len(counts)))
+        for index, value in enumerate(other._counts):
+            counts[index] += value
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, q: float) -> int:
+        """
+        计算分位数
+
+        Args:
+            q (float): 分位，范围：0~100
+
+        Returns:
+            int: 分位数所在桶的上界（不超过最大值），单位：ns，无记录时为0
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, round(q / 100 * self.count))
+        seen = 0
+        for index, value in enumerate(self._counts):
+            seen += value
+            if seen >= rank:
+                return min(self._bounds(index)[1], self.max)
+        return self.max
+
+    def buckets(self) -> list[tuple[int, int, int]]:
+        """
+        获取非空的桶
+
+        Returns:
+            list[tuple[int, int, int]]: 每个非空桶的(下界, 上界, 个数)，单位：ns
+        """
+        return [self._bounds(index) + (value,) for index, value in enumerate(self._counts) if value]
+
+    def summary(self) -> dict[str, float]:
+        """
+        获取统计摘要
+
+        Returns:
+            dict[str, float]: 包含以下键的字典，时间单位：us
+                - 'count' (int): 记录的值的个数
+                - 'min_us'、'mean_us'、'max_us' (float): 最小值、均值、最大值
+                - 'p50_us'、'p90_us'、'p99_us'、'p999_us' (float): 50、90、99、99.9分位数
+        """
+        mean = self.total / self.count if self.count else 0.0
+        result = {'count': self.count, 'min_us': self.min / 1e3, 'mean_us': mean / 1e3, 'max_us': self.max / 1e3}
+        for name, q in (('p50_us', 50), ('p90_us', 90), ('p99_us', 99), ('p999_us', 99.9)):
+            result[name] = self.percentile(q) / 1e3
+        return result
+
+
+class MethodMetrics:
+    """
+    单个接口在单台机械臂上的调用统计
+
+    **Attributes**:
+        - handle_id (int): 机械臂句柄id，未连接时为-1
+        - method (str): 接口名称
+        - count (int): 调用次数
+        - exceptions (int): 抛出异常的次数
+        - codes (dict[int, int]): 状态码及其出现次数，无状态码或抛出异常的调用记为RM_METRICS_NO_CODE
+        - latency (LatencyHistogram): 耗时直方图
+    """
+
+    def __init__(self, handle_id: int, method: str, significant_bits: int = 7):
+        self.handle_id = handle_id
+        self.method = method
+        self.count = 0
+        self.exceptions = 0
+        self.codes = {}
+        self.latency = LatencyHistogram(significant_bits)
+
+    def to_dict(self) -> dict[str, any]:
+        """
+        转换为可序列化的字典
+
+        Returns:
+            dict[str, any]: 包含handle_id、method、count、exceptions、codes（键为状态码字符串，无状态码时为'none'）
+                及latency（LatencyHistogram.summary的返回值）
+        """
+        return {'handle_id': self.handle_id, 'method': self.method, 'count': self.count,
+                'exceptions': self.exceptions,
+                'codes': {('none' if code is None else str(code)): value for code, value in self.codes.items()},
+                'latency': self.latency.summary()}
+
+
+def _status_code(result) -> int:
+    cls = result.__class__
+    if cls is int:
+        return result
+    if cls is tuple and result and result[0].__class__ is int:
+        return result[0]
+    if cls is dict:
+        code = result.get('return_code')
+        if code.__class__ is int:
+            return code
+    return RM_METRICS_NO_CODE
+
+
+class ArmInstrumentation:
+    """
+    接口调用统计
+    @details 多个机械臂对象可共用同一个统计对象，数据按句柄id区分，例如：
+
+        metrics = ArmInstrumentation()
+        metrics.add_hook(lambda method, handle_id, code, latency_ns: ...)
+        arm.rm_enable_instrumentation(metrics)
+        ...
+        print(metrics.snapshot())
+    """
+
+    def __init__(self, significant_bits: int = 7):
+        """
+        Args:
+            significant_bits (int, optional): 耗时直方图的精度位数. Defaults to 7.
+        """
+        self.significant_bits = significant_bits
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self._hooks = ()
+
+    def add_hook(self, hook: Callable[[str, int, int, int], None]) -> None:
+        """
+        添加钩子函数，每次调用结束后在调用线程中执行
+
+        Args:
+            hook (Callable[[str, int, int, int], None]): 钩子函数，参数依次为接口名称、句柄id、状态码（无状态码或抛出异常时为None）、
+                耗时（单位：ns），钩子抛出的异常会被忽略
+        """
+        with self._lock:
+            self._hooks = self._hooks + (hook,)
+
+    def remove_hook(self, hook: Callable[[str, int, int, int], None]) -> None:
+        """
+        移除钩子函数
+
+        Args:
+            hook (Callable[[str, int, int, int], None]): 已添加的钩子函数
+        """
+        with self._lock:
+            hooks = list(self._hooks)
+            if hook in hooks:
+                hooks.remove(hook)
+            self._hooks = tuple(hooks)
+
+    def record(self, method: str, handle_id: int, code: int, latency_ns: int, exception: bool = False) -> None:
+        """
+        记录一次调用，通常由包装后的接口调用
+
+        Args:
+            method (str): 接口名称
+            handle_id (int): 机械臂句柄id
+            code (int): 状态码，无状态码时为None
+            latency_ns (int): 耗时，单位：ns
+            exception (bool, optional): 调用是否抛出异常. Defaults to False.
+        """
+        key = (handle_id, method)
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = MethodMetrics(handle_id, method, self.significant_bits)
+            metrics.count += 1
+            if exception:
+                metrics.exceptions += 1
+            metrics.codes[code] = metrics.codes.get(code, 0) + 1
+            metrics.latency.record(latency_ns)
+            hooks = self._hooks
+        for hook in hooks:
+            try:
+                hook(method, handle_id, code, latency_ns)
+            except Exception:
+                pass
+
+    def metrics(self, method: str = None, handle_id: int = None) -> list[MethodMetrics]:
+        """
+        获取统计数据的副本
+
+        Args:
+            method (str, optional): 仅返回该接口的统计，为None时返回全部接口. Defaults to None.
+            handle_id (int, optional): 仅返回该句柄的统计，为None时返回全部句柄. Defaults to None.
+
+        Returns:
+            list[MethodMetrics]: 按句柄id、接口名称排序的统计数据
+        """
+        result = []
+        with self._lock:
+            for (key_handle, key_method), metrics in sorted(self._metrics.items()):
+                if (method is None or key_method == method) and (handle_id is None or key_handle == handle_id):
+                    copy = MethodMetrics(key_handle, key_method, self.significant_bits)
+                    copy.count = metrics.count
+                    copy.exceptions = metrics.exceptions
+                    copy.codes = dict(metrics.codes)
+                    copy.latency.merge(metrics.latency)
+                    result.append(copy)
+        return result
+
+    def snapshot(self, by_handle: bool = True) -> list[dict[str, any]]:
+        """
+        获取可序列化的统计快照，可定期调用并导出到监控系统
+
+        Args:
+            by_handle (bool, optional): True-按(句柄id, 接口名称)分别统计，False-合并全部句柄，handle_id为-1. Defaults to True.
+
+        Returns:
+            list[dict[str, any]]: 每项为MethodMetrics.to_dict的返回值
+        """
+        metrics = self.metrics()
+        if not by_handle:
+            merged = {}
+            for item in metrics:
+                total = merged.get(item.method)
+                if total is None:
+                    total = merged[item.method] = MethodMetrics(-1, item.method, self.significant_bits)
+                total.count += item.count
+                total.exceptions += item.exceptions
+                for code, value in item.codes.items():
+                    total.codes[code] = total.codes.get(code, 0) + value
+                total.latency.merge(item.latency)
+            metrics = [merged[method] for method in sorted(merged)]
+        return [item.to_dict() for item in metrics]
+
+    def reset(self) -> None:
+        """清空全部统计数据，钩子函数保留"""
+        with self._lock:
+            self._metrics = {}
+
+    def wrap(self, method: str, function: Callable, handle_id: Callable[[], int]) -> Callable:
+        """
+        包装一个接口，调用时记录耗时及状态码
+
+        Args:
+            method (str): 接口名称
+            function (Callable): 被包装的函数
+            handle_id (Callable[[], int]): 调用结束后获取句柄id的函数
+
+        Returns:
+            Callable: 包装后的函数
+        """
+        clock = time.perf_counter_ns
+        record = self.record
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            begin = clock()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                elapsed = clock() - begin
+                record(method, handle_id(), RM_METRICS_NO_CODE, elapsed, True)
+                raise
+            elapsed = clock() - begin
+            record(method, handle_id(), _status_code(result), elapsed)
+            return result
+
+        return wrapper
@@ -0,0 +1,499 @@
+"""
+@brief 本地模拟控制器
+
+@details
+C库通过TCP以JSON指令与控制器通信，并通过UDP接收控制器的实时状态推送。此模块提供MockArmController类，
+在本机端口上模拟一台第四代控制器，RoboticArm可直接以127.0.0.1连接，用于在没有实体机械臂的环境中
+测量接口吞吐、延迟及多机械臂集群负载。已模拟的指令包括：
+    - 连接时的信息同步：软件版本、坐标系、安装角度、关节限位、DH参数、实时推送配置
+    - 状态查询：关节角度、机械臂状态、关节温度/电流/电压、全部状态
+    - 运动指令：movej、movel、movej_p、moves的应答及到位事件，movej_canfd、movej_follow透传，急停、暂停
+    - IO：数字IO输出设置及输入、输出状态查询
+    - Modbus：第四代控制器的Modbus RTU、Modbus TCP读写，寄存器与线圈数据保存在内存中
+    - 全局路点：新增、更新、删除、查询及分页列表
+    - UDP实时状态推送，周期由rm_set_realtime_push配置
+
+**注意**
+- 模拟控制器只回显指令中的目标值，不进行运动学计算及轨迹插补，movej后的位姿、movel后的关节角度保持不变。
+- 未模拟的指令及参数无法解析的指令不应答，C库接口将返回-2（接收超时）。
+- 多台模拟控制器可监听同一IP的不同端口，UDP推送以与TCP相同的端口号发出，以便C库按IP及端口区分机械臂。
+- C库单进程最多同时连接5台机械臂，50台以上的集群负载测试需在多个进程中分别连接，模拟控制器本身无此限制。
+"""
+
+import json
+import socket
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+
+# 控制器上报数据的倍率：关节角度、温度、电流、电压为0.001，位置为0.000001m，欧拉角为0.001rad
+_SCALE_JOINT = 1000
+_SCALE_POSITION = 1000000
+_SCALE_EULER = 1000
+
+# RM65的DH参数，格式同Algo.rm_algo_get_dh返回值
+_RM65_DH = {'d': [0.2405, 0.0, 0.0, 0.21, 0.0, 0.144], 'a': [0.0, 0.0, 0.256, 0.0, 0.0, 0.0],
+            'alpha': [0.0, 90.0, 0.0, 90.0, -90.0, 90.0], 'offset': [0.0, 90.0, 90.0, 0.0, 0.0, 0.0]}
+
+
+class _MockConnection(socketserver.BaseRequestHandler):
+    """单个TCP连接，按行接收JSON指令并交由所属控制器处理"""
+
+    def setup(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._send_lock = threading.Lock()
+
+    def send(self, message: dict) -> None:
+        data = json.dumps(message, separators=(',', ':')).encode() + b'\r\n'
+        with self._send_lock:
+            try:
+                self.request.sendall(data)
+            except OSError:
+                pass
+
+    def handle(self):
+        controller = self.server.controller
+        buffer = b''
+        while True:
+            try:
+                data = self.request.recv(65536)
+            except OSError:
+                return
+            if not data:
+                return
+            buffer += data
+            while b'\r\n' in buffer:
+                line, buffer = buffer.split(b'\r\n', 1)
+                if line:
+                    controller._handle(self, line)
+
+
+class _MockServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class MockArmController:
+    """
+    模拟控制器
+    @details 每个实例监听一个TCP端口，可同时接受多个连接，例如：
+
+        with MockArmController(port=18080) as controller:
+            arm = RoboticArm(rm_thread_mode_e.RM_TRIPLE_MODE_E)
+            handle = arm.rm_create_robot_arm("127.0.0.1", controller.port)
+
+    **Attributes**:
+        - host (str): 监听IP
+        - port (int): 监听端口，创建时为0则在start后为系统分配的端口
+        - arm_dof (int): 机械臂自由度
+        - move_time (float): 运动指令应答后发送到位事件的延时，单位：s
+        - joint (list[float]): 当前关节角度，单位：°
+        - pose (list[float]): 当前位姿[x,y,z,rx,ry,rz]，单位：m、rad
+        - requests (int): 已处理的指令数
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8080, product: str = 'RM65-B', arm_dof: int = 6,
+                 move_time: float = 0.0, dh: dict[str, list[float]] = None):
+        """
+        Args:
+            host (str, optional): 监听IP. Defaults to '127.0.0.1'.
+            port (int, optional): 监听端口，为0时由系统分配. Defaults to 8080.
+            product (str, optional): 上报的产品型号，C库据此识别机械臂型号及传感器类型. Defaults to 'RM65-B'.
+            arm_dof (int, optional): 机械臂自由度，需与product一致. Defaults to 6.
+            move_time (float, optional): 运动指令应答后发送到位事件的延时，单位：s. Defaults to 0.0.
+            dh (dict[str, list[float]], optional): 上报的DH参数，格式同Algo.rm_algo_get_dh返回值，为None时使用RM65的DH参数.
+                连接时C库会以此设置进程内的算法DH参数. Defaults to None.
+        """
+        self.host = host
+        self.port = port
+        self.product = product
+        self.arm_dof = arm_dof
+        self.move_time = move_time
+        self.dh = dh or _RM65_DH
+        self.joint = [0.0] * arm_dof
+        self.pose = [0.0] * 6
+        self.requests = 0
+        self.digital_output = [0] * 4
+        self.digital_input = [0] * 4
+        self.io_mode = [0] * 4
+        # Modbus数据区，键为(数据区名称, 从站地址, 寄存器地址)
+        self.modbus = {}
+        self.waypoints = OrderedDict()
+        self.push_config = {'cycle': 1, 'enable': False, 'port': 8089, 'ip': '', 'force_coordinate': -1,
+                            'custom': {'expand_state': False, 'lift_state': False, 'joint_speed': False,
+                                       'arm_current_status': False, 'aloha_state': False, 'hand': False,
+                                       'rm_plus_base': False, 'rm_plus_state': False}}
+        self._lock = threading.Lock()
+        self._server = None
+        self._threads = []
+        self._udp = None
+        self._push_changed = threading.Event()
+        self._stop = threading.Event()
+
+    def start(self) -> 'MockArmController':
+        """
+        开始监听，TCP服务与UDP推送均在后台线程中运行
+
+        Returns:
+            MockArmController: 控制器自身
+        """
+        self._stop.clear()
+        self._server = _MockServer((self.host, self.port), _MockConnection)
+        self._server.controller = self
+        self.port = self._server.server_address[1]
+        self._udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._udp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._udp.bind((self.host, self.port))
+        self._threads = [threading.Thread(target=self._server.serve_forever, name='rm_mock_tcp', daemon=True),
+                         threading.Thread(target=self._push_loop, name='rm_mock_udp', daemon=True)]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止监听并关闭全部连接"""
+        if self._server is None:
+            return
+        self._stop.set()
+        self._push_changed.set()
+        self._server.shutdown()
+        self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._udp.close()
+        self._server = None
+        self._threads = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _handle(self, connection: _MockConnection, line: bytes) -> None:
+        try:
+            request = json.loads(line)
+            command = request['command']
+        except (ValueError, KeyError, TypeError):
+            return
+        handler = getattr(self, '_cmd_' + command, None)
+        if handler is None:
+            return
+        with self._lock:
+            self.requests += 1
+            try:
+                response = handler(request)
+            except (KeyError, IndexError, TypeError, ValueError):
+                # 参数不完整或越界时按控制器返回失败处理，连接保持
+                return
+        if response is not None:
+            connection.send(response)
+        if command in ('movej', 'movel', 'movej_p', 'moves') and request.get('trajectory_connect', 0) == 0:
+            arrival = {'state': 'current_trajectory_state', 'trajectory_state': True, 'device': 0,
+                       'trajectory_connect': 0}
+            if self.move_time > 0:
+                timer = threading.Timer(self.move_time, connection.send, (arrival,))
+                timer.daemon = True
+                timer.start()
+            else:
+                connection.send(arrival)
+
+    def _joint_data(self) -> list[int]:
+        return [round(value * _SCALE_JOINT) for value in self.joint]
+
+    def _pose_data(self) -> list[int]:
+        return [round(value * _SCALE_POSITION) for value in self.pose[:3]] + \
+            [round(value * _SCALE_EULER) for value in self.pose[3:]]
+
+    # 连接时的信息同步
+
+    def _cmd_get_arm_software_info(self, request):
+        module = {'version': '1.0.0', 'build_time': '2024-01-01 00:00:00', 'commit_id': 'mock'}
+        return {'command': 'arm_software_info', 'Product_version': self.product, 'robot_controller_version': '4.0',
+                'algorithm_info': {'version': '1.0.0'}, 'ctrl_info': module, 'dynamic_info': {'model_version': '1'},
+                'plan_info': module, 'program_info': module, 'communication_info': module}
+
+    def _cmd_get_arm_current_trajectory(self, request):
+        return {'command': 'arm_current_trajectory', 'type': 'none', 'data': [0] * self.arm_dof}
+
+    def _cmd_get_current_work_frame(self, request):
+        return {'command': 'current_work_frame', 'frame_name': 'World', 'pose': [0] * 6}
+
+    def _cmd_get_current_tool_frame(self, request):
+        return {'command': 'current_tool_frame', 'tool_name': 'Arm_Tip', 'pose': [0] * 6, 'payload': 0,
+                'position': [0] * 3}
+
+    def _cmd_get_install_pose(self, request):
+        return {'command': 'install_pose', 'pose': [0, 0, 0]}
+
+    def _cmd_get_joint_min_pos(self, request):
+        return {'command': 'joint_min_pos', 'min_pos': [-178 * _SCALE_JOINT] * self.arm_dof}
+
+    def _cmd_get_joint_max_pos(self, request):
+        return {'command': 'joint_max_pos', 'max_pos': [178 * _SCALE_JOINT] * self.arm_dof}
+
+    def _cmd_get_joint_max_speed(self, request):
+        return {'command': 'joint_max_speed', 'joint_speed': [180 * _SCALE_JOINT] * self.arm_dof}
+
+    def _cmd_get_joint_max_acc(self, request):
+        return {'command': 'joint_max_acc', 'joint_acc': [600 * _SCALE_JOINT] * self.arm_dof}
+
+    def _cmd_get_DH_data(self, request):
+        response = {'command': 'get_DH_data'}
+        dh = self.dh
+        for i in range(self.arm_dof):
+            response['joint_%d' % (i + 1)] = [round(dh['alpha'][i] * _SCALE_JOINT), round(dh['a'][i] * _SCALE_POSITION),
+                                              round(dh['d'][i] * _SCALE_POSITION),
+                                              round(dh['offset'][i] * _SCALE_JOINT)]
+        return response
+
+    def _cmd_get_realtime_push(self, request):
+        return dict(self.push_config, command='get_realtime_push')
+
+    def _cmd_set_realtime_push(self, request):
+        for key in ('cycle', 'enable', 'port', 'ip', 'force_coordinate'):
+            if key in request:
+                self.push_config[key] = request[key]
+        self.push_config['custom'].update(request.get('custom', {}))
+        self._push_changed.set()
+        return {'command': 'set_realtime_push', 'state': True}
+
+    # 状态查询
+
+    def _cmd_get_joint_degree(self, request):
+        return {'command': 'joint_degree', 'joint': self._joint_data()}
+
+    def _cmd_get_current_arm_state(self, request):
+        return {'command': 'current_arm_state',
+                'arm_state': {'joint': self._joint_data(), 'pose': self._pose_data(), 'err': [0]}}
+
+    def _cmd_get_current_joint_temperature(self, request):
+        return {'command': 'current_joint_temperature', 'joint_temperature': [30 * _SCALE_JOINT] * self.arm_dof}
+
+    def _cmd_get_current_joint_current(self, request):
+        return {'command': 'current_joint_current', 'joint_current': [100 * _SCALE_JOINT] * self.arm_dof}
+
+    def _cmd_get_current_joint_voltage(self, request):
+        return {'command': 'current_joint_voltage', 'joint_voltage': [48 * _SCALE_JOINT] * self.arm_dof}
+
+    def _cmd_get_arm_all_state(self, request):
+        return {'command': 'arm_all_state',
+                'all_state': {'temperature': [30 * _SCALE_JOINT] * self.arm_dof,
+                              'current': [100 * _SCALE_JOINT] * self.arm_dof,
+                              'voltage': [48 * _SCALE_JOINT] * self.arm_dof,
+                              'err_flag': [0] * self.arm_dof, 'en_flag': [1] * self.arm_dof, 'err': [0]}}
+
+    # 运动指令
+
+    def _cmd_movej(self, request):
+        self.joint = [value / _SCALE_JOINT for value in request['joint'][:self.arm_dof]]
+        return {'command': 'movej', 'receive_state': True}
+
+    def _move_pose(self, request):
+        pose = request['pose']
+        self.pose = [value / _SCALE_POSITION for value in pose[:3]] + [value / _SCALE_EULER for value in pose[3:6]]
+        return {'command': request['command'], 'receive_state': True}
+
+    _cmd_movel = _move_pose
+    _cmd_movej_p = _move_pose
+    _cmd_moves = _move_pose
+
+    def _cmd_movej_canfd(self, request):
+        self.joint = [value / _SCALE_JOINT for value in request['joint'][:self.arm_dof]]
+
+    _cmd_movej_follow = _cmd_movej_canfd
+
+    def _cmd_set_arm_stop(self, request):
+        return {'command': 'set_arm_stop', 'arm_stop': True}
+
+    def _cmd_set_arm_pause(self, request):
+        return {'command': 'set_arm_pause', 'arm_pause': True}
+
+    # IO
+
+    def _cmd_set_DO_state(self, request):
+        self.digital_output[request['IO_Num'] - 1] = request['state']
+        return {'command': 'set_DO_state', 'set_state': True}
+
+    def _cmd_get_IO_state(self, request):
+        index = request['IO_Num'] - 1
+        state = self.digital_output[index] if self.io_mode[index] == 1 else self.digital_input[index]
+        return {'command': 'IO_state', 'IO_state': state, 'IO_Mode': self.io_mode[index]}
+
+    def _cmd_get_IO_input(self, request):
+        return {'command': 'IO_input_state',
+                'DI': [self.digital_input[i] if self.io_mode[i] != 1 else -1 for i in range(4)]}
+
+    def _cmd_get_IO_output(self, request):
+        return {'command': 'IO_output_state',
+                'DO': [self.digital_output[i] if self.io_mode[i] == 1 else -1 for i in range(4)]}
+
+    def _cmd_set_IO_mode(self, request):
+        self.io_mode[request['IO_Num'] - 1] = request['IO_mode']
+        return {'command': 'set_IO_mode', 'set_state': True}
+
+    # Modbus
+
+    def _modbus_read(self, area: str, device, request):
+        address = request['address']
+        data = [self.modbus.get((area, device, address + i), 0) for i in range(request.get('num', 1))]
+        return self._modbus_echo({'command': request['command'], 'read_state': True, 'data': data}, request)
+
+    def _modbus_write(self, area: str, device, request):
+        data = request['data'] if isinstance(request['data'], list) else [request['data']]
+        for i, value in enumerate(data):
+            self.modbus[(area, device, request['address'] + i)] = value
+        return self._modbus_echo({'command': request['command'], 'write_state': True}, request)
+
+    @staticmethod
+    def _modbus_echo(response: dict, request: dict) -> dict:
+        # Modbus TCP应答需带回主站名称或IP、端口，C库据此校验应答
+        for key in ('master_name', 'ip', 'port'):
+            if key in request:
+                response[key] = request[key]
+        return response
+
+    def _cmd_read_modbus_rtu_coils(self, request):
+        return self._modbus_read('coils', request['device'], request)
+
+    def _cmd_read_modbus_rtu_input_status(self, request):
+        return self._modbus_read('input_status', request['device'], request)
+
+    def _cmd_read_modbus_rtu_holding_registers(self, request):
+        return self._modbus_read('holding_registers', request['device'], request)
+
+    def _cmd_read_modbus_rtu_input_registers(self, request):
+        return self._modbus_read('input_registers', request['device'], request)
+
+    def _cmd_write_modbus_rtu_coils(self, request):
+        return self._modbus_write('coils', request['device'], request)
+
+    def _cmd_write_modbus_rtu_registers(self, request):
+        return self._modbus_write('holding_registers', request['device'], request)
+
+    @staticmethod
+    def _tcp_device(request):
+        return request.get('master_name') or '%s:%s' % (request.get('ip'), request.get('port'))
+
+    def _cmd_read_modbus_tcp_coils(self, request):
+        return self._modbus_read('coils', self._tcp_device(request), request)
+
+    def _cmd_read_modbus_tcp_input_status(self, request):
+        return self._modbus_read('input_status', self._tcp_device(request), request)
+
+    def _cmd_read_modbus_tcp_holding_registers(self, request):
+        return self._modbus_read('holding_registers', self._tcp_device(request), request)
+
+    def _cmd_read_modbus_tcp_input_registers(self, request):
+        return self._modbus_read('input_registers', self._tcp_device(request), request)
+
+    def _cmd_write_modbus_tcp_coils(self, request):
+        return self._modbus_write('coils', self._tcp_device(request), request)
+
+    def _cmd_write_modbus_tcp_registers(self, request):
+        return self._modbus_write('holding_registers', self._tcp_device(request), request)
+
+    # 全局路点
+
+    def _cmd_add_global_waypoint(self, request):
+        name = request['point_name']
+        if name in self.waypoints:
+            return {'command': 'add_global_waypoint', 'add_state': False}
+        self.waypoints[name] = {key: request.get(key) for key in
+                                ('point_name', 'joint', 'pose', 'work_frame', 'tool_frame', 'time')}
+        return {'command': 'add_global_waypoint', 'add_state': True}
+
+    def _cmd_update_global_waypoint(self, request):
+        name = request['point_name']
+        if name not in self.waypoints:
+            return {'command': 'update_global_waypoint', 'update_state': False}
+        self.waypoints[name].update({key: request[key] for key in
+                                     ('joint', 'pose', 'work_frame', 'tool_frame', 'time') if key in request})
+        return {'command': 'update_global_waypoint', 'update_state': True}
+
+    def _cmd_delete_global_waypoint(self, request):
+        state = self.waypoints.pop(request['point_name'], None) is not None
+        return {'command': 'delete_global_waypoint', 'delete_state': state}
+
+    def _cmd_given_global_waypoint(self, request):
+        waypoint = self.waypoints.get(request['point_name'])
+        if waypoint is None:
+            return {'command': 'given_global_waypoint', 'given_state': False}
+        return dict(waypoint, command='given_global_waypoint')
+
+    def _cmd_get_global_waypoints_list(self, request):
+        search = request.get('vague_search', '')
+        points = [waypoint for name, waypoint in self.waypoints.items() if search in name]
+        page_num, page_size = request.get('page_num', 1), request.get('page_size', 10)
+        start = (page_num - 1) * page_size
+        return {'command': 'get_global_waypoints_list', 'total_size': len(points), 'page_num': page_num,
+                'page_size': page_size, 'vague_search': search, 'list': points[start:start + page_size]}
+
+    # UDP实时状态推送
+
+    def _push_message(self) -> bytes:
+        message = {'joint_status': {'joint_position': self._joint_data(),
+                                    'joint_current': [100 * _SCALE_JOINT] * self.arm_dof,
+                                    'joint_temperature': [30 * _SCALE_JOINT] * self.arm_dof,
+                                    'joint_voltage': [48 * _SCALE_JOINT] * self.arm_dof,
+                                    'joint_en_flag': [1] * self.arm_dof,
+                                    'joint_err_code': [0] * self.arm_dof},
+                   'waypoint': {'position': self._pose_data()[:3], 'euler': self._pose_data()[3:],
+                                'quat': [1000000, 0, 0, 0]},
+                   'err': [0]}
+        return json.dumps(message, separators=(',', ':')).encode()
+
+    def _push_loop(self) -> None:
+        deadline = time.monotonic()
+        while not self._stop.is_set():
+            with self._lock:
+                config = self.push_config
+                enabled = config['enable']
+                period = max(config['cycle'], 1) * 0.005
+                target = (config['ip'] or self.host, config['port'])
+            if not enabled:
+                self._push_changed.wait()
+                self._push_changed.clear()
+                deadline = time.monotonic()
+                continue
+            with self._lock:
+                message = self._push_message()
+            try:
+                self._udp.sendto(message, target)
+            except OSError:
+                pass
+            # 按绝对时间推进截止时间，发送耗时不累积到周期中
+            deadline += period
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                if self._push_changed.wait(remaining):
+                    self._push_changed.clear()
+                    deadline = time.monotonic()
+            else:
+                deadline = time.monotonic()
+
+
+def start_mock_controllers(count: int, host: str = '127.0.0.1', base_port: int = 18080,
+                           **kwargs) -> list[MockArmController]:
+    """
+    在连续端口上启动多台模拟控制器，用于多机械臂集群负载测试
+
+    Args:
+        count (int): 控制器数量
+        host (str, optional): 监听IP. Defaults to '127.0.0.1'.
+        base_port (int, optional): 第一台控制器的端口，其余依次加1. Defaults to 18080.
+        **kwargs: MockArmController的其他参数
+
+    Returns:
+        list[MockArmController]: 已启动的模拟控制器
+    """
+    controllers = []
+    try:
+        for i in range(count):
+            controllers.append(MockArmController(host, base_port + i, **kwargs).start())
+    except OSError:
+        for controller in controllers:
+            controller.stop()
+        raise
+    return controllers
@@ -0,0 +1,230 @@
+"""
+@brief Modbus读取缓存
+
+@details
+PLC等外设的数据往往变化很慢，却被多个子系统在每个控制周期重复读取，每次读取都是一次完整的控制器往返。
+此模块提供ModbusReadCache类，由ModbusV4.rm_enable_modbus_cache启用后作用于rm_read_modbus_rtu_*与rm_read_modbus_tcp_*：
+    - 以(控制器, 主站, 数据区, 起始地址, 数量)为键缓存读取成功的结果，每个读取可单独设置有效期
+    - 同一个键的并发读取只向控制器发送一次请求，其余调用等待该请求的结果
+    - rm_write_modbus_*写入后使地址范围重叠的缓存失效
+    - 读取到的数据与上一次不同时通知监听函数
+
+**注意**
+- 控制器以机械臂的(ip, port)区分，多个机械臂对象可共用同一个缓存对象。
+- 主站以Modbus RTU的(type, device)或Modbus TCP的(master_name, ip, port)区分，
+  通过主站名称与通过IP访问同一个TCP主站时视为不同的主站，写入不会使对方的缓存失效。
+- 仅能感知本进程通过同一缓存对象的写入，外设自身或其他进程修改的数据在有效期内不会更新。
+"""
+
+import threading
+import time
+from typing import Callable
+
+from .rm_ctypes_wrap import rm_modbus_rtu_read_params_t, rm_modbus_rtu_write_params_t
+
+
+class ModbusReadCache:
+    """
+    Modbus读取缓存
+
+    **Attributes**:
+        - default_ttl (float): 未单独设置有效期的键的有效期，单位：s
+        - hits (int): 命中缓存的次数
+        - misses (int): 向控制器发送请求的次数
+        - coalesced (int): 等待其他线程正在进行的同一请求的次数
+    """
+
+    def __init__(self, default_ttl: float = 0.1):
+        """
+        Args:
+            default_ttl (float, optional): 默认有效期，单位：s，为0时不缓存，仅合并并发读取及通知变化. Defaults to 0.1.
+        """
+        if default_ttl < 0:
+            raise ValueError("default_ttl must not be negative")
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._data = {}
+        self._last = {}
+        self._ttl = {}
+        self._inflight = {}
+        self._generation = 0
+        self._listeners = ()
+
+    @staticmethod
+    def bus_key(param) -> tuple:
+        """
+        获取读写参数结构体对应的主站
+
+        Args:
+            param: rm_modbus_rtu_read_params_t、rm_modbus_rtu_write_params_t、rm_modbus_tcp_read_params_t
+                或rm_modbus_tcp_write_params_t
+
+        Returns:
+            tuple: RTU为('rtu', type, device)，TCP为('tcp', master_name, ip, port)，
+                与ModbusRtuSource.key、ModbusTcpSource.key一致
+        """
+        if isinstance(param, (rm_modbus_rtu_read_params_t, rm_modbus_rtu_write_params_t)):
+            return ('rtu', param.type, param.device)
+        return ('tcp', param.master_name.decode('utf-8'), param.ip.decode('utf-8'), param.port)
+
+    def set_ttl(self, bus: tuple, area: str, address: int, ttl: float, num: int = None) -> None:
+        """
+        设置指定读取的有效期
+
+        Args:
+            bus (tuple): 主站，见bus_key，也可使用ModbusRtuSource(...).key或ModbusTcpSource(...).key
+            area (str): 数据区，'coils'、'input_status'、'holding_registers'或'input_registers'
+            address (int): 读取的起始地址
+            ttl (float): 有效期，单位：s，为None时恢复默认有效期，作用于全部控制器
+            num (int, optional): 读取数量，为None时作用于从该地址开始的任意数量的读取. Defaults to None.
+        """
+        key = (bus, area, address, num)
+        with self._lock:
+            if ttl is None:
+                self._ttl.pop(key, None)
+            else:
+                self._ttl[key] = ttl
+
+    def _ttl_for(self, key: tuple) -> float:
+        # 有效期不区分控制器
+        ttl = self._ttl.get(key[1:])
+        if ttl is None:
+            ttl = self._ttl.get(key[1:4] + (None,), self.default_ttl)
+        return ttl
+
+    def add_listener(self, listener: Callable[[tuple, tuple, str, int, list[int], list[int]], None]) -> None:
+        """
+        添加数据变化监听函数
+
+        Args:
+            listener (Callable[[tuple, tuple, str, int, list[int], list[int]], None]): 监听函数，参数依次为控制器、主站、数据区、起始地址、
+                上一次的数据（首次读取时为None）、本次的数据，在执行读取的线程中调用，抛出的异常会被忽略
+        """
+        with self._lock:
+            self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener: Callable[[tuple, tuple, str, int, list[int], list[int]], None]) -> None:
+        """
+        移除数据变化监听函数
+
+        Args:
+            listener (Callable[[tuple, tuple, str, int, list[int], list[int]], None]): 已添加的监听函数
+        """
+        with self._lock:
+            listeners = list(self._listeners)
+            if listener in listeners:
+                listeners.remove(listener)
+            self._listeners = tuple(listeners)
+
+    def read(self, bus: tuple, area: str, address: int, num: int,
+             fetch: Callable[[], tuple[int, list[int]]], controller: tuple = None) -> tuple[int, list[int]]:
+        """
+        读取数据，缓存有效时直接返回缓存的数据
+
+        Args:
+            bus (tuple): 主站，见bus_key
+            area (str): 数据区
+            address (int): 起始地址
+            num (int): 读取数量
+            fetch (Callable[[], tuple[int, list[int]]]): 未命中时向控制器读取的函数
+            controller (tuple, optional): 控制器，ModbusV4中为机械臂的(ip, port). Defaults to None.
+
+        Returns:
+            tuple[int, list[int]]: 同fetch的返回值，命中时状态码为0
+        """
+        key = (controller, bus, area, address, num)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self.hits += 1
+                return 0, list(entry[0])
+            flight = self._inflight.get(key)
+            if flight is None:
+                flight = self._inflight[key] = [threading.Event(), None]
+                generation = self._generation
+                self.misses += 1
+            else:
+                self.coalesced += 1
+                generation = None
+        if generation is None:
+            flight[0].wait()
+            if flight[1] is not None:
+                return flight[1][0], list(flight[1][1])
+            # 正在进行的请求抛出了异常，由本线程重新读取
+            return fetch()
+        try:
+            result = fetch()
+        except BaseException:
+            with self._lock:
+                del self._inflight[key]
+            flight[0].set()
+            raise
+        ret, data = result
+        changed = False
+        with self._lock:
+            del self._inflight[key]
+            flight[1] = (ret, tuple(data))
+            if ret == 0:
+                # 读取期间发生过写入时，读到的可能是写入前的数据，不缓存
+                ttl = self._ttl_for(key)
+                if ttl > 0 and generation == self._generation:
+                    self._data[key] = (tuple(data), time.monotonic() + ttl)
+                previous = self._last.get(key)
+                if previous != tuple(data):
+                    self._last[key] = tuple(data)
+                    changed = True
+            listeners = self._listeners
+        flight[0].set()
+        if changed:
+            for listener in listeners:
+                try:
+                    listener(controller, bus, area, address, None if previous is None else list(previous), list(data))
+                except Exception:
+                    pass
+        return result
+
+    def invalidate(self, bus: tuple, area: str = None, address: int = None, num: int = 1,
+                   controller: tuple = None) -> None:
+        """
+        使缓存失效
+
+        Args:
+            bus (tuple): 主站，见bus_key
+            area (str, optional): 数据区，为None时使该主站的全部缓存失效. Defaults to None.
+            address (int, optional): 起始地址，为None时使该数据区的全部缓存失效. Defaults to None.
+            num (int, optional): 地址数量，与[address, address + num)重叠的缓存均失效. Defaults to 1.
+            controller (tuple, optional): 控制器，同read. Defaults to None.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._data
+                        if key[0] == controller and key[1] == bus and (area is None or key[2] == area)]:
+                if address is None or (key[3] < address + num and address < key[3] + key[4]):
+                    del self._data[key]
+
+    def clear(self) -> None:
+        """清空缓存、变化比较用的历史数据及命中统计，有效期设置与监听函数保留"""
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            self._last.clear()
+            self.hits = 0
+            self.misses = 0
+            self.coalesced = 0
+
+    def info(self) -> dict[str, int]:
+        """
+        获取缓存统计
+
+        Returns:
+            dict[str, int]: 包含以下键的字典
+                - 'hits' (int): 命中缓存的次数
+                - 'misses' (int): 向控制器发送请求的次数
+                - 'coalesced' (int): 等待其他线程正在进行的同一请求的次数
+                - 'size' (int): 当前缓存的读取数
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'coalesced': self.coalesced, 'size': len(self._data)}
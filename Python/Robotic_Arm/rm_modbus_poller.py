@@ -0,0 +1,571 @@
+"""
+@brief Modbus寄存器表轮询
+
+@details
+末端工具等外设通常通过大量Modbus寄存器暴露状态，逐个寄存器调用rm_read_modbus_*接口时，每次读取都是一次完整的控制器往返，
+寄存器数量较多时控制器会被占满。此模块提供ModbusPoller类，根据声明式的寄存器表（地址、数据区、数据类型、轮询周期、优先级）：
+    - 将同一设备、同一数据区、同一周期的相邻地址合并为尽量少的读取，单次读取长度不超过对应接口的上限
+    - 较慢周期的寄存器若已被较快周期的读取覆盖，则不再单独读取
+    - 按周期计算每个读取的截止时间，同时到期的读取按优先级先后执行
+    - 读取结果按数据类型解码后发布到快照，可随时获取
+支持第四代控制器的Modbus RTU（ModbusRtuSource）、Modbus TCP（ModbusTcpSource）读取接口，
+以及第三代控制器的读取接口（ModbusLegacySource）。
+
+**注意**
+- 全部读取在同一轮询线程中依次执行，轮询周期之和超过通信能力时，读取会顺延并计入overruns。
+- 寄存器表中未声明的地址默认不会被读取，max_gap大于0时允许跨越少量未声明的地址合并读取，需确认设备允许读取这些地址。
+"""
+
+import collections
+import struct
+import threading
+import time
+
+from .rm_ctypes_wrap import rm_modbus_rtu_read_params_t, rm_modbus_tcp_read_params_t, \
+    rm_peripheral_read_write_params_t
+
+# Modbus数据区
+RM_MODBUS_AREAS = ('coils', 'input_status', 'holding_registers', 'input_registers')
+# 第四代控制器Modbus RTU单次读取的最大数量
+RM_MODBUS_RTU_MAX_READ = 109
+# 第四代控制器Modbus TCP单次读取的最大数量
+RM_MODBUS_TCP_MAX_READ = 100
+# 第三代控制器单次读取的最大数量
+RM_MODBUS_LEGACY_MAX_READ = {'coils': 120, 'input_status': 8, 'holding_registers': 12, 'input_registers': 12}
+# 读取接口抛出异常时记录的状态码
+RM_MODBUS_READ_EXCEPTION = -100
+
+# 数据类型: (占用寄存器数, struct格式)，bool仅用于线圈与离散量输入
+_RM_MODBUS_TYPES = {
+    'bool': (1, None),
+    'uint16': (1, 'H'),
+    'int16': (1, 'h'),
+    'uint32': (2, 'I'),
+    'int32': (2, 'i'),
+    'float32': (2, 'f'),
+}
+
+ModbusValue = collections.namedtuple('ModbusValue', ['value', 'timestamp', 'code'])
+ModbusValue.__doc__ = """
+快照中的寄存器值
+
+**Attributes**:
+    - value (any): 解码后的值，count为1时为单个值，否则为列表，尚未读取成功时为None
+    - timestamp (float): 最近一次读取成功的时间，time.monotonic()，尚未读取成功时为None
+    - code (int): 最近一次读取的状态码，0为成功，读取接口抛出异常时为RM_MODBUS_READ_EXCEPTION，尚未读取时为None
+"""
+
+
+class ModbusRtuSource:
+    """
+    第四代控制器Modbus RTU设备，使用ModbusV4.rm_read_modbus_rtu_*接口读取
+
+    **Attributes**:
+        - type (int): 0-控制器端modbus主机，1-工具端modbus主机
+        - device (int): 外设设备地址
+        - max_read (int): 单次读取的最大数量
+    """
+
+    def __init__(self, type: int, device: int, max_read: int = RM_MODBUS_RTU_MAX_READ):
+        self.type = type
+        self.device = device
+        self.max_read = max_read
+
+    @property
+    def key(self) -> tuple:
+        return ('rtu', self.type, self.device)
+
+    def __eq__(self, other):
+        return isinstance(other, ModbusRtuSource) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return 'ModbusRtuSource(type=%d, device=%d)' % (self.type, self.device)
+
+    def max_length(self, area: str) -> int:
+        """
+        获取指定数据区单次读取的最大数量
+
+        Args:
+            area (str): 数据区，见RM_MODBUS_AREAS
+
+        Returns:
+            int: 单次读取的最大数量
+        """
+        return self.max_read
+
+    def read(self, arm, area: str, address: int, num: int) -> tuple[int, list[int]]:
+        """
+        读取一段连续地址
+
+        Args:
+            arm (RoboticArm): 已连接的机械臂对象
+            area (str): 数据区，见RM_MODBUS_AREAS
+            address (int): 起始地址
+            num (int): 数量，不超过max_length(area)
+
+        Returns:
+            tuple[int, list[int]]: 状态码及读取到的num个数据，同rm_read_modbus_rtu_*
+        """
+        param = rm_modbus_rtu_read_params_t(address, self.device, self.type, num)
+        return getattr(arm, 'rm_read_modbus_rtu_' + area)(param)
+
+
+class ModbusTcpSource:
+    """
+    第四代控制器Modbus TCP主站，使用ModbusV4.rm_read_modbus_tcp_*接口读取
+
+    **Attributes**:
+        - master_name (str): Modbus主站名称，与ip二选一
+        - ip (str): 主站IP地址
+        - port (int): 主站端口号
+        - max_read (int): 单次读取的最大数量
+    """
+
+    def __init__(self, master_name: str = '', ip: str = '', port: int = 0, max_read: int = RM_MODBUS_TCP_MAX_READ):
+        self.master_name = master_name
+        self.ip = ip
+        self.port = port
+        self.max_read = max_read
+
+    @property
+    def key(self) -> tuple:
+        return ('tcp', self.master_name, self.ip, self.port)
+
+    def __eq__(self, other):
+        return isinstance(other, ModbusTcpSource) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return 'ModbusTcpSource(master_name=%r, ip=%r, port=%d)' % (self.master_name, self.ip, self.port)
+
+    def max_length(self, area: str) -> int:
+        """同ModbusRtuSource.max_length"""
+        return self.max_read
+
+    def read(self, arm, area: str, address: int, num: int) -> tuple[int, list[int]]:
+        """同ModbusRtuSource.read，使用rm_read_modbus_tcp_*接口"""
+        param = rm_modbus_tcp_read_params_t(address, self.master_name, self.ip, self.port, num)
+        return getattr(arm, 'rm_read_modbus_tcp_' + area)(param)
+
+
+class ModbusLegacySource:
+    """
+    第三代控制器Modbus设备，使用ModbusConfig的读取接口
+    @details 第三代控制器的读取接口对数量有限制：线圈不超过8个时使用rm_read_coils，否则使用rm_read_multiple_coils；
+    离散量输入最多8个；寄存器1个时使用rm_read_*_registers，3~12个时使用rm_read_multiple_*_registers，2个时分两次读取。
+
+    **Attributes**:
+        - port (int): 通讯端口，0-控制器RS485端口，1-末端接口板RS485接口，3-控制器ModbusTCP设备
+        - device (int): 外设设备地址
+    """
+
+    def __init__(self, port: int, device: int):
+        self.port = port
+        self.device = device
+
+    @property
+    def key(self) -> tuple:
+        return ('legacy', self.port, self.device)
+
+    def __eq__(self, other):
+        return isinstance(other, ModbusLegacySource) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return 'ModbusLegacySource(port=%d, device=%d)' % (self.port, self.device)
+
+    def max_length(self, area: str) -> int:
+        """同ModbusRtuSource.max_length"""
+        return RM_MODBUS_LEGACY_MAX_READ[area]
+
+    def read(self, arm, area: str, address: int, num: int) -> tuple[int, list[int]]:
+        """同ModbusRtuSource.read，使用ModbusConfig的读取接口，线圈与离散量输入按位展开为0/1列表"""
+        params = rm_peripheral_read_write_params_t(self.port, address, self.device, num)
+        if area in ('coils', 'input_status'):
+            if num <= 8:
+                ret, mask = getattr(arm, 'rm_read_' + area)(params)
+                data = [mask]
+            else:
+                ret, data = arm.rm_read_multiple_coils(params)
+            return ret, [(data[i >> 3] >> (i & 7)) & 1 for i in range(num)] if ret == 0 else []
+        if num <= 2:
+            values = []
+            for offset in range(num):
+                params.address = address + offset
+                ret, value = getattr(arm, 'rm_read_' + area)(params)
+                if ret != 0:
+                    return ret, []
+                values.append(value & 0xFFFF)
+            return 0, values
+        ret, data = getattr(arm, 'rm_read_multiple_' + area)(params)
+        if ret != 0:
+            return ret, []
+        return ret, [((data[2 * i] & 0xFF) << 8) | (data[2 * i + 1] & 0xFF) for i in range(num)]
+
+
+class ModbusTag:
+    """
+    寄存器表中的一项
+
+    **Attributes**:
+        - name (str): 名称，在同一轮询器中唯一
+        - source (ModbusRtuSource | ModbusTcpSource | ModbusLegacySource): 所在设备
+        - area (str): 数据区，见RM_MODBUS_AREAS
+        - address (int): 起始地址
+        - data_type (str): 数据类型，'bool'、'uint16'、'int16'、'uint32'、'int32'、'float32'
+        - count (int): 值的个数
+        - period (float): 轮询周期，单位：s
+        - priority (int): 优先级，数值越大越先读取
+        - word_order (str): 32位类型的字序，'big'-高字在前，'little'-低字在前
+        - length (int): 占用的地址数量
+    """
+
+    def __init__(self, name: str, source, area: str, address: int, data_type: str = None, count: int = 1,
+                 period: float = 1.0, priority: int = 0, word_order: str = 'big'):
+        if area not in RM_MODBUS_AREAS:
+            raise ValueError("unknown modbus area: %r" % (area,))
+        bit_area = area in ('coils', 'input_status')
+        if data_type is None:
+            data_type = 'bool' if bit_area else 'uint16'
+        if data_type not in _RM_MODBUS_TYPES:
+            raise ValueError("unknown modbus data type: %r" % (data_type,))
+        if bit_area != (data_type == 'bool'):
+            raise ValueError("data type %r does not match area %r" % (data_type, area))
+        if word_order not in ('big', 'little'):
+            raise ValueError("word_order must be 'big' or 'little'")
+        if count < 1 or period <= 0:
+            raise ValueError("count and period must be positive")
+        self.name = name
+        self.source = source
+        self.area = area
+        self.address = address
+        self.data_type = data_type
+        self.count = count
+        self.period = period
+        self.priority = priority
+        self.word_order = word_order
+        self.length = _RM_MODBUS_TYPES[data_type][0] * count
+        if self.length > source.max_length(area):
+            raise ValueError("tag %r spans %d addresses, exceeding the read limit %d"
+                             % (name, self.length, source.max_length(area)))
+        width, fmt = _RM_MODBUS_TYPES[data_type]
+        self._unpack = struct.Struct('>' + fmt * count).unpack if fmt else None
+        self._swap = width == 2 and word_order == 'little'
+
+    def decode(self, data: list[int]):
+        """
+        解码读取到的原始数据
+
+        Args:
+            data (list[int]): 从address开始的length个原始数据
+
+        Returns:
+            any: count为1时为单个值，否则为列表
+        """
+        if self._unpack is None:
+            values = [bool(value) for value in data]
+        else:
+            words = [value & 0xFFFF for value in data]
+            if self._swap:
+                words[0::2], words[1::2] = words[1::2], words[0::2]
+            values = list(self._unpack(struct.pack('>%dH' % len(words), *words)))
+        return values[0] if self.count == 1 else values
+
+
+class ModbusRead:
+    """
+    合并后的一次读取
+
+    **Attributes**:
+        - source (ModbusRtuSource | ModbusTcpSource | ModbusLegacySource): 所在设备
+        - area (str): 数据区
+        - address (int): 起始地址
+        - num (int): 读取数量
+        - period (float): 轮询周期，单位：s
+        - priority (int): 优先级，取覆盖的寄存器中的最大值
+        - tags (list[ModbusTag]): 由此次读取更新的寄存器
+        - deadline (float): 下一次读取的截止时间，time.monotonic()
+    """
+
+    def __init__(self, source, area: str, address: int, num: int, period: float):
+        self.source = source
+        self.area = area
+        self.address = address
+        self.num = num
+        self.period = period
+        self.priority = None
+        self.tags = []
+        self.deadline = 0.0
+
+    def covers(self, tag: ModbusTag) -> bool:
+        return self.address <= tag.address and tag.address + tag.length <= self.address + self.num
+
+    def __repr__(self):
+        return 'ModbusRead(%r, %r, address=%d, num=%d, period=%g, tags=%d)' % (
+            self.source, self.area, self.address, self.num, self.period, len(self.tags))
+
+
+def plan_modbus_reads(tags: list[ModbusTag], max_gap: int = 0) -> list[ModbusRead]:
+    """
+    将寄存器表合并为读取计划
+
+    Args:
+        tags (list[ModbusTag]): 寄存器表
+        max_gap (int, optional): 合并时允许跨越的未声明地址的最大数量. Defaults to 0.
+
+    Returns:
+        list[ModbusRead]: 读取计划，同一设备、同一数据区、同一周期的相邻地址合并为一次读取，
+            较慢周期的寄存器若已被较快周期的读取覆盖则并入该读取
+    """
+    groups = collections.defaultdict(list)
+    for tag in tags:
+        groups[(tag.source, tag.area)].append(tag)
+    reads = []
+    for (source, area), group in groups.items():
+        limit = source.max_length(area)
+        planned = []
+        for period in sorted(set(tag.period for tag in group)):
+            pending = []
+            for tag in group:
+                if tag.period != period:
+                    continue
+                cover = next((read for read in planned if read.covers(tag)), None)
+                if cover is not None:
+                    cover.tags.append(tag)
+                else:
+                    pending.append(tag)
+            pending.sort(key=lambda tag: (tag.address, tag.length))
+            current = None
+            for tag in pending:
+                end = tag.address + tag.length
+                if current is not None and tag.address <= current.address + current.num + max_gap \
+                        and max(end, current.address + current.num) - current.address <= limit:
+                    current.num = max(end, current.address + current.num) - current.address
+                else:
+                    current = ModbusRead(source, area, tag.address, tag.length, period)
+                    planned.append(current)
+                current.tags.append(tag)
+        reads.extend(planned)
+    for read in reads:
+        read.priority = max(tag.priority for tag in read.tags)
+    return reads
+
+
+class ModbusPoller:
+    """
+    Modbus寄存器表轮询器
+    @details 例如：
+
+        tool = ModbusRtuSource(type=1, device=1)
+        poller = ModbusPoller(arm)
+        poller.add_tags([
+            {'name': 'position', 'source': tool, 'area': 'holding_registers', 'address': 0, 'data_type': 'int32',
+             'period': 0.02, 'priority': 1},
+            {'name': 'temperature', 'source': tool, 'area': 'input_registers', 'address': 10, 'period': 1.0},
+        ])
+        poller.start()
+        value = poller.snapshot()['position'].value
+
+    **Attributes**:
+        - arm (RoboticArm): 执行读取的机械臂对象
+        - max_gap (int): 合并时允许跨越的未声明地址的最大数量
+    """
+
+    def __init__(self, arm, max_gap: int = 0):
+        """
+        Args:
+            arm (RoboticArm): 已连接的机械臂对象
+            max_gap (int, optional): 合并时允许跨越的未声明地址的最大数量. Defaults to 0.
+        """
+        self.arm = arm
+        self.max_gap = max_gap
+        self._lock = threading.Lock()
+        self._tags = {}
+        self._reads = None
+        self._values = {}
+        self._stats = {'reads': 0, 'errors': 0, 'overruns': 0}
+        self._thread = None
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+
+    def add_tag(self, name: str, source, area: str, address: int, data_type: str = None, count: int = 1,
+                period: float = 1.0, priority: int = 0, word_order: str = 'big') -> ModbusTag:
+        """
+        添加一个寄存器，参数同ModbusTag，轮询中添加时在下一次调度时生效
+
+        Returns:
+            ModbusTag: 添加的寄存器
+        """
+        tag = ModbusTag(name, source, area, address, data_type, count, period, priority, word_order)
+        with self._lock:
+            if name in self._tags:
+                raise ValueError("duplicate modbus tag name: %r" % (name,))
+            self._tags[name] = tag
+            self._values[name] = ModbusValue(None, None, None)
+            self._reads = None
+        self._wakeup.set()
+        return tag
+
+    def add_tags(self, register_map: list[dict[str, any]]) -> list[ModbusTag]:
+        """
+        按寄存器表批量添加寄存器
+
+        Args:
+            register_map (list[dict[str, any]]): 每项为add_tag的关键字参数
+
+        Returns:
+            list[ModbusTag]: 添加的寄存器
+        """
+        return [self.add_tag(**entry) for entry in register_map]
+
+    def remove_tag(self, name: str) -> None:
+        """
+        移除寄存器
+
+        Args:
+            name (str): 寄存器名称
+        """
+        with self._lock:
+            del self._tags[name]
+            del self._values[name]
+            self._reads = None
+        self._wakeup.set()
+
+    def plan(self) -> list[ModbusRead]:
+        """
+        获取当前的读取计划
+
+        Returns:
+            list[ModbusRead]: 读取计划
+        """
+        with self._lock:
+            return list(self._plan())
+
+    def _plan(self) -> list[ModbusRead]:
+        if self._reads is None:
+            now = time.monotonic()
+            self._reads = plan_modbus_reads(list(self._tags.values()), self.max_gap)
+            for read in self._reads:
+                read.deadline = now
+        return self._reads
+
+    def _execute(self, read: ModbusRead) -> None:
+        try:
+            ret, data = read.source.read(self.arm, read.area, read.address, read.num)
+        except Exception:
+            # 单个读取的异常不能终止轮询线程，按读取失败处理，保留上一次的值
+            ret, data = RM_MODBUS_READ_EXCEPTION, None
+        now = time.monotonic()
+        with self._lock:
+            self._stats['reads'] += 1
+            if ret != 0:
+                self._stats['errors'] += 1
+            for tag in read.tags:
+                if tag.name not in self._values:
+                    continue
+                if ret == 0:
+                    offset = tag.address - read.address
+                    self._values[tag.name] = ModbusValue(tag.decode(data[offset:offset + tag.length]), now, 0)
+                else:
+                    self._values[tag.name] = self._values[tag.name]._replace(code=ret)
+
+    def poll_once(self) -> float:
+        """
+        执行全部已到期的读取，同时到期的读取按优先级从高到低执行
+
+        Returns:
+            float: 距下一个读取到期的时间，单位：s，无寄存器时为None
+        """
+        with self._lock:
+            reads = self._plan()
+        now = time.monotonic()
+        due = sorted((read for read in reads if read.deadline <= now), key=lambda read: (-read.priority, read.deadline))
+        for read in due:
+            self._execute(read)
+            read.deadline += read.period
+            now = time.monotonic()
+            if read.deadline <= now:
+                # 已错过下一个周期，不再补读
+                with self._lock:
+                    self._stats['overruns'] += 1
+                read.deadline = now + read.period
+        if not reads:
+            return None
+        return max(0.0, min(read.deadline for read in reads) - time.monotonic())
+
+    def start(self) -> None:
+        """启动后台轮询线程"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.is_set():
+                wait = self.poll_once()
+                self._wakeup.wait(wait)
+                self._wakeup.clear()
+
+        self._thread = threading.Thread(target=run, name='rm_modbus_poller', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止后台轮询线程"""
+        if self._thread is not None:
+            self._stop.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+
+    def get(self, name: str) -> ModbusValue:
+        """
+        获取单个寄存器的最新值
+
+        Args:
+            name (str): 寄存器名称
+
+        Returns:
+            ModbusValue: 最新值
+        """
+        with self._lock:
+            return self._values[name]
+
+    def snapshot(self) -> dict[str, ModbusValue]:
+        """
+        获取全部寄存器最新值的快照
+
+        Returns:
+            dict[str, ModbusValue]: 寄存器名称到最新值的字典，为副本，不随后续读取变化
+        """
+        with self._lock:
+            return dict(self._values)
+
+    def statistics(self) -> dict[str, int]:
+        """
+        获取轮询统计
+
+        Returns:
+            dict[str, int]: 包含以下键的字典
+                - 'tags' (int): 寄存器数量
+                - 'planned_reads' (int): 每轮读取计划中的读取次数
+                - 'reads' (int): 已执行的读取次数
+                - 'errors' (int): 状态码非0或抛出异常的读取次数
+                - 'overruns' (int): 错过下一个周期的次数
+        """
+        with self._lock:
+            result = {'tags': len(self._tags), 'planned_reads': len(self._plan())}
+            result.update(self._stats)
+        return result
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
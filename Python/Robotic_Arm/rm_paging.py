@@ -0,0 +1,119 @@
+"""
+@brief 分页列表的逐项迭代
+
+@details
+全局路点、在线编程文件、拖动示教轨迹、Modbus TCP主站及末端动作等控制器端列表均按(page_num, page_size, vague_search)分页查询，
+每页最多100项。此模块提供iter_pages函数，将分页查询接口包装为逐项返回的生成器：
+    - 首页返回后根据列表总数计算页数，由后台线程按顺序提前查询后续的页，与调用方处理已返回的数据并行进行
+    - 每项在被取用时才转换返回，调用方提前结束迭代时后台线程不再查询新的页
+    - 任意一页查询失败时抛出PageFetchError
+
+**注意**
+- C库按指令名称匹配控制器应答，同一机械臂上同时进行多个同名查询时应答可能错配，
+  因此提前查询只在一个后台线程中顺序进行，且迭代期间请勿在其他线程中调用同一查询接口。
+- 每页的数据量受C库接收缓冲区大小限制，每项数据较多（如全局路点）时page_size过大会返回-3。
+"""
+
+import queue
+import threading
+from typing import Callable, Iterator
+
+# 默认每页大小
+RM_PAGE_SIZE = 50
+# 单页最多返回的项数，与列表结构体中数组长度一致
+RM_PAGE_SIZE_MAX = 100
+
+
+class PageFetchError(RuntimeError):
+    """
+    分页查询失败
+
+    **Attributes**:
+        - code (int): 查询接口返回的状态码
+        - page_num (int): 查询失败的页码
+    """
+
+    def __init__(self, code: int, page_num: int):
+        super().__init__("page %d query failed with code %d" % (page_num, code))
+        self.code = code
+        self.page_num = page_num
+
+
+def iter_pages(fetch: Callable[[int, int, str], tuple[int, dict[str, any]]], items_key: str, total_key: str,
+               vague_search: str = '', page_size: int = RM_PAGE_SIZE, prefetch: int = 2) -> Iterator[dict[str, any]]:
+    """
+    逐项迭代分页查询接口返回的列表
+
+    Args:
+        fetch (Callable[[int, int, str], tuple[int, dict[str, any]]]): 分页查询接口，参数为页码（从1开始）、每页大小、模糊搜索，
+            如RoboticArm.rm_get_global_waypoints_list
+        items_key (str): 返回字典中列表项的键，如'points_list'
+        total_key (str): 返回字典中列表总数的键，如'total_size'
+        vague_search (str, optional): 模糊搜索. Defaults to ''.
+        page_size (int, optional): 每页大小，范围：1~100. Defaults to RM_PAGE_SIZE.
+        prefetch (int, optional): 最多提前查询的页数，为0时不使用后台线程，在迭代到每页时再查询. Defaults to 2.
+
+    Returns:
+        Iterator[dict[str, any]]: 逐项返回的生成器，每项为fetch返回的列表项字典
+
+    Raises:
+        ValueError: page_size超出范围
+        PageFetchError: 任意一页查询失败
+    """
+    if not 1 <= page_size <= RM_PAGE_SIZE_MAX:
+        raise ValueError("page_size must be in 1~%d" % RM_PAGE_SIZE_MAX)
+
+    def query(page_num):
+        ret, result = fetch(page_num, page_size, vague_search)
+        if ret != 0:
+            raise PageFetchError(ret, page_num)
+        return result
+
+    def generate():
+        first = query(1)
+        pages = max(1, -(-first[total_key] // page_size))
+        yield from first[items_key]
+        if pages == 1:
+            return
+        if prefetch <= 0:
+            for page_num in range(2, pages + 1):
+                items = query(page_num)[items_key]
+                if not items:
+                    # 迭代期间列表被删减
+                    return
+                yield from items
+            return
+        results = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def worker():
+            for page_num in range(2, pages + 1):
+                if stop.is_set():
+                    return
+                try:
+                    item = query(page_num)[items_key]
+                except BaseException as error:
+                    item = error
+                while not stop.is_set():
+                    try:
+                        results.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if not isinstance(item, list) or not item:
+                    return
+
+        thread = threading.Thread(target=worker, name='rm_paging', daemon=True)
+        thread.start()
+        try:
+            for _ in range(2, pages + 1):
+                items = results.get()
+                if isinstance(items, BaseException):
+                    raise items
+                if not items:
+                    return
+                yield from items
+        finally:
+            stop.set()
+
+    return generate()
@@ -0,0 +1,249 @@
+"""
+@brief 机械臂实时状态推送的NumPy视图
+
+@details
+UDP主动上报的rm_realtime_arm_joint_state_t默认通过to_dict()转换为字典，每个数据包都会创建大量Python列表。
+此模块提供与C结构体内存布局完全一致的NumPy结构化类型，并可直接以只读np.frombuffer视图的方式读取推送数据，无需任何拷贝。
+RealtimeStateRecorder将推送数据记录到共享内存环形缓冲区，供其他线程或进程批量读取。
+
+**注意**
+- 本模块依赖NumPy。
+- 视图与回调收到的结构体共享内存，需要长期保存数据时请调用copy()。
+"""
+
+import ctypes
+import threading
+import time
+from typing import Callable
+
+import numpy as np
+
+from .rm_ctypes_wrap import rm_realtime_arm_joint_state_t, rm_realtime_arm_state_callback_ptr
+
+
+def rm_ctypes_dtype(struct_type: type) -> np.dtype:
+    """
+    根据ctypes结构体生成内存布局一致的NumPy结构化类型
+
+    Args:
+        struct_type (type): ctypes.Structure子类
+
+    Returns:
+        np.dtype: 字段名、偏移量、大小均与结构体一致的结构化类型，c_char数组映射为定长字节串
+    """
+    names, formats, offsets = [], [], []
+    for name, ctype in struct_type._fields_:
+        if isinstance(ctype, type) and issubclass(ctype, ctypes.Structure):
+            fmt = rm_ctypes_dtype(ctype)
+        elif isinstance(ctype, type) and issubclass(ctype, ctypes.Array) and ctype._type_ is ctypes.c_char:
+            fmt = np.dtype('S%d' % ctype._length_)
+        else:
+            fmt = np.dtype(ctype)
+        names.append(name)
+        formats.append(fmt)
+        offsets.append(getattr(struct_type, name).offset)
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                     'itemsize': ctypes.sizeof(struct_type)})
+
+
+# 与rm_realtime_arm_joint_state_t内存布局一致的NumPy结构化类型
+RM_REALTIME_ARM_JOINT_STATE_DTYPE = rm_ctypes_dtype(rm_realtime_arm_joint_state_t)
+
+
+def rm_realtime_arm_state_view(arm_state: rm_realtime_arm_joint_state_t) -> np.ndarray:
+    """
+    获取实时状态结构体的只读NumPy视图
+
+    Args:
+        arm_state (rm_realtime_arm_joint_state_t): 实时状态回调收到的结构体
+
+    Returns:
+        np.ndarray: 0维结构化数组，与arm_state共享内存，例如view['joint_status']['joint_position']
+    """
+    view = np.frombuffer(arm_state, dtype=RM_REALTIME_ARM_JOINT_STATE_DTYPE, count=1).reshape(())
+    view.flags.writeable = False
+    return view
+
+
+def rm_realtime_arm_state_view_callback(callback: Callable[[np.ndarray], None]) -> rm_realtime_arm_state_callback_ptr:
+    """
+    将接收NumPy视图的Python函数包装为实时状态回调函数
+
+    Args:
+        callback (Callable[[np.ndarray], None]): 用户回调函数，参数为rm_realtime_arm_state_view返回的只读视图
+
+    Returns:
+        rm_realtime_arm_state_callback_ptr: 可直接传入rm_realtime_arm_state_call_back的回调函数，调用方需保持其引用
+    """
+    def _on_arm_state(arm_state):
+        callback(rm_realtime_arm_state_view(arm_state))
+
+    return rm_realtime_arm_state_callback_ptr(_on_arm_state)
+
+
+class RealtimeStateRecorder:
+    """
+    实时状态环形缓冲记录器
+    @details 将UDP推送的rm_realtime_arm_joint_state_t原样拷贝到预分配、定长的共享内存环形缓冲区，并为每个样本记录单调时钟时间戳。
+    回调中仅进行一次内存拷贝，不做任何字典或列表转换；消费线程或其他进程可通过attach按名称挂载同一缓冲区，读取最新N个样本。
+    写入端为单生产者，读取端无需加锁，被写入端覆盖的样本会在读取时被丢弃。
+
+    **Attributes**:
+        - name (str): 共享内存名称，其他进程通过该名称挂载
+        - capacity (int): 缓冲区可保存的样本数
+    """
+
+    # 共享内存头部：容量、开始写入的样本数、写入完成的样本数、单个样本字节数
+    _HEADER_DTYPE = np.dtype([('capacity', '<i8'), ('head', '<i8'), ('count', '<i8'), ('itemsize', '<i8')])
+    _HEADER_SIZE = 64
+
+    def __init__(self, capacity: int = 4096, name: str = None, _shm=None):
+        """
+        创建记录器并分配共享内存
+
+        Args:
+            capacity (int, optional): 缓冲区可保存的样本数. Defaults to 4096.
+            name (str, optional): 共享内存名称，为None时自动生成. Defaults to None.
+        """
+        from multiprocessing import shared_memory
+
+        itemsize = RM_REALTIME_ARM_JOINT_STATE_DTYPE.itemsize
+        if _shm is None:
+            if capacity <= 0:
+                raise ValueError("capacity must be positive")
+            size = self._HEADER_SIZE + capacity * (8 + itemsize)
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._owner = True
+            header = np.ndarray((), dtype=self._HEADER_DTYPE, buffer=self._shm.buf)
+            header['capacity'] = capacity
+            header['head'] = 0
+            header['count'] = 0
+            header['itemsize'] = itemsize
+        else:
+            self._shm = _shm
+            self._owner = False
+            header = np.ndarray((), dtype=self._HEADER_DTYPE, buffer=self._shm.buf)
+            if int(header['itemsize']) != itemsize:
+                raise ValueError("shared memory layout does not match rm_realtime_arm_joint_state_t")
+            capacity = int(header['capacity'])
+
+        self.name = self._shm.name
+        self.capacity = capacity
+        self._itemsize = itemsize
+        self._head = header['head'].reshape(1)
+        self._count = header['count'].reshape(1)
+        self._timestamps = np.ndarray((capacity,), dtype='<i8', buffer=self._shm.buf, offset=self._HEADER_SIZE)
+        self._records = np.ndarray((capacity,), dtype=RM_REALTIME_ARM_JOINT_STATE_DTYPE, buffer=self._shm.buf,
+                                   offset=self._HEADER_SIZE + capacity * 8)
+        self._records_addr = self._records.ctypes.data
+        # close与C库接收线程中的record互斥，关闭后不再写入已释放的共享内存
+        self._record_lock = threading.Lock()
+        self._callback = rm_realtime_arm_state_callback_ptr(self.record)
+
+    @classmethod
+    def attach(cls, name: str) -> 'RealtimeStateRecorder':
+        """
+        按名称挂载其他进程创建的记录器，用于只读消费
+
+        Notes:
+            Python 3.13以下版本中，与创建方无父子关系的进程挂载后，退出时共享内存可能被其resource_tracker回收
+
+        Args:
+            name (str): 共享内存名称
+
+        Returns:
+            RealtimeStateRecorder: 挂载到同一共享内存的记录器
+        """
+        import sys
+        from multiprocessing import shared_memory
+
+        if sys.version_info >= (3, 13):
+            # 挂载方不负责释放共享内存
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(_shm=shm)
+
+    @property
+    def callback(self) -> rm_realtime_arm_state_callback_ptr:
+        """rm_realtime_arm_state_call_back可直接使用的回调函数，生命周期与记录器一致"""
+        return self._callback
+
+    @property
+    def count(self) -> int:
+        """已写入的样本总数（包含已被覆盖的样本）"""
+        return int(self._count[0])
+
+    def start(self, arm) -> None:
+        """
+        注册为机械臂实时状态回调函数
+
+        Args:
+            arm (UdpConfig): 已连接的机械臂对象，如RoboticArm
+        """
+        arm.rm_realtime_arm_state_call_back(self._callback)
+
+    def record(self, arm_state: rm_realtime_arm_joint_state_t) -> None:
+        """
+        写入一个样本，通常由实时状态回调调用
+
+        Args:
+            arm_state (rm_realtime_arm_joint_state_t): 实时状态结构体，记录器已关闭时忽略
+        """
+        with self._record_lock:
+            if self._count is None:
+                return
+            index = int(self._count[0])
+            slot = index % self.capacity
+            # 先声明占用槽位，读取端据此判断哪些样本可能已被覆盖
+            self._head[0] = index + 1
+            ctypes.memmove(self._records_addr + slot * self._itemsize, ctypes.addressof(arm_state), self._itemsize)
+            self._timestamps[slot] = time.monotonic_ns()
+            # 最后更新计数，读取端以计数作为样本已写完的标志
+            self._count[0] = index + 1
+
+    def latest(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        读取最新的n个样本
+
+        Args:
+            n (int): 期望读取的样本数，超过已写入或缓冲区容量时返回实际可用的样本
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: 包含两个元素的元组，按时间先后排列，均为拷贝。
+                - np.ndarray: 样本时间戳，time.monotonic_ns()，单位ns
+                - np.ndarray: 结构化样本数组，类型为RM_REALTIME_ARM_JOINT_STATE_DTYPE
+        """
+        end = int(self._count[0])
+        n = max(0, min(n, end, self.capacity))
+        slots = np.arange(end - n, end) % self.capacity
+        timestamps = self._timestamps[slots]
+        records = self._records[slots]
+        # 读取过程中写入端可能已覆盖最旧的样本（含正在写入的槽位），将其丢弃
+        stale = int(self._head[0]) - self.capacity - (end - n)
+        if stale > 0:
+            timestamps = timestamps[stale:]
+            records = records[stale:]
+        return timestamps, records
+
+    def close(self) -> None:
+        """
+        释放本进程对共享内存的映射，创建方同时删除共享内存
+
+        Notes:
+            不会注销C库中的实时状态回调，关闭后回调仍可被调用，但record直接返回，不再写入；
+            如需停止接收，请在关闭前调用rm_realtime_arm_state_call_back注册其他回调
+        """
+        with self._record_lock:
+            if self._count is None:
+                return
+            self._head = self._count = self._timestamps = self._records = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
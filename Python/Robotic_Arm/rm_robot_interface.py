@@ -17,8 +17,12 @@
 """
 
 from .rm_ctypes_wrap import *
+from .algo import Algo
+from .rm_event import arm_event_router, realtime_state_router, rm_send_with_arrival
+from .rm_metrics import ArmInstrumentation
 import ctypes
-from typing import Callable, Tuple, Optional
+from concurrent.futures import Future
+from typing import Callable, Iterator, Tuple, Optional
 
 
 class JointConfigSettings:
@@ -1142,11 +1146,80 @@ class WorkCoordinateConfig:
         return ret, frame.to_dictionary()
 
 
+class _ArmStateBuffers:
+    """
+    状态查询接口的预分配输出缓冲区
+    @details 每个机械臂对象持有一组，查询时C接口直接写入同一块内存，不再为每次调用分配ctypes数组及结构体。
+    """
+
+    def __init__(self, arm_dof: int, output: str):
+        if output not in ('tuple', 'array'):
+            raise ValueError("output must be 'tuple' or 'array'")
+        dof = arm_dof if arm_dof != 0 else ARM_DOF
+        self.dof = dof
+        self.output = output
+        self.joint_degree = (c_float * dof)()
+        self.joint_current = (c_float * dof)()
+        self.joint_temperature = (c_float * dof)()
+        self.joint_voltage = (c_float * dof)()
+        self.arm_state = rm_current_arm_state_t()
+        if output == 'array':
+            import numpy as np
+            from .rm_realtime import rm_ctypes_dtype
+
+            self._views = {}
+            for name in ('joint_degree', 'joint_current', 'joint_temperature', 'joint_voltage'):
+                view = np.frombuffer(getattr(self, name), dtype=np.float32)
+                view.flags.writeable = False
+                self._views[name] = view
+            view = np.frombuffer(self.arm_state, dtype=rm_ctypes_dtype(rm_current_arm_state_t), count=1).reshape(())
+            view.flags.writeable = False
+            self._views['arm_state'] = view
+
+    def result(self, name: str):
+        if self.output == 'array':
+            return self._views[name]
+        if name == 'arm_state':
+            state = self.arm_state
+            position = state.pose.position
+            euler = state.pose.euler
+            return {
+                'joint': tuple(state.joint[:self.dof]),
+                'pose': tuple(round(item, 6) for item in (position.x, position.y, position.z, euler.rx, euler.ry, euler.rz)),
+                'err': state.err.to_dict(),
+            }
+        return tuple(getattr(self, name))
+
+
 class ArmState:
     """
     机械臂状态获取
     """
 
+    # 复用输出缓冲区模式，由rm_set_reuse_buffers设置
+    _reuse_buffers = None
+
+    def rm_set_reuse_buffers(self, enable: bool, output: str = 'tuple') -> None:
+        """
+        设置状态查询接口复用预分配的输出缓冲区，降低高频轮询时的内存分配开销
+
+        作用于rm_get_joint_degree、rm_get_current_joint_current、rm_get_current_joint_temperature、
+        rm_get_current_joint_voltage及rm_get_current_arm_state，状态码含义不变，数据的返回形式如下：
+            - 'tuple'：关节数据返回元组；机械臂状态返回字典，键与默认模式相同，joint、pose为元组
+            - 'array'：返回与缓冲区共享内存的只读NumPy视图，机械臂状态为结构化视图，键为rm_current_arm_state_t的字段名，
+              需依赖NumPy
+
+        Args:
+            enable (bool): True-开启，False-关闭并恢复默认的列表、字典返回形式
+            output (str, optional): 数据返回形式，'tuple'或'array'. Defaults to 'tuple'.
+
+        Notes:
+            - 缓冲区按当前机械臂自由度分配，请在rm_create_robot_arm之后设置，重新创建连接后需重新设置
+            - 'array'模式下视图内容会被下一次同名查询覆盖，且多线程并发查询同一接口时不安全，需长期保存数据时请调用copy()
+        """
+        self._reuse_buffers = _ArmStateBuffers(self.arm_dof, output) if enable else None
+
+
     def rm_get_current_arm_state(self) -> tuple[int, dict[str, any]]:
         """
         获取机械臂当前状态
@@ -1161,6 +1234,11 @@ class ArmState:
                     - -3: 返回值解析失败，接收到的数据格式不正确或不完整。
                 - dict: 机械臂当前状态字典，键为rm_current_arm_state_t的参数名。
         """
+        buffers = self._reuse_buffers
+        if buffers is not None:
+            ret = rm_get_current_arm_state(self.handle, byref(buffers.arm_state))
+            return ret, buffers.result('arm_state')
+
         state = rm_current_arm_state_t()
         ret = rm_get_current_arm_state(self.handle, byref(state))
 
@@ -1179,6 +1257,11 @@ class ArmState:
                 - -3: 返回值解析失败，控制器返回的数据无法识别或不完整等情况。
             - list: 关节1~7温度数组，单位：℃
         """
+        buffers = self._reuse_buffers
+        if buffers is not None:
+            ret = rm_get_current_joint_temperature(self.handle, buffers.joint_temperature)
+            return ret, buffers.result('joint_temperature')
+
         if self.arm_dof != 0:
             temperature = (c_float * self.arm_dof)()
         else:
@@ -1200,6 +1283,11 @@ class ArmState:
                 - -3: 返回值解析失败，控制器返回的数据无法识别或不完整等情况。
             - list: 关节1~7电流数组，单位：mA
         """
+        buffers = self._reuse_buffers
+        if buffers is not None:
+            ret = rm_get_current_joint_current(self.handle, buffers.joint_current)
+            return ret, buffers.result('joint_current')
+
         if self.arm_dof != 0:
             current = (c_float * self.arm_dof)()
         else:
@@ -1221,6 +1309,11 @@ class ArmState:
                 - -3: 返回值解析失败，控制器返回的数据无法识别或不完整等情况。
             - list: 关节1~7电压数组，单位：V
         """
+        buffers = self._reuse_buffers
+        if buffers is not None:
+            ret = rm_get_current_joint_voltage(self.handle, buffers.joint_voltage)
+            return ret, buffers.result('joint_voltage')
+
         if self.arm_dof != 0:
             voltage = (c_float * self.arm_dof)()
         else:
@@ -1287,6 +1380,11 @@ class ArmState:
                 - -3: 返回值解析失败，控制器返回的数据无法识别或不完整等情况。
             - list: 当前7个关节的角度数组，单位：°
         """
+        buffers = self._reuse_buffers
+        if buffers is not None:
+            ret = rm_get_joint_degree(self.handle, buffers.joint_degree)
+            return ret, buffers.result('joint_degree')
+
         if self.arm_dof != 0:
             joint_degree = (c_float * self.arm_dof)()
         else:
@@ -1694,6 +1792,148 @@ class MovePlan:
 
         return tag
 
+    def rm_movej_future(self, joint: list[float], v: int, r: int, connect: int) -> Future:
+        """
+        关节空间运动（非阻塞，返回运动完成Future）
+        @details 以非阻塞模式下发rm_movej，由轨迹到位事件完成返回的concurrent.futures.Future，
+        调用线程不会等待运动结束，多台机械臂同步可使用concurrent.futures.wait。
+
+        Args:
+            joint (list[float]): 各关节目标角度数组，单位：°
+            v (int): 速度百分比系数，1~100
+            r (int): 交融半径百分比系数，0~100。
+            connect (int): 轨迹连接标志
+                - 0：立即规划并执行轨迹，不与后续轨迹连接。
+                - 1：将当前轨迹与下一条轨迹一起规划，但不立即执行。
+
+        Returns:
+            Future: 运动完成后结果为0（到位）或1（规划失败），指令发送失败时结果为对应错误码：
+            - 1: 控制器返回false，参数错误或机械臂状态发生错误。
+            - -1: 数据发送失败，通信过程中出现问题。
+            - -2: 数据接收失败，通信过程中出现问题或者控制器超时没有返回。
+            - -3: 返回值解析失败，接收到的数据格式不正确或不完整。
+
+        Notes:
+            - 需使用双线程或三线程模式，到位通知来自rm_event.arm_event_router注册的事件回调
+            - connect为1时轨迹不会立即执行，Future在指令发送成功后即完成
+        """
+        return rm_send_with_arrival(self.handle.contents.id,
+                                    lambda: self.rm_movej(joint, v, r, connect, RM_MOVE_NBLOCK), connect=connect)
+
+    def rm_movel_future(self, pose: list[float], v: int, r: int, connect: int) -> Future:
+        """
+        笛卡尔空间直线运动（非阻塞，返回运动完成Future）
+        @details 以非阻塞模式下发rm_movel，由轨迹到位事件完成返回的concurrent.futures.Future，
+        调用线程不会等待运动结束，多台机械臂同步可使用concurrent.futures.wait。
+
+        Args:
+            pose (list[float]): 目标位姿，位置单位：米，姿态单位：弧度
+            v (int): 速度百分比系数，1~100
+            r (int): 交融半径百分比系数，0~100。
+            connect (int): 轨迹连接标志
+                - 0：立即规划并执行轨迹，不与后续轨迹连接。
+                - 1：将当前轨迹与下一条轨迹一起规划，但不立即执行。
+
+        Returns:
+            Future: 运动完成后结果为0（到位）或1（规划失败），指令发送失败时结果为对应错误码：
+            - 1: 控制器返回false，参数错误或机械臂状态发生错误。
+            - -1: 数据发送失败，通信过程中出现问题。
+            - -2: 数据接收失败，通信过程中出现问题或者控制器超时没有返回。
+            - -3: 返回值解析失败，接收到的数据格式不正确或不完整。
+
+        Notes:
+            - 需使用双线程或三线程模式，到位通知来自rm_event.arm_event_router注册的事件回调
+            - connect为1时轨迹不会立即执行，Future在指令发送成功后即完成
+        """
+        return rm_send_with_arrival(self.handle.contents.id,
+                                    lambda: self.rm_movel(pose, v, r, connect, RM_MOVE_NBLOCK), connect=connect)
+
+    def rm_moves_future(self, pose: list[float], v: int, r: int, connect: int) -> Future:
+        """
+        样条曲线运动（非阻塞，返回运动完成Future）
+        @details 以非阻塞模式下发rm_moves，由轨迹到位事件完成返回的concurrent.futures.Future，
+        调用线程不会等待运动结束，多台机械臂同步可使用concurrent.futures.wait。
+
+        Args:
+            pose (list[float]): 目标位姿，位置单位：米，姿态单位：弧度
+            v (int): 速度百分比系数，1~100
+            r (int): 交融半径百分比系数，0~100。
+            connect (int): 轨迹连接标志
+                - 0：立即规划并执行轨迹，不与后续轨迹连接。
+                - 1：将当前轨迹与下一条轨迹一起规划，但不立即执行。
+
+        Returns:
+            Future: 运动完成后结果为0（到位）或1（规划失败），指令发送失败时结果为对应错误码：
+            - 1: 控制器返回false，参数错误或机械臂状态发生错误。
+            - -1: 数据发送失败，通信过程中出现问题。
+            - -2: 数据接收失败，通信过程中出现问题或者控制器超时没有返回。
+            - -3: 返回值解析失败，接收到的数据格式不正确或不完整。
+
+        Notes:
+            - 需使用双线程或三线程模式，到位通知来自rm_event.arm_event_router注册的事件回调
+            - connect为1时轨迹不会立即执行，Future在指令发送成功后即完成
+        """
+        return rm_send_with_arrival(self.handle.contents.id,
+                                    lambda: self.rm_moves(pose, v, r, connect, RM_MOVE_NBLOCK), connect=connect)
+
+    def rm_movec_future(self, pose_via: list[float], pose_to: list[float], v: int, r: int, loop: int, connect: int) -> Future:
+        """
+        笛卡尔空间圆弧运动（非阻塞，返回运动完成Future）
+        @details 以非阻塞模式下发rm_movec，由轨迹到位事件完成返回的concurrent.futures.Future，
+        调用线程不会等待运动结束，多台机械臂同步可使用concurrent.futures.wait。
+
+        Args:
+            pose_via (list[float]): 中间点位姿，位置单位：米，姿态单位：弧度
+            pose_to (list[float]): 终点位姿，位置单位：米，姿态单位：弧度
+            v (int): 速度百分比系数，1~100
+            r (int): 交融半径百分比系数，0~100。
+            loop (int): 规划圈数.
+            connect (int): 轨迹连接标志
+                - 0：立即规划并执行轨迹，不与后续轨迹连接。
+                - 1：将当前轨迹与下一条轨迹一起规划，但不立即执行。
+
+        Returns:
+            Future: 运动完成后结果为0（到位）或1（规划失败），指令发送失败时结果为对应错误码：
+            - 1: 控制器返回false，参数错误或机械臂状态发生错误。
+            - -1: 数据发送失败，通信过程中出现问题。
+            - -2: 数据接收失败，通信过程中出现问题或者控制器超时没有返回。
+            - -3: 返回值解析失败，接收到的数据格式不正确或不完整。
+
+        Notes:
+            - 需使用双线程或三线程模式，到位通知来自rm_event.arm_event_router注册的事件回调
+            - connect为1时轨迹不会立即执行，Future在指令发送成功后即完成
+        """
+        return rm_send_with_arrival(self.handle.contents.id,
+                                    lambda: self.rm_movec(pose_via, pose_to, v, r, loop, connect, RM_MOVE_NBLOCK), connect=connect)
+
+    def rm_movej_p_future(self, pose: list[float], v: int, r: int, connect: int) -> Future:
+        """
+        关节空间运动到目标位姿（非阻塞，返回运动完成Future）
+        @details 以非阻塞模式下发rm_movej_p，由轨迹到位事件完成返回的concurrent.futures.Future，
+        调用线程不会等待运动结束，多台机械臂同步可使用concurrent.futures.wait。
+
+        Args:
+            pose (list[float]): 目标位姿，位置单位：米，姿态单位：弧度
+            v (int): 速度百分比系数，1~100
+            r (int): 交融半径百分比系数，0~100。
+            connect (int): 轨迹连接标志
+                - 0：立即规划并执行轨迹，不与后续轨迹连接。
+                - 1：将当前轨迹与下一条轨迹一起规划，但不立即执行。
+
+        Returns:
+            Future: 运动完成后结果为0（到位）或1（规划失败），指令发送失败时结果为对应错误码：
+            - 1: 控制器返回false，参数错误或机械臂状态发生错误。
+            - -1: 数据发送失败，通信过程中出现问题。
+            - -2: 数据接收失败，通信过程中出现问题或者控制器超时没有返回。
+            - -3: 返回值解析失败，接收到的数据格式不正确或不完整。
+
+        Notes:
+            - 需使用双线程或三线程模式，到位通知来自rm_event.arm_event_router注册的事件回调
+            - connect为1时轨迹不会立即执行，Future在指令发送成功后即完成
+        """
+        return rm_send_with_arrival(self.handle.contents.id,
+                                    lambda: self.rm_movej_p(pose, v, r, connect, RM_MOVE_NBLOCK), connect=connect)
+
     def rm_set_movev_canfd_init(self, avoid_singularity_flag: int, frame_type: int, dt: int) -> int:
             """
             笛卡尔速度透传初始化
@@ -4564,6 +4804,28 @@ class ProjectManagement:
             self.handle, page_num, page_size, vague_search, byref(trajectorys))
         return ret, trajectorys.to_dict()
 
+    def rm_iter_program_trajectories(self, vague_search: str = '', page_size: int = 50, prefetch: int = 2) -> Iterator[dict[str, any]]:
+        """
+        逐项迭代全部符合条件的在线编程文件，按页查询并在后台提前查询后续的页
+
+        Args:
+            vague_search (str, optional): 模糊搜索. Defaults to ''.
+            page_size (int, optional): 每页大小，范围：1~100. Defaults to 50.
+            prefetch (int, optional): 最多提前查询的页数，为0时在迭代到每页时再查询. Defaults to 2.
+
+        Returns:
+            Iterator[dict[str, any]]: 逐项返回的生成器，每项同rm_get_program_trajectory_list返回字典中trajectory_list的一项
+
+        Raises:
+            PageFetchError: 任意一页查询失败，code为rm_get_program_trajectory_list返回的状态码
+
+        Notes:
+            迭代期间请勿在其他线程中调用rm_get_program_trajectory_list
+        """
+        from .rm_paging import iter_pages
+
+        return iter_pages(self.rm_get_program_trajectory_list, 'trajectory_list', 'list_size', vague_search, page_size, prefetch)
+
     def rm_set_program_id_run(self, tra_id: int, speed: int, timeout: int) -> int:
         """
         开始运行指定编号轨迹
@@ -4707,6 +4969,36 @@ class GlobalWaypointManage:
     """
     全局路点管理
     """
+    # 全局路点本地镜像，由rm_enable_waypoint_store启用
+    _waypoint_store = None
+
+    def rm_enable_waypoint_store(self, store: 'WaypointStore' = None, sync: bool = True) -> 'WaypointStore':
+        """
+        启用全局路点本地镜像
+
+        Args:
+            store (WaypointStore, optional): 镜像对象，为None时新建. Defaults to None.
+            sync (bool, optional): 是否立即与控制器同步全部路点. Defaults to True.
+
+        Returns:
+            WaypointStore: 正在使用的镜像对象，可通过其get、prefix、nearest_joint、nearest_pose查询路点
+
+        Notes:
+            - 启用后rm_add_global_waypoint、rm_update_global_waypoint成功时重新读取该路点以获取控制器记录的时间，
+              rm_delete_global_waypoint成功时从镜像中删除该路点
+            - 其他客户端对路点的修改需调用镜像对象的sync同步
+        """
+        from .rm_waypoint_store import WaypointStore
+
+        store = store if store is not None else WaypointStore(self)
+        if sync:
+            store.sync()
+        self._waypoint_store = store
+        return store
+
+    def rm_disable_waypoint_store(self) -> None:
+        """关闭全局路点本地镜像"""
+        self._waypoint_store = None
 
     def rm_add_global_waypoint(self, waypoint: rm_waypoint_t) -> int:
         """
@@ -4724,6 +5016,8 @@ class GlobalWaypointManage:
                 - -3: 返回值解析失败，控制器返回的数据无法识别或不完整等情况。
         """
         tag = rm_add_global_waypoint(self.handle, waypoint)
+        if tag == 0 and self._waypoint_store is not None:
+            self._waypoint_store.refresh(waypoint.to_dict()['point_name'])
         return tag
 
     def rm_update_global_waypoint(self, waypoint: rm_waypoint_t) -> int:
@@ -4742,6 +5036,8 @@ class GlobalWaypointManage:
                 - -3: 返回值解析失败，控制器返回的数据无法识别或不完整等情况。
         """
         tag = rm_update_global_waypoint(self.handle, waypoint)
+        if tag == 0 and self._waypoint_store is not None:
+            self._waypoint_store.refresh(waypoint.to_dict()['point_name'])
         return tag
 
     def rm_delete_global_waypoint(self, point_name: str) -> int:
@@ -4760,6 +5056,8 @@ class GlobalWaypointManage:
                 - -3: 返回值解析失败，控制器返回的数据无法识别或不完整等情况。
         """
         tag = rm_delete_global_waypoint(self.handle, point_name)
+        if tag == 0 and self._waypoint_store is not None:
+            self._waypoint_store.discard(point_name)
         return tag
 
     def rm_get_given_global_waypoint(self, point_name: str) -> tuple[int, dict[str, any]]:
@@ -4808,6 +5106,28 @@ class GlobalWaypointManage:
             self.handle, page_num, page_size, vague_search, byref(waypoint_list))
         return ret, waypoint_list.to_dict()
 
+    def rm_iter_global_waypoints(self, vague_search: str = '', page_size: int = 50, prefetch: int = 2) -> Iterator[dict[str, any]]:
+        """
+        逐项迭代全部符合条件的全局路点，按页查询并在后台提前查询后续的页
+
+        Args:
+            vague_search (str, optional): 模糊搜索. Defaults to ''.
+            page_size (int, optional): 每页大小，范围：1~100. Defaults to 50.
+            prefetch (int, optional): 最多提前查询的页数，为0时在迭代到每页时再查询. Defaults to 2.
+
+        Returns:
+            Iterator[dict[str, any]]: 逐项返回的生成器，每项同rm_get_global_waypoints_list返回字典中points_list的一项
+
+        Raises:
+            PageFetchError: 任意一页查询失败，code为rm_get_global_waypoints_list返回的状态码
+
+        Notes:
+            迭代期间请勿在其他线程中调用rm_get_global_waypoints_list
+        """
+        from .rm_paging import iter_pages
+
+        return iter_pages(self.rm_get_global_waypoints_list, 'points_list', 'total_size', vague_search, page_size, prefetch)
+
 
 class ElectronicFenceConfig:
     """
@@ -5252,6 +5572,56 @@ class UdpConfig:
         """
         rm_realtime_arm_state_call_back(arm_state_callback)
 
+    def rm_realtime_arm_state_view_call_back(self, arm_state_callback: Callable[[any], None]):
+        """
+        以NumPy视图模式注册UDP机械臂实时状态主动上报信息回调函数
+        回调函数接收与rm_realtime_arm_joint_state_t内存布局一致的只读NumPy结构化视图，不进行to_dict转换和数据拷贝
+
+        Args:
+            arm_state_callback (Callable[[np.ndarray], None]):
+                机械臂实时状态信息回调函数，参数字段与rm_realtime_arm_joint_state_t一致，
+                例如state['joint_status']['joint_position']
+
+        Notes:
+            - 依赖NumPy，数据类型见rm_realtime.RM_REALTIME_ARM_JOINT_STATE_DTYPE
+            - 视图仅在回调内有效期间引用推送数据，需要保存时请调用copy()
+            - 其余使用条件同rm_realtime_arm_state_call_back
+        """
+        from .rm_realtime import rm_realtime_arm_state_view_callback
+
+        # 保持回调函数引用，避免被垃圾回收后C库调用野指针
+        self._realtime_view_callback = rm_realtime_arm_state_view_callback(arm_state_callback)
+        rm_realtime_arm_state_call_back(self._realtime_view_callback)
+
+    def rm_add_realtime_arm_state_listener(self, listener: Callable[[rm_realtime_arm_joint_state_t], None],
+                                           port: int = None) -> None:
+        """
+        添加本机械臂的UDP实时状态监听函数
+        与rm_realtime_arm_state_call_back不同，监听函数仅接收arm_ip与本机械臂IP一致的数据，多个机械臂对象可同时添加，
+        由进程内唯一的实时状态路由器注册全局回调并按IP转发
+
+        Args:
+            listener (Callable[[rm_realtime_arm_joint_state_t], None]): 监听函数，在C库UDP接收线程中调用，
+                无需转换为rm_realtime_arm_state_callback_ptr
+            port (int, optional): 同一IP下存在多个数据源时，只接收arm_port为该值的数据. Defaults to None.
+
+        Notes:
+            - 需在rm_create_robot_arm之后调用，其余使用条件同rm_realtime_arm_state_call_back
+            - 路由器与rm_realtime_arm_state_call_back共用同一个全局回调，二者不能同时使用
+        """
+        realtime_state_router.add_listener(listener, self._ip, port)
+
+    def rm_remove_realtime_arm_state_listener(self, listener: Callable[[rm_realtime_arm_joint_state_t], None],
+                                              port: int = None) -> None:
+        """
+        移除本机械臂的UDP实时状态监听函数
+
+        Args:
+            listener (Callable[[rm_realtime_arm_joint_state_t], None]): 已添加的监听函数
+            port (int, optional): 添加时指定的端口. Defaults to None.
+        """
+        realtime_state_router.remove_listener(listener, self._ip, port)
+
 
 class TrajectoryManage:
     """
@@ -5282,6 +5652,28 @@ class TrajectoryManage:
             self.handle, page_num, page_size, vague_search, byref(trajectory_list))
         return ret, trajectory_list.to_dict()
 
+    def rm_iter_trajectory_files(self, vague_search: str = '', page_size: int = 50, prefetch: int = 2) -> Iterator[dict[str, any]]:
+        """
+        逐项迭代全部符合条件的拖动示教轨迹，按页查询并在后台提前查询后续的页
+
+        Args:
+            vague_search (str, optional): 模糊搜索. Defaults to ''.
+            page_size (int, optional): 每页大小，范围：1~100. Defaults to 50.
+            prefetch (int, optional): 最多提前查询的页数，为0时在迭代到每页时再查询. Defaults to 2.
+
+        Returns:
+            Iterator[dict[str, any]]: 逐项返回的生成器，每项同rm_get_trajectory_file_list返回字典中tra_list的一项
+
+        Raises:
+            PageFetchError: 任意一页查询失败，code为rm_get_trajectory_file_list返回的状态码
+
+        Notes:
+            迭代期间请勿在其他线程中调用rm_get_trajectory_file_list
+        """
+        from .rm_paging import iter_pages
+
+        return iter_pages(self.rm_get_trajectory_file_list, 'tra_list', 'total_size', vague_search, page_size, prefetch)
+
     def rm_set_run_trajectory(self, trajectory_name: str) -> int:
         """
         运行指定拖动示教轨迹(第四代控制器接口)
@@ -5339,6 +5731,50 @@ class ModbusV4:
     @details 四代控制器Modbus接口类，可通过该类提供的接口，实现对四代控制器的Modbus功能的控制。
     @attention 仅在四代控制器上可用。
     """
+    # Modbus读取缓存，由rm_enable_modbus_cache启用
+    _modbus_cache = None
+
+    def rm_enable_modbus_cache(self, cache: 'ModbusReadCache' = None, default_ttl: float = 0.1) -> 'ModbusReadCache':
+        """
+        启用Modbus读取缓存
+
+        Args:
+            cache (ModbusReadCache, optional): 缓存对象，为None时新建，多个机械臂对象可共用同一个，
+                缓存按机械臂的(ip, port)区分，不同控制器上相同主站及地址的数据互不影响. Defaults to None.
+            default_ttl (float, optional): 新建缓存对象时的默认有效期，单位：s. Defaults to 0.1.
+
+        Returns:
+            ModbusReadCache: 正在使用的缓存对象，可通过其set_ttl设置单个读取的有效期、add_listener添加数据变化监听函数
+
+        Notes:
+            - 缓存作用于rm_read_modbus_rtu_*与rm_read_modbus_tcp_*，仅缓存读取成功的结果
+            - rm_write_modbus_*写入后使地址范围重叠的缓存失效
+        """
+        from .rm_modbus_cache import ModbusReadCache
+
+        self._modbus_cache = cache if cache is not None else ModbusReadCache(default_ttl)
+        return self._modbus_cache
+
+    def rm_disable_modbus_cache(self) -> None:
+        """关闭Modbus读取缓存"""
+        self._modbus_cache = None
+
+    def _read_modbus(self, function, area: str, param) -> tuple[int, list[int]]:
+        def read():
+            data = (c_int * param.num)()
+            tag = function(self.handle, param, data)
+            return tag, [data[i] for i in range(param.num)]
+
+        cache = self._modbus_cache
+        if cache is None:
+            return read()
+        return cache.read(cache.bus_key(param), area, param.address, param.num, read, (self._ip, self._port))
+
+    def _invalidate_modbus(self, area: str, param) -> None:
+        cache = self._modbus_cache
+        if cache is not None:
+            cache.invalidate(cache.bus_key(param), area, param.address, param.num, (self._ip, self._port))
+
     def rm_add_modbus_tcp_master(self, modbus_tcp_master: rm_modbus_tcp_master_info_t) -> int:
         """
         添加Modbus TCP主站(第四代控制器接口)
@@ -5430,6 +5866,28 @@ class ModbusV4:
         master_list = rm_modbus_tcp_master_list_t()
         tag = rm_get_modbus_tcp_master_list(self.handle, page_num, page_size, vague_search, byref(master_list))
         return tag, master_list.to_dict()
+
+    def rm_iter_modbus_tcp_masters(self, vague_search: str = '', page_size: int = 50, prefetch: int = 2) -> Iterator[dict[str, any]]:
+        """
+        逐项迭代全部符合条件的Modbus TCP主站，按页查询并在后台提前查询后续的页
+
+        Args:
+            vague_search (str, optional): 模糊搜索. Defaults to ''.
+            page_size (int, optional): 每页大小，范围：1~100. Defaults to 50.
+            prefetch (int, optional): 最多提前查询的页数，为0时在迭代到每页时再查询. Defaults to 2.
+
+        Returns:
+            Iterator[dict[str, any]]: 逐项返回的生成器，每项同rm_get_modbus_tcp_master_list返回字典中master_list的一项
+
+        Raises:
+            PageFetchError: 任意一页查询失败，code为rm_get_modbus_tcp_master_list返回的状态码
+
+        Notes:
+            迭代期间请勿在其他线程中调用rm_get_modbus_tcp_master_list
+        """
+        from .rm_paging import iter_pages
+
+        return iter_pages(self.rm_get_modbus_tcp_master_list, 'master_list', 'total_size', vague_search, page_size, prefetch)
     
     def rm_set_controller_rs485_mode(self, mode:int, baudrate:int) -> int:
         """
@@ -5525,9 +5983,7 @@ class ModbusV4:
                     - -4: 三代控制器不支持该接口
                 -list[int] 返回读线圈数据，数组大小为param.num
         """
-        data = (c_int * param.num)()
-        tag = rm_read_modbus_rtu_coils(self.handle, param, data)
-        return tag, [data[i] for i in range(param.num)]
+        return self._read_modbus(rm_read_modbus_rtu_coils, 'coils', param)
     
     def rm_write_modbus_rtu_coils(self, param:rm_modbus_rtu_write_params_t) -> int:
         """
@@ -5544,6 +6000,7 @@ class ModbusV4:
                 - -4: 三代控制器不支持该接口
         """
         tag = rm_write_modbus_rtu_coils(self.handle, param)
+        self._invalidate_modbus('coils', param)
         return tag
 
     def rm_read_modbus_rtu_input_status(self, param:rm_modbus_rtu_read_params_t) -> tuple[int, list[int]]:
@@ -5562,9 +6019,7 @@ class ModbusV4:
                     - -4: 三代控制器不支持该接口
                 -list[int] 返回读离散量输入数据，数组大小为param.num
         """
-        data = (c_int * param.num)()
-        tag = rm_read_modbus_rtu_input_status(self.handle, param, data)
-        return tag, [data[i] for i in range(param.num)]
+        return self._read_modbus(rm_read_modbus_rtu_input_status, 'input_status', param)
 
     def rm_read_modbus_rtu_holding_registers(self, param:rm_modbus_rtu_read_params_t) -> tuple[int, list[int]]:
         """
@@ -5582,9 +6037,7 @@ class ModbusV4:
                     - -4: 三代控制器不支持该接口
                 -list[int] 返回读保持寄存器数据，数组大小为param.num
         """
-        data = (c_int * param.num)()
-        tag = rm_read_modbus_rtu_holding_registers(self.handle, param, data)
-        return tag, [data[i] for i in range(param.num)]
+        return self._read_modbus(rm_read_modbus_rtu_holding_registers, 'holding_registers', param)
     
     def rm_write_modbus_rtu_registers(self, param:rm_modbus_rtu_write_params_t) -> int:
         """
@@ -5601,6 +6054,7 @@ class ModbusV4:
                 - -4: 三代控制器不支持该接口
         """
         tag = rm_write_modbus_rtu_registers(self.handle, param)
+        self._invalidate_modbus('holding_registers', param)
         return tag
     
     def rm_read_modbus_rtu_input_registers(self, param:rm_modbus_rtu_read_params_t) -> tuple[int, list[int]]:
@@ -5619,9 +6073,7 @@ class ModbusV4:
                     - -4: 三代控制器不支持该接口
                 -list[int] 返回读输入寄存器数据，数组大小为param.num
         """
-        data = (c_int * param.num)()
-        tag = rm_read_modbus_rtu_input_registers(self.handle, param, data)
-        return tag, [data[i] for i in range(param.num)] 
+        return self._read_modbus(rm_read_modbus_rtu_input_registers, 'input_registers', param)
     
     def rm_read_modbus_tcp_coils(self, param:rm_modbus_tcp_read_params_t) -> tuple[int, list[int]]:
         """
@@ -5639,9 +6091,7 @@ class ModbusV4:
                     - -4: 三代控制器不支持该接口
                 -list[int] 返回读线圈数据，数组大小为param.num
         """
-        data = (c_int * param.num)()
-        tag = rm_read_modbus_tcp_coils(self.handle, param, data)
-        return tag, [data[i] for i in range(param.num)]
+        return self._read_modbus(rm_read_modbus_tcp_coils, 'coils', param)
 
     def rm_write_modbus_tcp_coils(self, param:rm_modbus_tcp_write_params_t) -> int:
         """
@@ -5658,6 +6108,7 @@ class ModbusV4:
                 - -4: 三代控制器不支持该接口
         """
         tag = rm_write_modbus_tcp_coils(self.handle, param)
+        self._invalidate_modbus('coils', param)
         return tag
     
     def rm_read_modbus_tcp_input_status(self, param:rm_modbus_tcp_read_params_t) -> tuple[int, list[int]]:
@@ -5676,9 +6127,7 @@ class ModbusV4:
                     - -4: 三代控制器不支持该接口
                 -list[int] 返回读离散量输入数据，数组大小为param.num
         """
-        data = (c_int * param.num)()
-        tag = rm_read_modbus_tcp_input_status(self.handle, param, data) 
-        return tag, [data[i] for i in range(param.num)]
+        return self._read_modbus(rm_read_modbus_tcp_input_status, 'input_status', param)
     
     def rm_read_modbus_tcp_holding_registers(self, param:rm_modbus_tcp_read_params_t) -> tuple[int, list[int]]:
         """
@@ -5696,9 +6145,7 @@ class ModbusV4:
                     - -4: 三代控制器不支持该接口
                 -list[int] 返回读保持寄存器数据，数组大小为param.num
         """
-        data = (c_int * param.num)()
-        tag = rm_read_modbus_tcp_holding_registers(self.handle, param, data)
-        return tag, [data[i] for i in range(param.num)]
+        return self._read_modbus(rm_read_modbus_tcp_holding_registers, 'holding_registers', param)
 
     def rm_write_modbus_tcp_registers(self, param:rm_modbus_tcp_write_params_t) -> int:
         """
@@ -5715,6 +6162,7 @@ class ModbusV4:
                 - -4: 三代控制器不支持该接口
         """
         tag = rm_write_modbus_tcp_registers(self.handle, param)
+        self._invalidate_modbus('holding_registers', param)
         return tag
 
     def rm_read_modbus_tcp_input_registers(self, param:rm_modbus_tcp_read_params_t) -> tuple[int, list[int]]:
@@ -5733,9 +6181,7 @@ class ModbusV4:
                     - -4: 三代控制器不支持该接口
                 -list[int] 返回读输入寄存器数据，数组大小为param.num
         """
-        data = (c_int * param.num)()
-        tag = rm_read_modbus_tcp_input_registers(self.handle, param, data)
-        return tag, [data[i] for i in range(param.num)]
+        return self._read_modbus(rm_read_modbus_tcp_input_registers, 'input_registers', param)
 
 class ActionV4:
     """四代控制器末端动作接口类
@@ -5767,6 +6213,28 @@ class ActionV4:
         ret = rm_get_tool_action_list(
             self.handle, page_num, page_size, vague_search, byref(list))
         return ret, list.to_dict()
+
+    def rm_iter_tool_actions(self, vague_search: str = '', page_size: int = 50, prefetch: int = 2) -> Iterator[dict[str, any]]:
+        """
+        逐项迭代全部符合条件的末端动作，按页查询并在后台提前查询后续的页
+
+        Args:
+            vague_search (str, optional): 模糊搜索. Defaults to ''.
+            page_size (int, optional): 每页大小，范围：1~100. Defaults to 50.
+            prefetch (int, optional): 最多提前查询的页数，为0时在迭代到每页时再查询. Defaults to 2.
+
+        Returns:
+            Iterator[dict[str, any]]: 逐项返回的生成器，每项同rm_get_tool_action_list返回字典中act_list的一项
+
+        Raises:
+            PageFetchError: 任意一页查询失败，code为rm_get_tool_action_list返回的状态码
+
+        Notes:
+            迭代期间请勿在其他线程中调用rm_get_tool_action_list
+        """
+        from .rm_paging import iter_pages
+
+        return iter_pages(self.rm_get_tool_action_list, 'act_list', 'total_size', vague_search, page_size, prefetch)
     
     def rm_run_tool_action(self, action_name: str) -> int:
         """
@@ -5854,1003 +6322,73 @@ class ActionV4:
 
      
    
-class Algo:
-    """
-    算法接口
-    @details 针对睿尔曼机械臂，提供正逆解、各种位姿参数转换等工具接口。既可通过RoboticArm类连接机械臂使用该类中的成员函数，也可单独使用该类
+class RoboticArm(ArmState, MovePlan, JointConfigSettings, JointConfigReader, ArmTipVelocityParameters,
+                 ToolCoordinateConfig, WorkCoordinateConfig, ArmTeachMove, ArmMotionControl, ControllerConfig,
+                 CommunicationConfig, ControllerIOConfig, EffectorIOConfig, GripperControl, Force, DragTeach, HandControl, ModbusConfig, InstallPos,
+                 ForcePositionControl, ProjectManagement, GlobalWaypointManage, ElectronicFenceConfig, SelfCollision,
+                 UdpConfig, Algo, LiftControl, ExpandControl, TrajectoryManage, ModbusV4, ActionV4):
+    """机械臂连接、断开、日志设置等操作
     """
 
-    def __init__(self, arm_model: rm_robot_arm_model_e, force_type: rm_force_type_e, arm_dof: int = -1, dh: rm_dh_t = None):
-        """初始化算法依赖
+    _instrumentation = None
+    # 进程级线程模式，由第一次传入mode的构造调用rm_init确定，尚未初始化时为None
+    _thread_mode = None
+    # rm_create_robot_arm时读取的机械臂基本信息字典，未连接或读取失败时为None
+    _robot_info = None
+
+    def __init__(self, mode: rm_thread_mode_e = None):
+        """初始化线程模式
 
         Args:
-            arm_model (rm_robot_arm_model_e): 机械臂型号
-            force_type (rm_force_type_e): 传感器类型
-            arm_dof (int, optional): 机械臂自由度，设置机械臂型号为通用型（RM_MODEL_UNIVERSAL_E）时需设置机械臂自由度. Defaults to -1.
-            dh (rm_dh_t, optional): 根据给定的DH参数判断机械臂类型，设置为None时根据arm_model判断机械臂类型. Defaults to None.
+            mode (rm_thread_mode_e): 
+                    RM_SINGLE_MODE_E：单线程模式，单线程非阻塞等待数据返回；  
+                    RM_DUAL_MODE_E：双线程模式，增加接收线程监测队列中的数据；  
+                    RM_TRIPLE_MODE_E：三线程模式，在双线程模式基础上增加线程监测UDP接口数据；
         """
-        self.handle = rm_robot_handle()
-        if(dh is not None):
-            arm_model = rm_robot_arm_model_e.RM_MODEL_UNIVERSAL_E
-            rm_algo_init_sys_data_by_dh(force_type, dh, arm_dof)
-        else:
-            rm_algo_init_sys_data(arm_model, force_type)
-
-        ARM_7DOF_MODELS = {
-            rm_robot_arm_model_e.RM_MODEL_RM_75_E,
-            rm_robot_arm_model_e.RM_MODEL_GEN_72_E,
-            rm_robot_arm_model_e.RM_MODEL_ZM7L_E,
-            rm_robot_arm_model_e.RM_MODEL_ZM7R_E,
-            rm_robot_arm_model_e.RM_MODEL_RXL75_E,
-            rm_robot_arm_model_e.RM_MODEL_RXR75_E,
-            rm_robot_arm_model_e.RM_MODEL_ZPFL74_E,
-            rm_robot_arm_model_e.RM_MODEL_ZPFR74_E, 
-            rm_robot_arm_model_e.RM_MODEL_RXL75II_E,   
-            rm_robot_arm_model_e.RM_MODEL_RXR75II_E,    
-
-        }
-        if arm_model == rm_robot_arm_model_e.RM_MODEL_UNIVERSAL_E:
-            if arm_dof == -1:
-                raise Exception("arm_dof is not set")
-            else:
-                rm_algo_set_robot_dof(arm_dof)
-                self.arm_dof = arm_dof
-        elif arm_model in ARM_7DOF_MODELS:
-            self.arm_dof = 7
-        else:
-            self.arm_dof = 6
-
-        if(arm_model == rm_robot_arm_model_e.RM_MODEL_ZM7L_E or arm_model == rm_robot_arm_model_e.RM_MODEL_ZM7R_E or 
-           arm_model == rm_robot_arm_model_e.RM_MODEL_RXL75_E or arm_model == rm_robot_arm_model_e.RM_MODEL_RXR75_E or
-           arm_model == rm_robot_arm_model_e.RM_MODEL_ZPFL74_E or arm_model == rm_robot_arm_model_e.RM_MODEL_ZPFR74_E or
-           arm_model == rm_robot_arm_model_e.RM_MODEL_RXL75II_E or arm_model == rm_robot_arm_model_e.RM_MODEL_RXR75II_E):
-            self.dh_dof = 8
-        else:
-            self.dh_dof = self.arm_dof
-
-    def rm_algo_version(self) -> str:
-        """获取算法库版本
+        if mode == None:
+            return
+        rm_init(mode)
+        RoboticArm._thread_mode = rm_thread_mode_e(mode)
+        print("current c api version: ", rm_api_version())
 
-        Returns:
-            str: 算法库版本号
+    def rm_create_robot_arm(self, ip: str, port: int, level: int = 3, log_func: CFUNCTYPE = None) -> rm_robot_handle:
         """
-        return rm_algo_version()
-
-    def rm_algo_set_angle(self, x: float, y: float, z: float) -> None:
-        """设置安装角度
+        初始化RoboticArm类，创建机械臂连接控制句柄。
 
         Args:
-            x (float): X轴安装角度 单位°
-            y (float): Y轴安装角度 单位°
-            z (float): z轴安装角度 单位°
-        """
-        rm_algo_set_angle(x, y, z)
-
-    def rm_algo_get_angle(self) -> tuple[float, float, float]:
-        """获取安装角度
+            ip (str): 机械臂的IP地址。
+            port (int): 机械臂的端口号。
+            level (int, optional): 日志打印等级，默认为3。
+                - 0: debug模式
+                - 1: info模式
+                - 2: warning模式
+                - 3: error模式
+            log_func (CFUNCTYPE, optional): 自定义日志打印函数（当前Python版本API暂不支持）。默认为None。
 
         Returns:
-            tuple[float,float,float]: 包含三个浮点数的元组，分别代表x、y和z轴的安装角度，单位：°
-        """
-        x = c_float()
-        y = c_float()
-        z = c_float()
-        rm_algo_get_angle(x, y, z)
-
-        return x.value, y.value, z.value
-
-    def rm_algo_set_redundant_parameter_traversal_mode(self, mode: bool) -> None:
+            rm_robot_handle: 机械臂句柄，其中包含机械臂id标识。
         """
-        设置逆解求解模式
-
-        Args:
-            mode (bool): 
-                - true：遍历模式，冗余参数遍历的求解策略。适于当前位姿跟要求解的位姿差别特别大的应用场景，如MOVJ_P、位姿编辑等，耗时较长
-                - false：单步模式，自动调整冗余参数的求解策略。适于当前位姿跟要求解的位姿差别特别小、连续周期控制的场景，如笛卡尔空间规划的位姿求解等，耗时短
-
-        """
-        rm_algo_set_redundant_parameter_traversal_mode(mode)
-
-    def rm_algo_set_workframe(self, frame: rm_frame_t) -> None:
-        """
-        设置工作坐标系
-
-        Args:
-            frame (rm_frame_t): 坐标系数据
-        """
-        rm_algo_set_workframe(frame)
-
-    def rm_algo_get_curr_workframe(self) -> dict[str, any]:
-        """
-        获取当前工作坐标系
-
-        Returns:
-            dict[str, any]: 返回当前工作坐标系字典，键为rm_frame_t结构体的字段名称
-        """
-        frame = rm_frame_t()
-        rm_algo_get_curr_workframe(byref(frame))
-        return frame.to_dictionary()
-
-    def rm_algo_set_toolframe(self, frame: rm_frame_t) -> None:
-        """
-        设置工具坐标系
-
-        Args:
-            frame (rm_frame_t): 坐标系数据
-        """
-
-        rm_algo_set_toolframe(frame)
-
-    def rm_algo_get_curr_toolframe(self) -> dict[str, any]:
-        """
-        获取算法当前工具坐标系
-
-        Returns:
-            dict[str, any]: 返回当前工具坐标系字典，键为rm_frame_t结构体的字段名称
-        """
-        frame = rm_frame_t()
-        rm_algo_get_curr_toolframe(byref(frame))
-        return frame.to_dictionary()
-
-    def rm_algo_set_joint_max_limit(self, joint_limit: list[float]) -> None:
-        """
-        设置算法关节最大限位
-
-        Args:
-            joint_limit (list[float]): 关节最大限位数组，单位：°
-        """
-        if self.arm_dof != 0:
-            joint_positions = (c_float * self.arm_dof)(*joint_limit)
-        else:
-            joint_positions = (c_float * ARM_DOF)(*joint_limit)
-        rm_algo_set_joint_max_limit(joint_positions)
-
-    def rm_algo_get_joint_max_limit(self) -> list[float]:
-        """
-        获取算法关节最大限位
-
-        Returns:
-            list[float]: 关节最大限位数组，单位：°
-        """
-        if self.arm_dof != 0:
-            joint_positions = (c_float * self.arm_dof)()
-        else:
-            joint_positions = (c_float * ARM_DOF)()
-        rm_algo_get_joint_max_limit(joint_positions)
-        return list(joint_positions)
-
-    def rm_algo_set_joint_min_limit(self, joint_limit: list[float]) -> None:
-        """
-        设置算法关节最小限位
-
-        Args:
-            joint_limit (list[float]): 关节最小限位数组，单位：°
-        """
-        if self.arm_dof != 0:
-            joint_positions = (c_float * self.arm_dof)(*joint_limit)
-        else:
-            joint_positions = (c_float * ARM_DOF)(*joint_limit)
-        rm_algo_set_joint_min_limit(joint_positions)
-
-    def rm_algo_get_joint_min_limit(self) -> list[float]:
-        """
-        获取算法关节最小限位
-
-        Returns:
-            list[float]: 关节最小限位数组，单位：°
-        """
-        if self.arm_dof != 0:
-            joint_positions = (c_float * self.arm_dof)()
-        else:
-            joint_positions = (c_float * ARM_DOF)()
-        rm_algo_get_joint_min_limit(joint_positions)
-        return list(joint_positions)
-
-    def rm_algo_set_joint_max_speed(self, joint_limit: list[float]) -> None:
-        """
-        设置算法关节最大速度
-
-        Args:
-            joint_limit (list[float]): 关节最大速度，单位：RPM
-        """
-        if self.arm_dof != 0:
-            speed = (c_float * self.arm_dof)(*joint_limit)
-        else:
-            speed = (c_float * ARM_DOF)(*joint_limit)
-        rm_algo_set_joint_max_speed(speed)
-
-    def rm_algo_get_joint_max_speed(self) -> list[float]:
-        """
-        获取算法关节最大速度
-
-        Returns:
-            list[float]: 关节最大速度，单位：RPM
-        """
-        if self.arm_dof != 0:
-            speed = (c_float * self.arm_dof)()
-        else:
-            speed = (c_float * ARM_DOF)()
-        rm_algo_get_joint_max_speed(speed)
-        return list(speed)
-
-    def rm_algo_set_joint_max_acc(self, joint_limit: list[float]) -> None:
-        """
-        设置算法关节最大加速度
-
-        Args:
-            joint_limit (list[float]): 关节最大加速度，单位：RPM/s
-        """
-        if self.arm_dof != 0:
-            acc = (c_float * self.arm_dof)(*joint_limit)
-        else:
-            acc = (c_float * ARM_DOF)(*joint_limit)
-        rm_algo_set_joint_max_acc(acc)
-
-    def rm_algo_get_joint_max_acc(self) -> list[float]:
-        """
-        获取算法关节最大加速度
-
-        Returns:
-            list[float]: 关节最大加速度，单位：RPM/s
-        """
-        if self.arm_dof != 0:
-            acc = (c_float * self.arm_dof)()
-        else:
-            acc = (c_float * ARM_DOF)()
-        rm_algo_get_joint_max_acc(acc)
-        return list(acc)
-
-    def rm_algo_inverse_kinematics(self, params: rm_inverse_kinematics_params_t) -> tuple[int, list[float]]:
-        """
-        逆解函数
-
-        Args:
-            params (rm_inverse_kinematics_params_t): 逆解输入参数结构体
-
-        Returns:
-            tuple[int,list[float]]: 包含两个元素的元组。
-                -int 逆解结果
-                    - 0: 逆解成功
-                    - 1: 逆解失败
-                    - -1: 上一时刻关节角度输入为空
-                    - -2: 目标位姿四元数不合法
-                -list[float] 输出的关节角度 单位°，长度为机械臂自由度
-        """
-        q_out = (c_float * ARM_DOF)()
-
-        ret = rm_algo_inverse_kinematics(self.handle, params, q_out)
-        out = list(q_out)
-        return ret, out[:self.arm_dof]
-
-    def rm_algo_inverse_kinematics_all(self, params:rm_inverse_kinematics_params_t) -> rm_inverse_kinematics_all_solve_t:
-        """
-        计算逆运动学全解(当前仅支持六自由度机器人)
-        Args:
-            params(rm_inverse_kinematics_params_t) 逆解输入参数结构体
-        Returns:
-            rm_inverse_kinematics_all_solve_t 逆解的全解结构体
-        """
-        ret = rm_inverse_kinematics_all_solve_t()
-        ret = rm_algo_inverse_kinematics_all(self.handle, params)
-        return ret
-
-
-    def rm_algo_ikine_select_ik_solve(self, weight:list[float], params:rm_inverse_kinematics_all_solve_t) -> int:
-        """
-        从多解中选取最优解(当前仅支持六自由度机器人)
-        Args:
-            weight(list[float]) 权重,建议默认值为{1,1,1,1,1,1}
-            params(rm_inverse_kinematics_all_solve_t) 待选解的全解结构体
-        Returns:
-            int 最优解索引，选解结果为ik_solve.q_solve[i] -1：当前机器人非六自由度，当前仅支持六自由度机器人
-        """
-        weight_c = (c_float * 6)(*weight)
-        ret = rm_algo_ikine_select_ik_solve(weight_c, params)
-        return ret
-
-
-    def rm_algo_ikine_check_joint_position_limit(self, q_solve_i:list[float]) -> int:
-        """
-        检查逆解结果是否超出关节限位(当前仅支持六自由度机器人)
-        Args:
-            q_solve_i (list[float]) 一组解，即一组关节角度，单位:°
-        Returns:
-            0:表示未超限 i:表示关节i超限，优先报序号小的关节 -1：当前机器人非六自由度，当前仅支持六自由度机器人
-        """
-        ret = rm_algo_ikine_check_joint_position_limit(q_solve_i)
-        return ret
-
-
-    def rm_algo_ikine_check_joint_velocity_limit(self, dt:float, q_ref:list[float], q_solve_i:list[float]) -> int:
-        """
-        检查逆解结果是否超出速度限位(当前仅支持六自由度机器人)
-        Args:
-            dt 两帧数据之间的时间间隔，即控制周期，单位sec
-            q_ref(list[float]) 参考关节角度或者第一帧数据角度，单位：°
-            q_solve_i (list[float]) 一组解，即一组关节角度，单位:°
-        Returns:
-            int 0:表示未超限 i:表示关节i超限，优先报序号小的关节 -1：当前机器人非六自由度，当前仅支持六自由度机器人
-        """
-        q_ref_c = (c_float * 8)(*q_ref)
-        q_solve_c = (c_float * 8)(*q_solve_i)
-        
-        ret = rm_algo_ikine_check_joint_velocity_limit(dt, q_ref_c, q_solve_c)
-        return ret
-    
-    def rm_algo_calculate_arm_angle_from_config_rm75(self,q_ref:list[float]) -> tuple[int, float]:
-        """
-        根据参考位形计算臂角大小（仅支持RM75）
-        Args:
-            q_ref(list[float]),当前参考位形的关节角度，单位°
-        Returns:
-            int: - 0: 求解成功 - -1: 求解失败，或机型非RM75  - -2: q_ref 输入参数非法
-            float: 计算结果，当前参考位形对应的臂角大小，单位°
-        """
-        q_ref_c = (c_float * ARM_DOF)(*q_ref)
-        arm_angle = c_float()
-        ret = rm_algo_calculate_arm_angle_from_config_rm75(q_ref_c, byref(arm_angle))
-        return ret,arm_angle.value
-
-    def rm_algo_inverse_kinematics_rm75_for_arm_angle(self,params:rm_inverse_kinematics_params_t,arm_angle:float) -> tuple[int,list[float]]:
-        """
-        臂角法求解RM75逆运动学
-        Args:
-            params:rm_inverse_kinematics_params_t,逆解参数结构体
-            arm_angle:float,指定轴角大小,单位:°
-        Returns:
-            int 0: 求解成功
-               -1: 求解失败
-               -2: 求解结果超出限位
-               -3: 机型非RM75
-            list[float]: q_solve，求解结果,单位:°
-        """
-        q_solve = (c_float * ARM_DOF)()
-        ret = rm_algo_inverse_kinematics_rm75_for_arm_angle(params,arm_angle,q_solve)
-        out = list(q_solve)
-        return ret, out[:self.arm_dof]
-
-
-    def rm_algo_forward_kinematics(self, joint: list[float], flag: int = 1) -> list[float]:
-        """
-        正解算法接口
-
-        Args:
-            joint (list[float]): 关节角度，单位：°
-            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
-                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
-                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
-
-        Returns:
-            list[float]: 解得目标位姿列表
-        """
-        if self.arm_dof != 0:
-            joint = (c_float * self.arm_dof)(*joint)
-        else:
-            joint = (c_float * ARM_DOF)(*joint)
-        pose = rm_algo_forward_kinematics(self.handle, joint)
-        position = pose.position
-        euler = pose.euler
-        qua = pose.quaternion
-        pose_eul = [position.x, position.y,
-                    position.z, euler.rx, euler.ry, euler.rz]
-        pose_qua = [position.x, position.y,
-                    position.z, qua.w, qua.x, qua.y, qua.z]
-        return pose_eul if flag else pose_qua
-        # 保留三位小数
-        # return [round(value, 3) for value in pose_eul] if flag else [round(value, 3) for value in pose_qua]
-
-    def rm_algo_euler2quaternion(self, eul: list[float]) -> list[float]:
-        """
-        欧拉角转四元数
-
-        Args:
-            eul (list[float]): 欧拉角列表[rx.ry,rz]，单位：rad
-
-        Returns:
-            list[float]: 四元数列表[w,x,y,z]
-        """
-        eul = rm_euler_t(*eul)
-        quat = rm_algo_euler2quaternion(eul)
-        return [quat.w, quat.x, quat.y, quat.z]
-
-    def rm_algo_quaternion2euler(self, quat: list[float]) -> list[float]:
-        """
-        四元数转欧拉角
-
-        Args:
-            quat (list[float]): 四元数列表[w,x,y,z]
-
-        Returns:
-            list[float]: 欧拉角列表[rx.ry,rz]，单位：rad
-        """
-        quat = rm_quat_t(*quat)
-        eul = rm_algo_quaternion2euler(quat)
-        return [eul.rx, eul.ry, eul.rz]
-
-    def rm_algo_euler2matrix(self, eu: list[float]) -> rm_matrix_t:
-        """
-        欧拉角转旋转矩阵
-
-        Args:
-            eu (list[float]): 欧拉角列表[rx.ry,rz]，单位：rad
-
-        Returns:
-            rm_matrix_t: 旋转矩阵
-        """
-        eu = rm_euler_t(*eu)
-        matrix = rm_algo_euler2matrix(eu)
-        return matrix
-
-    def rm_algo_pos2matrix(self, pose: list[float]) -> rm_matrix_t:
-        """
-        位姿转旋转矩阵
-
-        Args:
-            pose (list[float]): 位置姿态列表[x,y,z,rx,ry,rz]
-
-        Returns:
-            rm_matrix_t: 旋转矩阵
-        """
-        po1 = rm_pose_t()
-        po1.position = rm_position_t(*pose[:3])
-        po1.euler = rm_euler_t(*pose[3:])
-        matrix = rm_algo_pos2matrix(po1)
-        return matrix
-
-    def rm_algo_matrix2pos(self, matrix: rm_matrix_t, flag: int = 1) -> list[float]:
-        """
-        旋转矩阵转位姿
-
-        Args:
-            matrix (rm_matrix_t): 旋转矩阵
-            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
-                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
-                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
-
-        Returns:
-            list[float]: 解得目标位姿
-        """
-        pose = rm_algo_matrix2pos(matrix)
-        position = pose.position
-        euler = pose.euler
-        qua = pose.quaternion
-        pose_eul = [position.x, position.y,
-                    position.z, euler.rx, euler.ry, euler.rz]
-        pose_qua = [position.x, position.y,
-                    position.z, qua.w, qua.x, qua.y, qua.z]
-        return pose_eul if flag else pose_qua
-        # return pose.to_dict()
-
-    def rm_algo_base2workframe(self, matrix: rm_matrix_t, pose_in_base: rm_pose_t, flag: int = 1) -> list[float]:
-        """
-        基坐标系转工作坐标系
-
-        Args:
-            matrix (rm_matrix_t): 工作坐标系在基坐标系下的矩阵
-            pose_in_base (rm_pose_t): 工具端坐标在基坐标系下位姿
-            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
-                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
-                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
-
-        Returns:
-            list[float]: 基坐标系在工作坐标系下的位姿
-        """
-        pose_in_work = rm_algo_matrix2pos(matrix, pose_in_base)
-        position = pose_in_work.position
-        euler = pose_in_work.euler
-        qua = pose_in_work.quaternion
-        pose_eul = [position.x, position.y,
-                    position.z, euler.rx, euler.ry, euler.rz]
-        pose_qua = [position.x, position.y,
-                    position.z, qua.w, qua.x, qua.y, qua.z]
-        return pose_eul if flag else pose_qua
-        # return pose_in_work.to_dict()
-
-    def rm_algo_workframe2base(self, matrix: rm_matrix_t, pose_in_work: rm_pose_t, flag: int = 1) -> list[float]:
-        """
-        工作坐标系转基坐标系
-
-        Args:
-            matrix (rm_matrix_t): 工具端坐标在工作坐标系下矩阵
-            pose_in_work (rm_pose_t): 工具端坐标在工作坐标系下位姿
-            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
-                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
-                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
-
-        Returns:
-            list[float]: 工作坐标系在基坐标系下的位姿
-        """
-        pose_in_base = rm_algo_workframe2base(matrix, pose_in_work)
-        position = pose_in_base.position
-        euler = pose_in_base.euler
-        qua = pose_in_base.quaternion
-        pose_eul = [position.x, position.y,
-                    position.z, euler.rx, euler.ry, euler.rz]
-        pose_qua = [position.x, position.y,
-                    position.z, qua.w, qua.x, qua.y, qua.z]
-        return pose_eul if flag else pose_qua
-        # return pose_in_base.to_dict()
-
-    def rm_algo_end2tool(self, eu_end: rm_pose_t, flag: int = 1) -> list[float]:
-        """
-        末端位姿转成工具位姿
-
-        Args:
-            eu_end (rm_pose_t): 基于世界坐标系和默认工具坐标系的末端位姿
-            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
-                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
-                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
-
-        Returns:
-            list[float]: 基于工作坐标系和工具坐标系的末端位姿
-        """
-        end_pose = rm_algo_end2tool(self.handle, eu_end)
-        position = end_pose.position
-        euler = end_pose.euler
-        qua = end_pose.quaternion
-        pose_eul = [position.x, position.y,
-                    position.z, euler.rx, euler.ry, euler.rz]
-        pose_qua = [position.x, position.y,
-                    position.z, qua.w, qua.x, qua.y, qua.z]
-        return pose_eul if flag else pose_qua
-        # return end_pose.to_dict()
-
-    def rm_algo_tool2end(self, eu_tool: rm_pose_t, flag: int = 1) -> list[float]:
-        """
-        工具位姿转末端位姿
-
-        Args:
-            eu_tool (rm_pose_t): 基于工作坐标系和工具坐标系的末端位姿
-            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
-                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
-                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
-
-        Returns:
-            list[float]: 基于世界坐标系和默认工具坐标系的末端位姿
-        """
-        end_pose = rm_algo_tool2end(self.handle, eu_tool)
-        position = end_pose.position
-        euler = end_pose.euler
-        qua = end_pose.quaternion
-        pose_eul = [position.x, position.y,
-                    position.z, euler.rx, euler.ry, euler.rz]
-        pose_qua = [position.x, position.y,
-                    position.z, qua.w, qua.x, qua.y, qua.z]
-        return pose_eul if flag else pose_qua
-        # return end_pose.to_dict()
-
-    def rm_algo_rotate_move(self, curr_joint: list[float], rotate_axis: int, rotate_angle: float, choose_axis: rm_pose_t, flag: int = 1) -> list[float]:
-        """
-        计算环绕运动位姿
-
-        Args:
-            curr_joint (list[float]): 当前关节角度 单位°
-            rotate_axis (int): 旋转轴: 1:x轴, 2:y轴, 3:z轴
-            rotate_angle (float): 旋转角度: 旋转角度, 单位(度)
-            choose_axis (rm_pose_t): 指定计算时使用的坐标系
-            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
-                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
-                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
-
-        Returns:
-            list[float]: 目标位姿
-        """
-        if self.arm_dof != 0:
-            curr_joint = (c_float * self.arm_dof)(*curr_joint)
-        else:
-            curr_joint = (c_float * ARM_DOF)(*curr_joint)
-        pose = rm_algo_rotate_move(
-            self.handle, curr_joint, rotate_axis, rotate_angle, choose_axis)
-        position = pose.position
-        euler = pose.euler
-        qua = pose.quaternion
-        pose_eul = [position.x, position.y,
-                    position.z, euler.rx, euler.ry, euler.rz]
-        pose_qua = [position.x, position.y,
-                    position.z, qua.w, qua.x, qua.y, qua.z]
-        return pose_eul if flag else pose_qua
-        # return pose.to_dict()
-
-    def rm_algo_cartesian_tool(self, curr_joint: list[float], move_lengthx: float, move_lengthy: float, move_lengthz: float, flag: int = 1) -> list[float]:
-        """
-        计算沿工具坐标系运动位姿
-
-        Args:
-            curr_joint (list[float]): 当前关节角度，单位：度
-            move_lengthx (float): 沿X轴移动长度，单位：米
-            move_lengthy (float): 沿Y轴移动长度，单位：米
-            move_lengthz (float): 沿Z轴移动长度，单位：米
-            flag (int, optional): 选择姿态表示方式，默认欧拉角表示姿态
-                - 0: 返回使用四元数表示姿态的位姿列表[x,y,z,w,x,y,z]
-                - 1: 返回使用欧拉角表示姿态的位姿列表[x,y,z,rx,ry,rz]
-
-        Returns:
-            list[float]: 目标位姿
-        """
-        if self.arm_dof != 0:
-            curr_joint = (c_float * self.arm_dof)(*curr_joint)
-        else:
-            curr_joint = (c_float * ARM_DOF)(*curr_joint)
-        pose = rm_algo_cartesian_tool(
-            self.handle, curr_joint, move_lengthx, move_lengthy, move_lengthz)
-        position = pose.position
-        euler = pose.euler
-        qua = pose.quaternion
-        pose_eul = [position.x, position.y,
-                    position.z, euler.rx, euler.ry, euler.rz]
-        pose_qua = [position.x, position.y,
-                    position.z, qua.w, qua.x, qua.y, qua.z]
-        return pose_eul if flag else pose_qua
-        # return pose.to_dict()
-
-    def rm_algo_pose_move(self, poseCurrent: list[float], deltaPosAndRot: list[float], frameMode: int) -> list[float]:
-        """
-        计算Pos和Rot沿某坐标系有一定的位移和旋转角度后，所得到的位姿数据
-
-        Args:
-            poseCurrent (list[float]): 当前时刻位姿（欧拉角形式）
-            deltaPosAndRot (list[float]): 移动及旋转数组，位置移动（单位：m），旋转（单位：度）
-            frameMode (int): 坐标系模式选择 0:Work（work即可任意设置坐标系），1:Tool
-
-        Returns:
-            list[float]: 平移旋转后的位姿
-        """
-        po1 = rm_pose_t()
-        po1.position = rm_position_t(*poseCurrent[:3])
-        po1.euler = rm_euler_t(*poseCurrent[3:])
-
-        deltaPosAndRot = (c_float * 6)(*deltaPosAndRot)
-
-        pose = rm_algo_pose_move(
-            self.handle, po1, deltaPosAndRot, frameMode)
-        
-        position = pose.position
-        euler = pose.euler
-        pose_eul = [position.x, position.y,
-                    position.z, euler.rx, euler.ry, euler.rz]
-        return pose_eul
-
-    def rm_algo_set_dh(self, dh: rm_dh_t) -> None:
-        """
-        设置DH参数
-        Args:
-            dh (rm_dh_t): DH参数列表
-        """
-        rm_algo_set_dh(dh)
-
-    def rm_algo_get_dh(self) -> rm_dh_t:
-        """
-        获取DH参数
-        Returns:
-            list[float]: DH参数列表
-        """
-        dh = rm_algo_get_dh()
-        return dh.to_dict(self.dh_dof)
-
-    def rm_algo_universal_singularity_analyse(self, q:list[float], singluar_value_limit:float) -> int:
-        """
-        通过分析雅可比矩阵最小奇异值, 判断机器人是否处于奇异状态
-        Args:
-            -q 要判断的关节角度（机械零位描述），单位：°
-            -singluar_value_limit 最小奇异值阈值，若传NULL，则使用内部默认值，默认值为0.01（该值在0-1之间）
-        Returns:
-            int 
-             0:在当前阈值条件下正常
-             -1:表示在当前阈值条件下判断为奇异区
-             -2:表示计算失败
-        """
-        q_c = (c_float * 7)(*q)
-        # singluar_value_limit_c = (c_float * 6)(*singluar_value_limit)
-        ret = rm_algo_universal_singularity_analyse(q_c, singluar_value_limit)
-        return ret
-
-    def rm_algo_kin_singularity_thresholds_init(self)-> None:
-        """
-        恢复初始阈值(仅适用于解析法分析机器人奇异状态),阈值初始化为：limit_qe=10deg,limit_qw=10deg,limit_d = 0.05m 
-        """
-        rm_algo_kin_singularity_thresholds_init()        
-
-    def rm_algo_kin_set_singularity_thresholds(self,limit_qe:float,limit_qw:float, limit_d:float)-> None:
-        """
-        设置自定义阈值(仅适用于解析法分析机器人奇异状态)
-        Args:
-            limit_qe  肘部奇异区域范围设置(即J3接近0的范围,若为RML63，则是J3接近-9.68的范围),单位: °,default: 10°
-            limit_qw  腕部奇异区域范围设置(即J5接近0的范围),单位: °,default: 10°
-            limit_d 肩部奇异区域范围设置(即腕部中心点距离奇异平面的距离), 单位: m, default: 0.05
-        Returns:
-            None
-        """
-        rm_algo_kin_set_singularity_thresholds(limit_qe,limit_qw,limit_d)
-
-
-
-    def rm_algo_kin_get_singularity_thresholds(self)-> tuple[float,float,float]:
-        """
-        获取自定义阈值(仅适用于解析法分析机器人奇异状态)
-        Args:
-            None
-        Returns:
-            limit_qe  肘部奇异区域范围设置(即J3接近0的范围,若为RML63，则是J3接近-9.68的范围),单位: °,default: 10°
-            limit_qw  腕部奇异区域范围设置(即J5接近0的范围),单位: °,default: 10°
-            limit_d 肩部奇异区域范围设置(即腕部中心点距离奇异平面的距离), 单位: m, default: 0.05
-        """
-        limit_qe = c_float()
-        limit_qw = c_float()
-        limit_d = c_float()
-        rm_algo_kin_get_singularity_thresholds(byref(limit_qe),byref(limit_qw),byref(limit_d))
-        return limit_qe.value,limit_qw.value,limit_d.value
-
-
-
-    def rm_algo_kin_robot_singularity_analyse(self,q:list[float]) -> tuple[int,float]:
-        """
-        解析法判断机器人是否处于奇异位形（仅支持六自由度）
-        Args:
-            q:list[float] 要判断的关节角度,单位°
-        Returns:
-            tuple[int,float]: 包含两个元素的元组。
-            - int: 0:正常 -1:肩部奇异 -2:肘部奇异 -3:腕部奇异
-            - float: 返回腕部中心点到肩部奇异平面的距离，该值越接近0说明越接近肩部奇异,单位m
-        """      
-        q_c = (c_float * 6)(*q)
-        distance_c = c_float()
-        ret = rm_algo_kin_robot_singularity_analyse(q_c, byref(distance_c))
-        return ret, distance_c.value
-
-  
-    def rm_algo_set_tool_envelope(self, toolSphere_i:int, data:rm_tool_sphere_t) -> None:
-        """
-        设置工具包络球参数
-        Args:
-            toolSphere_i 工具包络球编号 (0~4)
-            data 工具包络球参数,注意其参数在末端法兰坐标系下描述
-        """
-        rm_algo_set_tool_envelope(toolSphere_i, data)
-
-
-    def rm_algo_get_tool_envelope(self, toolSphere_i:int) -> rm_tool_sphere_t:
-        """
-        获取工具包络球参数
-        Args:
-            toolSphere_i 工具rm_get_tool_voltage包络球编号 (0~4)
-        Returns:
-            (rm_tool_sphere_t) 工具包络球参数,注意其参数在末端法兰坐标系下描述
-        """
-        tool_sphere_type = rm_tool_sphere_t()
-        rm_algo_get_tool_envelope(toolSphere_i, byref(tool_sphere_type))
-        return tool_sphere_type
-        
-
-    def rm_algo_safety_robot_self_collision_detection(self,joint_deg:list[float]) -> int:
-        """
-        自碰撞检测
-        Args:
-            joint_deg(list[float]) 要判断的关节角度，单位°
-        Returns:
-            int 
-             -0: 无碰撞
-             1: 发生碰撞,超出关节限位将被认为发生碰撞
-        """
-        joint_deg_c = (c_float * 7)(*joint_deg)
-        ret = rm_algo_safety_robot_self_collision_detection(joint_deg_c)
-        return ret
-    
-
-    def rm_algo_ik_remote_init(self, dT: float, tool_or_work: int) -> None:
-        """
-        初始化遥操作运动学结构体
-
-        Args:
-            dT (float): 用户下发周期设置
-            tool_or_work (int): 0: 相对工具坐标系 1: 相对工作坐标系
-
-        Returns:
-            None
-        """
-        # 类型转换确保参数符合C接口要求
-        dT_c = c_float(dT)
-        tool_or_work_c = c_int(tool_or_work)
-        rm_algo_ik_remote_init(dT_c, tool_or_work_c)
-
-    def rm_algo_set_error_weight(self, weight: list[float]) -> None:
-        """
-        设置位姿误差权重
-
-        Args:
-            weight (list[float]): 长度为6的数组，对应末端位姿x,y,z,rx,ry,rz的权重，取值0~1
-                                  权重越大对应的位姿到达精确度越高
-
-        Returns:
-            None
-        """
-        # 校验数组长度，不足补0，超出截断
-        if len(weight) != 6:
-            weight = weight[:6] + [0.0] * (6 - len(weight))
-        weight_c = (c_float * 6)(*weight)
-        rm_algo_set_error_weight(weight_c)
-
-    def rm_algo_set_dq_weight(self, dq_weight: list[float]) -> None:
-        """
-        设置关节速度权重
-
-        Args:
-            dq_weight (list[float]): 长度为自由度个数的数组，为关节最大限速乘以权重，取值0~1
-                                     权重越大则跟踪效果越好
-
-        Returns:
-            None
-        """
-        # 转换为ctypes浮点数组（兼容6/7自由度）
-        dq_weight_c = (c_float * len(dq_weight))(*dq_weight)
-        rm_algo_set_dq_weight(dq_weight_c)
-
-    def rm_algo_enable_q3_tracker(self, is_open: int) -> None:
-        """
-        使能七轴机械臂肘部追踪功能
-
-        Args:
-            is_open (int): 1: OPEN TARCKER 0: CLOSE TRACKER
-
-        Returns:
-            None
-        """
-        is_open_c = c_int(is_open)
-        rm_algo_enable_q3_tracker(is_open_c)
-
-    def rm_algo_set_q3_tracker_velocity_level(self, level: float) -> None:
-        """
-        设置七轴机械臂肘部追踪等级
-
-        Args:
-            level (float): 追踪等级，取值0~1，等级越高，追踪速度越快
-
-        Returns:
-            None
-        """
-        # 限制取值范围在0~1之间
-        level_clamped = max(0.0, min(1.0, level))
-        level_c = c_float(level_clamped)
-        rm_algo_set_q3_tracker_velocity_level(level_c)
-
-    def rm_algo_set_enable_limit_holdon(self, enable: int) -> None:
-        """
-        设置限位保持功能接口
-
-        Args:
-            enable (int): 0: 关闭限位保持  1: 开启限位保持 若客户不调用此接口则默认为0即关闭限位保持功能, 当调用ik_remote_init时自动初始化为0
-
-        Returns:
-            None
-        """
-        enable_c = c_int(enable)
-        rm_algo_set_enable_limit_holdon(enable_c)
-
-    def rm_algo_set_7dof_q3_track_angle(self, obj_angle: float) -> int:
-        """
-        设置七轴机械臂肘部追踪下的关节3的追踪角度
-
-        Args:
-            obj_angle (float): 关节3的目标追踪角度
-
-        Returns:
-            int:
-                -2: angle is over joint_limit（角度超出关节限位）
-                 0: success（成功）
-        """
-        obj_angle_c = c_float(obj_angle)
-        ret = rm_algo_set_7dof_q3_track_angle(obj_angle_c)
-        return ret
-
-    def rm_algo_set_joint_limit_angle(self, dof_type: rm_dofType_e, joint: rm_jointType_e, 
-                                      limit: rm_limitType_e, angle: float) -> int:
-        """
-        统一的关节角度限位设置接口（新增算法限位判断）
-
-        Args:
-            dof_type (rm_dofType_e): 机械臂自由度类型 (DOF_TYPE_6 或 DOF_TYPE_7)
-            joint (rm_jointType_e): 要设置的关节 (JOINT_Q3 或 JOINT_Q4；七轴支持设置关节3和关节4，六轴仅支持关节3)
-            limit (rm_limitType_e): 限位类型 (LIMIT_MAX 或 LIMIT_MIN)
-            angle (float): 要设置的角度值
-
-        Returns:
-            int: 错误码
-                -1: 无效的参数 (自由度、关节、限位类型错误或指针为空)
-                -2: 设置的角度值超出硬件/系统限制
-                -3: 输入角度超出算法固有关节限位
-                 0: 成功
-        """
-        # 转换枚举值为整型，兼容C接口
-        dof_type_c = c_int(dof_type.value)
-        joint_c = c_int(joint.value)
-        limit_c = c_int(limit.value)
-        angle_c = c_float(angle)
-        
-        ret = rm_algo_set_joint_limit_angle(dof_type_c, joint_c, limit_c, angle_c)
-        return ret
-
-    def rm_algo_ik_remote(self, T06d: rm_Mat_t, q_in: list[float], q_out: POINTER(c_float)) -> int:
-        """
-        ik remote 正式的逆解函数（强制传4个参数版本）
-        
-        @attention 1.建议客户在仿真模式下先验证自己下发的数据是否有异常后再开启真机使用
-                   2.机械臂肘关节限位防护：禁止关节4（7轴）/关节3（6轴）完全打直为0，否则边界奇异易引发机械臂震荡、回移困难等异常；需通过限位设置接口或示教器安全配置设置非0软限位（限位值可在仿真模式下调试确定）
-                   3.机械臂关节软限位防护：功能自带关节软限位效果，但应避免运动至软限位；若到位姿下发后关节仍需向限位外转动以满足位姿要求，易引发机械臂震荡等异常
-        Args:
-            T06d (rm_Mat_t): 目标末端位姿矩阵
-            q_in (list[float]): 当前关节角度列表（长度匹配自由度）
-            q_out (POINTER(c_float)): 提前初始化的ctypes浮点数组（输出参数，接收求解结果）
-
-        Returns:
-            int: 状态码
-                -4: UNKNOW ROBOT TYPE（未知机器人类型）
-                -1: IK FAILED（逆解失败）
-                -2: IK LIMITED（逆解超出限位）
-                0: IK SUCCESSFUL（逆解成功）
-        """
-            # 1. 转换q_in为ctypes数组（匹配C的float*）
-        q_in_len = len(q_in)
-        q_in_c = (c_float * q_in_len)(*q_in)
-        
-        # 2. 调用底层C接口（严格匹配C的3个参数：T06d + q_in_c + q_out）
-        ret = rm_algo_ik_remote(T06d, q_in_c, q_out)  # q_out是外部传入的ctypes数组指针
-        return ret
-
- 
-
-class RoboticArm(ArmState, MovePlan, JointConfigSettings, JointConfigReader, ArmTipVelocityParameters,
-                 ToolCoordinateConfig, WorkCoordinateConfig, ArmTeachMove, ArmMotionControl, ControllerConfig,
-                 CommunicationConfig, ControllerIOConfig, EffectorIOConfig, GripperControl, Force, DragTeach, HandControl, ModbusConfig, InstallPos,
-                 ForcePositionControl, ProjectManagement, GlobalWaypointManage, ElectronicFenceConfig, SelfCollision,
-                 UdpConfig, Algo, LiftControl, ExpandControl, TrajectoryManage, ModbusV4, ActionV4):
-    """机械臂连接、断开、日志设置等操作
-    """
-
-    def __init__(self, mode: rm_thread_mode_e = None):
-        """初始化线程模式
-
-        Args:
-            mode (rm_thread_mode_e): 
-                    RM_SINGLE_MODE_E：单线程模式，单线程非阻塞等待数据返回；  
-                    RM_DUAL_MODE_E：双线程模式，增加接收线程监测队列中的数据；  
-                    RM_TRIPLE_MODE_E：三线程模式，在双线程模式基础上增加线程监测UDP接口数据；
-        """
-        if mode == None:
-            return
-        rm_init(mode)
-        print("current c api version: ", rm_api_version())
-
-    def rm_create_robot_arm(self, ip: str, port: int, level: int = 3, log_func: CFUNCTYPE = None) -> rm_robot_handle:
-        """
-        初始化RoboticArm类，创建机械臂连接控制句柄。
-
-        Args:
-            ip (str): 机械臂的IP地址。
-            port (int): 机械臂的端口号。
-            level (int, optional): 日志打印等级，默认为3。
-                - 0: debug模式
-                - 1: info模式
-                - 2: warning模式
-                - 3: error模式
-            log_func (CFUNCTYPE, optional): 自定义日志打印函数（当前Python版本API暂不支持）。默认为None。
-
-        Returns:
-            rm_robot_handle: 机械臂句柄，其中包含机械臂id标识。
-        """
-        if log_func is None:
-            rm_set_log_call_back(0, level)
-        else:
-            LOGCALLBACK = CFUNCTYPE(UNCHECKED(None), String, c_void_p)
-            log_func = LOGCALLBACK(log_func)
-            rm_set_log_call_back(log_func, level)
+        if log_func is None:
+            rm_set_log_call_back(0, level)
+        else:
+            LOGCALLBACK = CFUNCTYPE(UNCHECKED(None), String, c_void_p)
+            log_func = LOGCALLBACK(log_func)
+            rm_set_log_call_back(log_func, level)
 
         # rm_init(thread_mode)
         self.handle = rm_create_robot_arm(ip, port)
+        self._ip = ip
+        self._port = port
+        # 自由度可能变化，已分配的复用缓冲区失效
+        self._reuse_buffers = None
+        self._robot_info = None
         if self.handle.contents.id == -1:
             self.arm_dof = 0
             self.robot_controller_version = 4
         else:
             info = rm_robot_info_t()
             if rm_get_robot_info(self.handle, info) == 0:
+                self._robot_info = info.to_dictionary()
                 self.arm_dof = info.arm_dof
                 self.robot_controller_version = info.robot_controller_version
                 if(info.arm_model == rm_robot_arm_model_e.RM_MODEL_ZM7L_E or info.arm_model == rm_robot_arm_model_e.RM_MODEL_ZM7R_E or
@@ -6970,3 +6508,64 @@ class RoboticArm(ArmState, MovePlan, JointConfigSettings, JointConfigReader, Arm
             单线程无法使用该回调函数
         """
         rm_get_arm_event_call_back(event_callback)
+
+    def rm_add_arm_event_listener(self, listener: Callable[[rm_event_push_data_t], None]) -> None:
+        """添加本机械臂的事件监听函数
+        与rm_get_arm_event_call_back不同，监听函数仅接收handle_id与本机械臂句柄一致的事件，多个机械臂对象可同时添加，
+        由进程内唯一的事件路由器注册全局回调并按句柄id转发
+
+        Args:
+            listener (Callable[[rm_event_push_data_t], None]): 监听函数，在C库接收线程中调用，无需转换为rm_event_callback_ptr
+
+        Notes:
+            - 需在rm_create_robot_arm之后调用，单线程无法使用
+            - 路由器与rm_get_arm_event_call_back共用同一个全局回调，二者不能同时使用
+        """
+        arm_event_router.add_handle_listener(self.handle.contents.id, listener)
+
+    def rm_remove_arm_event_listener(self, listener: Callable[[rm_event_push_data_t], None]) -> None:
+        """移除本机械臂的事件监听函数
+
+        Args:
+            listener (Callable[[rm_event_push_data_t], None]): 已添加的监听函数
+        """
+        arm_event_router.remove_handle_listener(self.handle.contents.id, listener)
+
+    def rm_enable_instrumentation(self, instrumentation: ArmInstrumentation = None) -> ArmInstrumentation:
+        """开启接口调用统计
+        包装本机械臂对象的全部rm_*接口，按(句柄id, 接口名称)记录调用次数、状态码分布及耗时直方图，
+        未开启时接口不经过任何包装
+
+        Args:
+            instrumentation (ArmInstrumentation, optional): 统计对象，多个机械臂对象可共用同一个，为None时新建. Defaults to None.
+
+        Returns:
+            ArmInstrumentation: 正在使用的统计对象，可通过其snapshot获取统计数据、add_hook添加导出钩子
+
+        Notes:
+            已开启时再次调用会先关闭，再以新的统计对象开启
+        """
+        self.rm_disable_instrumentation()
+        instrumentation = instrumentation or ArmInstrumentation()
+
+        def handle_id():
+            try:
+                return self.handle.contents.id
+            except (AttributeError, ValueError):
+                return -1
+
+        excluded = ('rm_enable_instrumentation', 'rm_disable_instrumentation')
+        for name in dir(type(self)):
+            if name.startswith('rm_') and name not in excluded and callable(getattr(type(self), name)):
+                setattr(self, name, instrumentation.wrap(name, getattr(self, name), handle_id))
+        self._instrumentation = instrumentation
+        return instrumentation
+
+    def rm_disable_instrumentation(self) -> None:
+        """关闭接口调用统计，恢复未包装的接口，已记录的统计数据保留在统计对象中"""
+        if self._instrumentation is None:
+            return
+        for name in list(vars(self)):
+            if name.startswith('rm_'):
+                delattr(self, name)
+        self._instrumentation = None
@@ -0,0 +1,250 @@
+"""
+@brief 二进制轨迹文件
+
+@details
+示教轨迹通常以文本保存：角度透传示例使用每行一个轨迹点、逗号分隔的角度文本，rm_save_trajectory保存的文件
+每行为一个{"point":[...]}的JSON对象，角度单位为0.001°。长时间示教的轨迹文本可达数百MB，逐行解析耗时长且占用大量内存。
+此模块定义带版本号的二进制轨迹格式，并提供读写及转换函数：
+    - 固定64字节的文件头，记录格式版本、轨迹点数、自由度、周期、机械臂型号及包含的数据段
+    - 连续存放的float32关节角度矩阵，形状为(轨迹点数, 自由度)，单位：°
+    - 可选的float64时间戳（单位：s），以及float32夹爪、扩展关节数据段，每个数据段起始位置按64字节对齐
+load_trajectory通过np.memmap映射文件，打开时不读取数据，可直接传给CanfdStreamer.run发送。
+
+**注意**
+- 本模块依赖NumPy。
+- 文件中的数值均为小端字节序。
+"""
+
+import re
+import struct
+
+import numpy as np
+
+# 文件标识
+RM_TRAJECTORY_MAGIC = b'RMTRAJ\x00\x00'
+# 当前格式版本
+RM_TRAJECTORY_VERSION = 1
+# 文件头: 标识、版本、文件头长度、数据段标志、轨迹点数、自由度、保留、周期、机械臂型号
+_RM_TRAJECTORY_HEADER = struct.Struct('<8sHHIQHHd24s4x')
+# 数据段标志
+RM_TRAJECTORY_TIMESTAMPS = 0x1
+RM_TRAJECTORY_GRIPPER = 0x2
+RM_TRAJECTORY_EXPAND = 0x4
+# 数据段起始位置的对齐字节数
+_RM_TRAJECTORY_ALIGN = 64
+# 转换文本时每次读取的字节数
+_RM_TRAJECTORY_CHUNK = 1 << 22
+
+_SAVED_POINT = re.compile(r'"point"\s*:\s*\[([^\]]*)\]')
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _RM_TRAJECTORY_ALIGN) * _RM_TRAJECTORY_ALIGN
+
+
+def _layout(header_size: int, flags: int, count: int, dof: int) -> dict[str, tuple[int, np.dtype, tuple]]:
+    # 各数据段的(起始位置, 数据类型, 形状)，按关节角度、时间戳、夹爪、扩展关节的顺序依次存放
+    sections = {}
+    offset = _align(header_size)
+    for name, flag, dtype, shape in (('joints', None, np.dtype('<f4'), (count, dof)),
+                                     ('timestamps', RM_TRAJECTORY_TIMESTAMPS, np.dtype('<f8'), (count,)),
+                                     ('gripper', RM_TRAJECTORY_GRIPPER, np.dtype('<f4'), (count,)),
+                                     ('expand', RM_TRAJECTORY_EXPAND, np.dtype('<f4'), (count,))):
+        if flag is None or flags & flag:
+            sections[name] = (offset, dtype, shape)
+            offset = _align(offset + dtype.itemsize * int(np.prod(shape)))
+    return sections
+
+
+def _pack_header(flags: int, count: int, dof: int, period: float, arm_model: str) -> bytes:
+    model = arm_model.encode('utf-8')
+    if len(model) > 23:
+        raise ValueError("arm_model must not exceed 23 bytes")
+    return _RM_TRAJECTORY_HEADER.pack(RM_TRAJECTORY_MAGIC, RM_TRAJECTORY_VERSION, _RM_TRAJECTORY_HEADER.size,
+                                      flags, count, dof, 0, period, model)
+
+
+class TrajectoryFile:
+    """
+    已打开的二进制轨迹文件
+
+    **Attributes**:
+        - path (str): 文件路径
+        - version (int): 文件的格式版本
+        - dof (int): 自由度
+        - period (float): 轨迹点周期，单位：s
+        - arm_model (str): 机械臂型号，如'RM_65'，未记录时为空字符串
+        - joints (np.ndarray): 形状为(轨迹点数, 自由度)的float32关节角度，单位：°
+        - timestamps (np.ndarray): 每个轨迹点的float64时间戳，单位：s，文件中不包含时为None
+        - gripper (np.ndarray): 每个轨迹点的float32夹爪数据，文件中不包含时为None
+        - expand (np.ndarray): 每个轨迹点的float32扩展关节角度，单位：°，文件中不包含时为None
+    """
+
+    def __init__(self, path: str, version: int, dof: int, period: float, arm_model: str, joints: np.ndarray,
+                 timestamps: np.ndarray = None, gripper: np.ndarray = None, expand: np.ndarray = None):
+        self.path = path
+        self.version = version
+        self.dof = dof
+        self.period = period
+        self.arm_model = arm_model
+        self.joints = joints
+        self.timestamps = timestamps
+        self.gripper = gripper
+        self.expand = expand
+
+    def __len__(self) -> int:
+        return len(self.joints)
+
+    def times(self) -> np.ndarray:
+        """
+        获取每个轨迹点的时间
+
+        Returns:
+            np.ndarray: 文件中包含时间戳时为时间戳，否则为按周期计算的时间，单位：s
+        """
+        if self.timestamps is not None:
+            return self.timestamps
+        return np.arange(len(self.joints), dtype=np.float64) * self.period
+
+
+def save_trajectory(path: str, joints: np.ndarray, period: float = 0.01, arm_model: str = '',
+                    timestamps: np.ndarray = None, gripper: np.ndarray = None, expand: np.ndarray = None) -> None:
+    """
+    保存二进制轨迹文件
+
+    Args:
+        path (str): 文件路径
+        joints (np.ndarray): 形状为(轨迹点数, 自由度)的关节角度，单位：°，保存为float32
+        period (float, optional): 轨迹点周期，单位：s. Defaults to 0.01.
+        arm_model (str, optional): 机械臂型号，不超过23个字节. Defaults to ''.
+        timestamps (np.ndarray, optional): 长度为轨迹点数的时间戳，单位：s. Defaults to None.
+        gripper (np.ndarray, optional): 长度为轨迹点数的夹爪数据. Defaults to None.
+        expand (np.ndarray, optional): 长度为轨迹点数的扩展关节角度，单位：°. Defaults to None.
+    """
+    joints = np.asarray(joints, dtype='<f4')
+    if joints.ndim != 2 or not 1 <= joints.shape[1] <= 7:
+        raise ValueError("joints must have shape (N, dof) with 1 <= dof <= 7")
+    count, dof = joints.shape
+    channels = {'joints': joints}
+    flags = 0
+    for name, flag, dtype, values in (('timestamps', RM_TRAJECTORY_TIMESTAMPS, '<f8', timestamps),
+                                      ('gripper', RM_TRAJECTORY_GRIPPER, '<f4', gripper),
+                                      ('expand', RM_TRAJECTORY_EXPAND, '<f4', expand)):
+        if values is not None:
+            values = np.asarray(values, dtype=dtype)
+            if values.shape != (count,):
+                raise ValueError("%s must have shape (N,)" % name)
+            channels[name] = values
+            flags |= flag
+    with open(path, 'wb') as f:
+        f.write(_pack_header(flags, count, dof, period, arm_model))
+        for name, (offset, _, _) in _layout(_RM_TRAJECTORY_HEADER.size, flags, count, dof).items():
+            f.write(b'\x00' * (offset - f.tell()))
+            np.ascontiguousarray(channels[name]).tofile(f)
+
+
+def load_trajectory(path: str, mmap: bool = True) -> TrajectoryFile:
+    """
+    打开二进制轨迹文件
+
+    Args:
+        path (str): 文件路径
+        mmap (bool, optional): True-以只读np.memmap映射各数据段，False-一次性读入内存. Defaults to True.
+
+    Returns:
+        TrajectoryFile: 已打开的轨迹文件
+
+    Raises:
+        ValueError: 文件标识不正确、版本高于当前支持的版本或文件长度不足
+    """
+    with open(path, 'rb') as f:
+        header = f.read(_RM_TRAJECTORY_HEADER.size)
+        if len(header) < _RM_TRAJECTORY_HEADER.size or header[:8] != RM_TRAJECTORY_MAGIC:
+            raise ValueError("%s is not a trajectory file" % path)
+        magic, version, header_size, flags, count, dof, _, period, model = _RM_TRAJECTORY_HEADER.unpack(header)
+        if version > RM_TRAJECTORY_VERSION:
+            raise ValueError("unsupported trajectory file version %d" % version)
+        layout = _layout(header_size, flags, count, dof)
+        end = max(offset + dtype.itemsize * int(np.prod(shape)) for offset, dtype, shape in layout.values())
+        f.seek(0, 2)
+        if f.tell() < end:
+            raise ValueError("%s is truncated" % path)
+        channels = {}
+        for name, (offset, dtype, shape) in layout.items():
+            if mmap and count:
+                channels[name] = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape)
+            else:
+                f.seek(offset)
+                channels[name] = np.fromfile(f, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+    return TrajectoryFile(path, version, dof, period, model.rstrip(b'\x00').decode('utf-8'), **channels)
+
+
+def _convert(src: str, dst: str, period: float, arm_model: str, parse, scale: float) -> int:
+    count = 0
+    dof = None
+    with open(src, 'r') as fin, open(dst, 'wb') as fout:
+        fout.write(b'\x00' * _align(_RM_TRAJECTORY_HEADER.size))
+        rest = ''
+        while True:
+            chunk = fin.read(_RM_TRAJECTORY_CHUNK)
+            text = rest + chunk
+            if chunk:
+                # 仅处理完整的行，最后不完整的一行留到下次
+                cut = text.rfind('\n') + 1
+                text, rest = text[:cut], text[cut:]
+            else:
+                rest = ''
+            rows = parse(text)
+            if rows:
+                if dof is None:
+                    dof = rows[0].count(',') + 1
+                    if not 1 <= dof <= 7:
+                        raise ValueError("%s has %d values per point, expected 1~7" % (src, dof))
+                values = np.fromstring(','.join(rows), dtype=np.float64, sep=',')
+                if values.size != len(rows) * dof:
+                    raise ValueError("%s has points with different numbers of values" % src)
+                if scale != 1:
+                    values *= scale
+                values.astype('<f4').tofile(fout)
+                count += len(rows)
+            if not chunk:
+                break
+        if dof is None:
+            raise ValueError("no trajectory points found in %s" % src)
+        fout.seek(0)
+        fout.write(_pack_header(0, count, dof, period, arm_model))
+    return count
+
+
+def convert_text_trajectory(src: str, dst: str, period: float = 0.01, arm_model: str = '') -> int:
+    """
+    将逗号分隔的角度文本转换为二进制轨迹文件，每行为一个轨迹点的各关节角度，单位：°，分块读取，不将整个文本读入内存
+
+    Args:
+        src (str): 文本文件路径，如角度透传示例中的RM65&RM63_canfd_data.txt
+        dst (str): 二进制轨迹文件路径
+        period (float, optional): 轨迹点周期，单位：s. Defaults to 0.01.
+        arm_model (str, optional): 机械臂型号. Defaults to ''.
+
+    Returns:
+        int: 轨迹点数
+    """
+    return _convert(src, dst, period, arm_model,
+                    lambda text: [line for line in map(str.strip, text.split('\n')) if line], 1)
+
+
+def convert_saved_trajectory(src: str, dst: str, period: float = 0.01, arm_model: str = '') -> int:
+    """
+    将rm_save_trajectory保存的拖动示教轨迹转换为二进制轨迹文件，角度由0.001°转换为°，分块读取，不将整个文本读入内存
+
+    Args:
+        src (str): rm_save_trajectory保存的文件路径，每行为{"point":[...]}，不含point的行被忽略
+        dst (str): 二进制轨迹文件路径
+        period (float, optional): 轨迹点周期，单位：s，需与示教时的采样周期一致. Defaults to 0.01.
+        arm_model (str, optional): 机械臂型号. Defaults to ''.
+
+    Returns:
+        int: 轨迹点数
+    """
+    return _convert(src, dst, period, arm_model,
+                    lambda text: [point.replace(' ', '') for point in _SAVED_POINT.findall(text)], 0.001)
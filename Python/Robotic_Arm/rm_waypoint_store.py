@@ -0,0 +1,257 @@
+"""
+@brief 全局路点本地镜像
+
+@details
+规划程序会高频按名称查询全局路点，而每次rm_get_given_global_waypoint都是一次网络往返。
+此模块提供WaypointStore类，将控制器上的全局路点镜像到本地并建立索引：
+    - 按名称精确查询及按前缀查询
+    - 在关节空间及笛卡尔空间中查找最近的路点
+    - sync分页读取控制器上的路点列表，仅更新时间或数据发生变化的路点，并删除控制器上已不存在的路点
+由GlobalWaypointManage.rm_enable_waypoint_store启用后，rm_add_global_waypoint、rm_update_global_waypoint
+及rm_delete_global_waypoint成功后同步更新镜像。
+
+**注意**
+- 最近路点查询依赖NumPy。
+- 其他客户端或示教器对路点的修改需调用sync后才能反映到镜像中。
+- 查询返回的路点字典与镜像共享，请勿修改。
+"""
+
+import bisect
+import threading
+
+# 前缀查询时排在所有以该前缀开头的名称之后的字符
+_PREFIX_END = '\U0010ffff'
+
+
+class WaypointStore:
+    """
+    全局路点本地镜像
+    @details 路点以rm_waypoint_t.to_dict()的字典形式保存，包含point_name、joint、pose、work_frame、tool_frame及time，例如：
+
+        store = arm.rm_enable_waypoint_store()
+        point = store.get('pick')
+        names = store.prefix('place_')
+        nearest = store.nearest_joint(current_joint, k=3)
+
+    **Attributes**:
+        - arm (RoboticArm): 读取路点的机械臂对象
+    """
+
+    def __init__(self, arm):
+        """
+        Args:
+            arm (RoboticArm): 已连接的机械臂对象
+        """
+        self.arm = arm
+        self._lock = threading.RLock()
+        self._points = {}
+        self._names = []
+        # 最近路点查询使用的矩阵，路点变化后置为None，下次查询时重建
+        self._arrays = None
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._points
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._names))
+
+    def _put(self, point: dict[str, any]) -> bool:
+        name = point['point_name']
+        old = self._points.get(name)
+        if old == point:
+            return False
+        if old is None:
+            bisect.insort(self._names, name)
+        self._points[name] = point
+        self._arrays = None
+        return True
+
+    def _remove(self, name: str) -> bool:
+        if self._points.pop(name, None) is None:
+            return False
+        del self._names[bisect.bisect_left(self._names, name)]
+        self._arrays = None
+        return True
+
+    def sync(self, page_size: int = 50, prefetch: int = 2) -> dict[str, int]:
+        """
+        与控制器同步全部路点
+
+        Args:
+            page_size (int, optional): 每页大小，同rm_iter_global_waypoints. Defaults to 50.
+            prefetch (int, optional): 最多提前查询的页数，同rm_iter_global_waypoints. Defaults to 2.
+
+        Returns:
+            dict[str, int]: 包含以下键的字典
+                - 'added' (int): 新增的路点数
+                - 'updated' (int): 时间或数据发生变化的路点数
+                - 'removed' (int): 控制器上已不存在而被删除的路点数
+
+        Raises:
+            PageFetchError: 路点列表查询失败，镜像保持已同步的部分
+        """
+        added = updated = 0
+        seen = set()
+        for point in self.arm.rm_iter_global_waypoints('', page_size, prefetch):
+            name = point['point_name']
+            seen.add(name)
+            with self._lock:
+                old = self._points.get(name)
+                if old is not None and old['time'] == point['time'] and old == point:
+                    continue
+                self._put(point)
+            if old is None:
+                added += 1
+            else:
+                updated += 1
+        with self._lock:
+            stale = [name for name in self._points if name not in seen]
+            for name in stale:
+                self._remove(name)
+        return {'added': added, 'updated': updated, 'removed': len(stale)}
+
+    def refresh(self, name: str) -> int:
+        """
+        从控制器重新读取单个路点
+
+        Args:
+            name (str): 路点名称
+
+        Returns:
+            int: rm_get_given_global_waypoint的状态码，控制器返回失败（路点不存在）时从镜像中删除该路点
+        """
+        ret, point = self.arm.rm_get_given_global_waypoint(name)
+        with self._lock:
+            if ret == 0 and point['point_name'] == name:
+                self._put(point)
+            elif ret == 1:
+                self._remove(name)
+        return ret
+
+    def discard(self, name: str) -> None:
+        """
+        从镜像中删除路点，不修改控制器上的数据
+
+        Args:
+            name (str): 路点名称
+        """
+        with self._lock:
+            self._remove(name)
+
+    def clear(self) -> None:
+        """清空镜像，不修改控制器上的数据"""
+        with self._lock:
+            self._points = {}
+            self._names = []
+            self._arrays = None
+
+    def get(self, name: str) -> dict[str, any]:
+        """
+        按名称查询路点
+
+        Args:
+            name (str): 路点名称
+
+        Returns:
+            dict[str, any]: 路点字典，不存在时为None
+        """
+        return self._points.get(name)
+
+    def names(self) -> list[str]:
+        """
+        获取全部路点名称
+
+        Returns:
+            list[str]: 按名称排序的路点名称
+        """
+        with self._lock:
+            return list(self._names)
+
+    def prefix(self, prefix: str) -> list[dict[str, any]]:
+        """
+        按名称前缀查询路点
+
+        Args:
+            prefix (str): 名称前缀
+
+        Returns:
+            list[dict[str, any]]: 名称以prefix开头的路点字典，按名称排序
+        """
+        with self._lock:
+            names = self._names
+            begin = bisect.bisect_left(names, prefix)
+            end = bisect.bisect_left(names, prefix + _PREFIX_END, begin)
+            return [self._points[name] for name in names[begin:end]]
+
+    def _nearest_arrays(self):
+        import numpy as np
+
+        arrays = self._arrays
+        if arrays is None:
+            points = [self._points[name] for name in self._names]
+            joints = np.array([point['joint'] for point in points], dtype=np.float64).reshape(len(points), -1)
+            positions = np.array([point['pose'][:3] for point in points], dtype=np.float64).reshape(len(points), 3)
+            frames = np.array([point['work_frame'] for point in points], dtype=object)
+            arrays = self._arrays = (points, joints, positions, frames)
+        return arrays
+
+    @staticmethod
+    def _select(points, distances, mask, k):
+        import numpy as np
+
+        if mask is not None:
+            distances = np.where(mask, distances, np.inf)
+        count = min(k, int(np.count_nonzero(np.isfinite(distances))))
+        if count == 0:
+            return []
+        order = np.argpartition(distances, count - 1)[:count]
+        order = order[np.argsort(distances[order], kind='stable')]
+        return [(points[index], float(distances[index])) for index in order]
+
+    def nearest_joint(self, joint: list[float], k: int = 1) -> list[tuple[dict[str, any], float]]:
+        """
+        在关节空间中查找最近的路点
+
+        Args:
+            joint (list[float]): 关节角度，单位：°，按其长度比较路点的前若干个关节
+            k (int, optional): 返回的路点数. Defaults to 1.
+
+        Returns:
+            list[tuple[dict[str, any], float]]: 按距离从近到远排序的(路点字典, 关节角度的欧氏距离)
+        """
+        import numpy as np
+
+        with self._lock:
+            if not self._points:
+                return []
+            points, joints, _, _ = self._nearest_arrays()
+        query = np.asarray(joint, dtype=np.float64)
+        distances = np.linalg.norm(joints[:, :query.shape[0]] - query, axis=1)
+        return self._select(points, distances, None, k)
+
+    def nearest_pose(self, position: list[float], k: int = 1, work_frame: str = None) -> list[tuple[dict[str, any], float]]:
+        """
+        在笛卡尔空间中查找位置最近的路点
+
+        Args:
+            position (list[float]): 位置[x, y, z]，单位：m，也可传入位姿[x, y, z, rx, ry, rz]，仅比较位置
+            k (int, optional): 返回的路点数. Defaults to 1.
+            work_frame (str, optional): 仅查找该工作坐标系下的路点，为None时不区分坐标系. Defaults to None.
+
+        Returns:
+            list[tuple[dict[str, any], float]]: 按距离从近到远排序的(路点字典, 位置距离，单位：m)
+        """
+        import numpy as np
+
+        with self._lock:
+            if not self._points:
+                return []
+            points, _, positions, frames = self._nearest_arrays()
+        query = np.asarray(position[:3], dtype=np.float64)
+        distances = np.linalg.norm(positions - query, axis=1)
+        mask = None if work_frame is None else frames == work_frame
+        return self._select(points, distances, mask, k)